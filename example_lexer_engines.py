@@ -0,0 +1,72 @@
+from example_pascalabc_lexer import (SPECIFICATION, SKIP_KIND, ID_KIND, KEYWORD_KIND,
+                                     KEYWORDS, MULTITOKENS, CASE_SENSITIVE)
+from str_reader.str_reader import StrReader
+from lexer.lexer import Lexer
+from lexer.prog_lang_lexer import ProgLangLexer
+from time import perf_counter
+
+
+COUNT_REPEATS = 3               # count of runs of every benchmark, best time is printed
+
+
+def benchmark(lexer: Lexer)-> tuple:
+    """
+    Measure time of lexical analysis
+    :param lexer: lexer with data reader
+    :return: tuple of best time and tokens of analysis
+    """
+    best_time = None
+    for i in range(COUNT_REPEATS):
+        t0 = perf_counter()
+        tokens = [(lexer.kinds[token.kind], lexer.lexemes[token.kind][token.value])
+                  for token in lexer.tokens()]
+        t = perf_counter() - t0
+        best_time = t if best_time is None else min(best_time, t)
+    return best_time, tokens
+
+
+def compare_engines(name: str, create_lexer)-> None:
+    """
+    Compare engines of lexer and print times of analysis
+    :param name: name of benchmark
+    :param create_lexer: function creating lexer by engine
+    :return: None
+    """
+    times = {}
+    results = []
+    for engine in Lexer.ENGINES:
+        times[engine], tokens = benchmark(create_lexer(engine))
+        results.append(tokens)
+    print(f"{name}: tokens={len(results[0])}; " +
+          "; ".join(f"{engine}={times[engine]:.3f} sec" for engine in Lexer.ENGINES) +
+          f"; equal tokens={all(tokens == results[0] for tokens in results)}")
+
+
+if __name__ == "__main__":
+    with open("example_pascalabc_code.pas", encoding='utf-8-sig') as file:
+        code = file.read() * 50
+
+    compare_engines("PascalABC code",
+                    lambda engine: ProgLangLexer(data_reader=StrReader(code),
+                                                 specification=SPECIFICATION,
+                                                 skip_kind=SKIP_KIND,
+                                                 keyword_kind=KEYWORD_KIND,
+                                                 id_kind=ID_KIND,
+                                                 keywords=KEYWORDS,
+                                                 multitokens=MULTITOKENS,
+                                                 case_sensitive=CASE_SENSITIVE,
+                                                 engine=engine))
+
+    # every keyword is rule of specification, so re tries many alternatives,
+    # longer keywords are before shorter ones and every line is matched whole,
+    # so both engines give the same tokens
+    keywords = sorted(KEYWORDS, key=len, reverse=True)
+    specification = [('SPACE', r'\s+')] + \
+                    [(f'KEYWORD{i}', keyword) for i, keyword in enumerate(keywords)] + \
+                    [('ID', r'[_A-Za-z]\w*'), ('NUM', r'\d+')]
+    words = (" ".join(keywords + [f"x{i}" for i in range(len(keywords))]) + "\n") * 200
+    compare_engines("Keyword rules",
+                    lambda engine: Lexer(data_reader=StrReader(words),
+                                         size_read_data=len(words),
+                                         specification=specification,
+                                         engine=engine))
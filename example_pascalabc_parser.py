@@ -371,13 +371,12 @@ RULES = """
                     STR
         """
 TOKENS = ('ID', 'NUM', 'STR',)
-STAB_FILENAME = "example_pascalabc_stab.prstab"
+STAB_CACHE_DIR = "prstab_cache"
 
 
 if __name__ == "__main__":
     import argparse
     from time import time
-    import os
     from str_reader.file_reader import FileStrReader
     from lexer.prog_lang_lexer import ProgLangLexer, UnexceptedLexError
     from sparser.sparser import SParser, ParseSyntaxError
@@ -411,18 +410,14 @@ if __name__ == "__main__":
 
         parser = SParser(lexer=lexer)
         t0 = time()
-        if os.path.exists(STAB_FILENAME) and \
-                os.path.isfile(STAB_FILENAME):
-            parser.read_stab_from_file(STAB_FILENAME)
+        parser.tokens = TOKENS
+        parser.goal_nterm = GOAL_NTERM
+        parser.end_term = END_TERM
+        parser.empty_term = EMPTY_TERM
+        parser.parse_rules(RULES)
+        if parser.create_sparse_tab_cached(STAB_CACHE_DIR):
             print("sparse table readed")
         else:
-            parser.tokens = TOKENS
-            parser.goal_nterm = GOAL_NTERM
-            parser.end_term = END_TERM
-            parser.empty_term = EMPTY_TERM
-            parser.parse_rules(RULES)
-            parser.create_sparse_tab()
-            parser.write_stab_to_file(STAB_FILENAME)
             print("sparse table created")
         print("time for sparse table: ", time() - t0, " sec")
         print()
@@ -1,9 +1,8 @@
 from str_reader.str_reader import StrReader
 from lexer.prog_lang_lexer import ProgLangLexer, UnexceptedLexError
-from sparser.sparser import SParser, print_sparse_tab, ReadingSTabFileErr
+from sparser.sparser import SParser
 from time import time
 from work_with_syntax_tree import print_tokens_syntax_tree
-import os.path
 
 
 CASE_SENSITIVE = False
@@ -50,17 +49,12 @@ RULES = """
         """
 TOKENS = ('ID',)
 
-stab_filename = "example_simple_stab.prstab"
+stab_cache_dir = "prstab_cache"
 parser = SParser(lexer=lexer,
                  tokens=TOKENS,
                  goal_nterm=GOAL_NTERM,
                  end_term=END_TERM,
                  parsing_of_rules=RULES)
-if os.path.exists(stab_filename) and\
-   os.path.isfile(stab_filename):
-    parser.read_stab_from_file(stab_filename)
-else:
-    parser.create_sparse_tab()
-    parser.write_stab_to_file(stab_filename)
+parser.create_sparse_tab_cached(stab_cache_dir)
 node = parser.parse()
 print_tokens_syntax_tree(parser, lexer, node)
\ No newline at end of file
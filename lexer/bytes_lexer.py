@@ -0,0 +1,231 @@
+from .ilexer import Token, NoneDataReaderError
+from .prog_lang_lexer import ProgLangLexer, UnexceptedLexError
+from bisect import bisect_right
+import re
+
+
+class BytesLexer(ProgLangLexer):
+    """
+    BytesLexer is lexical analyzer of programming language for bytes analyzing.
+    Data reader must give bytes of data by buffer property, start position
+    of data by start property and encoding of bytes by encoding property,
+    for example MmapFileReader. Regular expressions of specification are encoded
+    by encoding of data reader and are matched directly with bytes of buffer,
+    so skipped lexemes aren't decoded at all and only lexemes
+    that are new for table of lexemes are decoded.
+    Encoding must be compatible with ASCII, and classes of non-ASCII chars
+    in regular expressions need single-byte encoding (for example cp1251),
+    otherwise ValueError is raised. Lexeme that can't be decoded,
+    for example part of multibyte char, raises UnexceptedLexError.
+    Start and end of tokens are offsets in bytes.
+    """
+    __buffer: object                            # bytes of analyzed data
+    __encoding: str                             # encoding of bytes of analyzed data
+    __raw_ids: dict                             # indexed tokens by kinds and bytes of lexemes
+    __offset: int                               # offset of current token in bytes
+    __line_starts: list                         # offsets of starts of lines found yet
+    __find_offset: int                          # offset from which newlines aren't found yet
+
+    def __init__(self, **kwargs):
+        self.__buffer = b""
+        self.__encoding = ""
+        self.__raw_ids = {}
+        self.__reset_position(0)
+        super().__init__(**kwargs)
+
+    def __reset_position(self, offset: int)-> None:
+        """
+        Reset position of current token to start of data
+        :param offset: offset of start of data
+        :return: None
+        """
+        self.__offset = offset
+        self.__line_starts = [offset]
+        self.__find_offset = offset
+
+    def position(self, offset: int)-> tuple:
+        """
+        Get position of offset in bytes data.
+        Starts of lines are found only up to requested offset,
+        column is number of chars from start of line.
+        :param offset: offset in bytes data, for example start of token
+        :return: tuple of number of line and number of column
+        """
+        data = self.__buffer
+        line_starts = self.__line_starts
+        while self.__find_offset < offset:                  # find starts of lines up to offset
+            newline = data.find(b'\n', self.__find_offset, offset)
+            if newline == -1:
+                self.__find_offset = offset
+            else:
+                self.__find_offset = newline + 1
+                line_starts.append(newline + 1)
+        num_line = bisect_right(line_starts, offset)
+        line_start = line_starts[num_line - 1]
+        return num_line, len(data[line_start: offset].decode(self.__encoding, 'replace')) + 1
+
+    @property
+    def num_line(self):
+        """
+        Get number of line of current token.
+        Line is calculated only at request.
+        :return: number of line
+        """
+        return self.position(self.__offset)[0]
+
+    @property
+    def num_column(self):
+        """
+        Get number of column of current token.
+        Column is calculated only at request.
+        :return: number of column
+        """
+        return self.position(self.__offset)[1]
+
+    def clear_lexemes(self)-> None:
+        """
+        Clear tables of kinds and lexemes
+        :return: None
+        """
+        super().clear_lexemes()
+        self.__raw_ids.clear()
+
+    def tokens(self):
+        """
+        Peforms search lexemes in bytes data
+        :return: tokenized parts of data i.e. tokens,
+                 where kind is index in table of kinds,
+                 and kind and value is indexes in table of lexemes
+        """
+        if not self.keep_lexemes:
+            self.clear_lexemes()
+        for token in self._tokens():
+            yield self.new_span_token(token)        # return indexed token
+
+    def new_span_token(self, token: Token)-> Token:
+        """
+        Create new indexed token by token with span of lexeme.
+        Lexeme is decoded only if its bytes aren't met yet.
+        :param token: token with span, Token(kind, (offset, length))
+        :return: indexed token, Token(kind_id, value_id, start, end)
+        :raise: UnexceptedLexError
+        """
+        offset, length = token.value
+        raw = self.__buffer[offset: offset + length]
+        raw_ids = self.__raw_ids.get(token.kind, None)
+        if raw_ids is None:
+            raw_ids = self.__raw_ids[token.kind] = {}
+        id_token = raw_ids.get(raw, None)
+        if id_token is None:
+            kind = token.kind
+            try:
+                value = raw.decode(self.__encoding)
+            except UnicodeDecodeError as err:             # lexeme splits multibyte char
+                self.__offset = offset
+                data = raw[err.start: err.end]
+                num_line, num_column = self.position(offset + err.start)
+                msg = f"Undecodable bytes {data!r} of lexeme of kind '{kind}'" + \
+                      f" in line {num_line} in column {num_column}!!!"
+                raise UnexceptedLexError(data, num_line, num_column, msg) from None
+            if kind == self.id_kind:
+                value, is_keyword = self._fold_identifier(value)
+                if is_keyword:                                  # token is identifier or keyword?
+                    kind = self.keyword_kind
+            id_token = self.new_id_token(Token(kind, value))
+            raw_ids[raw] = id_token
+        return Token(id_token.kind, id_token.value, offset, offset + length)
+
+    @staticmethod
+    def _multibyte_class_char(regex: str, encoding: str):
+        """
+        Find char of class of regular expression that is encoded by several bytes.
+        Such class is matched with single bytes of encoded chars.
+        :param regex: regular expression
+        :param encoding: encoding of bytes of data
+        :return: char or None
+        """
+        in_class = False                        # pos is in class [...]?
+        first = 0                               # pos of first char of class
+        pos = 0
+        while pos < len(regex):
+            char = regex[pos]
+            if char == '\\' and pos + 1 < len(regex):     # escaped char
+                pos += 1
+                char = regex[pos]
+            elif in_class:
+                if char == ']' and pos > first:
+                    in_class = False
+                    char = ''
+            elif char == '[':
+                in_class = True
+                first = pos + 2 if regex.startswith('^', pos + 1) else pos + 1
+            if in_class and len(char.encode(encoding, 'replace')) > 1:
+                return char
+            pos += 1
+        return None
+
+    def _tokens(self):
+        """
+        Peforms search lexemes in bytes data
+        :return: tokens with spans of lexemes, Token(kind, (offset, length))
+        :raises: NoneDataReaderError, UnexceptedLexError, ValueError
+        """
+        reader = self.data_reader
+        if reader is None:                                          # checks data reader
+            raise NoneDataReaderError("Data reader is None!!!")
+        encoding = reader.encoding
+        if '\n'.encode(encoding) != b'\n':
+            raise ValueError(f"Encoding '{encoding}' is not compatible with ASCII!!!")
+        data = reader.buffer
+        self.__buffer = data
+        self.__encoding = encoding
+        self.__reset_position(reader.start)
+        if len(data) <= reader.start or len(self.specification) == 0:
+            return
+
+        for kind, regex in self.specification:
+            char = self._multibyte_class_char(regex, encoding)
+            if char is not None:
+                raise ValueError(f"Char '{char}' of class of rule '{kind}' is encoded by" +
+                                 f" several bytes in encoding '{encoding}'," +
+                                 " single-byte encoding is needed!!!")
+        try:
+            # compile specification in regex of bytes
+            token_regex = re.compile("|".join("(?P<%s>%s)" % rule
+                                              for rule in self.specification).encode(encoding))
+            end_lexemes = {kind: end_lexeme.encode(encoding)
+                           for kind, end_lexeme in self._end_lexemes().items()}
+        except UnicodeEncodeError as err:
+            raise ValueError(f"Specification can't be encoded in encoding '{encoding}'!!!") from err
+        id_kind = self.id_kind
+        skip_kind = self.skip_kind
+
+        pos = reader.start                      # current pos in data
+        size = len(data)
+        endpos = pos                            # pos after end of current line
+        while pos < size:
+            if pos >= endpos:                                       # lexemes don't straddle lines
+                endpos = data.find(b'\n', pos) + 1
+                if endpos == 0:                                     # last line of data
+                    endpos = size
+            mtch = token_regex.match(data, pos, endpos)             # find matches of lexeme
+            if mtch is None:
+                break
+            kind = mtch.lastgroup
+            end = mtch.end()
+            if kind in end_lexemes:                                 # token is multitoken?
+                end_lexeme = end_lexemes[kind]                      # it can consist of some lines
+                end = data.find(end_lexeme, end)                    # find end of multitoken
+                end = size if end == -1 else end + len(end_lexeme)
+            if kind == id_kind or skip_kind not in kind:
+                self.__offset = pos
+                yield Token(kind, (pos, end - pos))                 # return token
+            pos = end
+
+        if pos < size:
+            self.__offset = pos
+            char = data[pos: pos + 4].decode(encoding, 'replace')[:1]
+            num_line, num_column = self.position(pos)
+            msg = f"Unexcepted character '{char}'" + \
+                  f" in line {num_line} in column {num_column}!!!"
+            raise UnexceptedLexError(char, num_line, num_column, msg)
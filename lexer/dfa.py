@@ -0,0 +1,568 @@
+from array import array
+from bisect import bisect_right
+import re
+
+
+MAX_CHAR = 0x10FFFF                     # max code of char
+MAX_REPEAT = 1000                       # max count of repeats in {m,n}
+
+# ranges of codes of chars of escapes of classes
+DIGIT_RANGES = ((0x30, 0x39),)
+SPACE_RANGES = ((0x09, 0x0D), (0x20, 0x20))
+WORD_RANGES = ((0x30, 0x39), (0x41, 0x5A), (0x5F, 0x5F), (0x61, 0x7A))
+CLASS_ESCAPES = {'d': DIGIT_RANGES, 's': SPACE_RANGES, 'w': WORD_RANGES}
+CHAR_ESCAPES = {'t': '\t', 'n': '\n', 'r': '\r', 'f': '\f', 'v': '\v', 'a': '\a', '0': '\0'}
+
+
+def normalize_ranges(ranges)-> tuple:
+    """
+    Sort and merge ranges of codes of chars
+    :param ranges: iterable of ranges (first, last)
+    :return: tuple of sorted disjoint ranges
+    """
+    result = []
+    for first, last in sorted(ranges):
+        if len(result) > 0 and first <= result[-1][1] + 1:
+            if last > result[-1][1]:
+                result[-1] = (result[-1][0], last)
+        else:
+            result.append((first, last))
+    return tuple(result)
+
+
+def invert_ranges(ranges)-> tuple:
+    """
+    Get ranges of codes of chars that aren't in ranges
+    :param ranges: ranges of codes of chars
+    :return: tuple of sorted disjoint ranges
+    """
+    result = []
+    first = 0
+    for lo, hi in normalize_ranges(ranges):
+        if lo > first:
+            result.append((first, lo - 1))
+        first = hi + 1
+    if first <= MAX_CHAR:
+        result.append((first, MAX_CHAR))
+    return tuple(result)
+
+
+class RegexParser:
+    """
+    RegexParser is parser of subset of syntax of regular expressions.
+    Supported: chars, escapes of chars, classes [...] and [^...],
+    escapes of classes \\d \\s \\w \\D \\S \\W (ASCII meaning), any char '.'
+    (except newline), groups (...) and (?:...), alternatives '|'
+    and greedy quantifiers '*', '+', '?', {m}, {m,}, {m,n}.
+    Result is tree of tuples:
+        ('set', ranges), ('cat', nodes), ('alt', nodes), ('rep', node, min, max).
+    """
+    __pattern: str                  # parsed regular expression
+    __pos: int                      # current position in pattern
+
+    def __init__(self, pattern: str):
+        self.__pattern = pattern
+        self.__pos = 0
+
+    def parse(self)-> tuple:
+        """
+        Parse regular expression
+        :return: tree of regular expression
+        :raise: ValueError
+        """
+        self.__pos = 0
+        node = self.__parse_alt()
+        if self.__pos < len(self.__pattern):
+            self.__error(f"unexcepted '{self.__pattern[self.__pos]}'")
+        return node
+
+    def __error(self, msg: str)-> None:
+        raise ValueError(f"Regular expression '{self.__pattern}' isn't supported: " +
+                         f"{msg} in position {self.__pos}!!!")
+
+    def __peek(self)-> str:
+        return self.__pattern[self.__pos] if self.__pos < len(self.__pattern) else ""
+
+    def __parse_alt(self)-> tuple:
+        nodes = [self.__parse_cat()]
+        while self.__peek() == '|':
+            self.__pos += 1
+            nodes.append(self.__parse_cat())
+        return nodes[0] if len(nodes) == 1 else ('alt', tuple(nodes))
+
+    def __parse_cat(self)-> tuple:
+        nodes = []
+        while self.__peek() not in ('', '|', ')'):
+            nodes.append(self.__parse_repeat())
+        return nodes[0] if len(nodes) == 1 else ('cat', tuple(nodes))
+
+    def __parse_repeat(self)-> tuple:
+        node = self.__parse_atom()
+        while True:
+            char = self.__peek()
+            if char in ('*', '+', '?'):
+                self.__pos += 1
+                bounds = {'*': (0, None), '+': (1, None), '?': (0, 1)}[char]
+            elif char == '{':
+                mtch = re.compile(r'\{(\d+)(,(\d*))?\}').match(self.__pattern, self.__pos)
+                if mtch is None:            # '{' is char
+                    return node
+                self.__pos = mtch.end()
+                first = int(mtch.group(1))
+                if mtch.group(2) is None:
+                    last = first
+                else:
+                    last = None if len(mtch.group(3)) == 0 else int(mtch.group(3))
+                if (last is not None and last < first) or max(first, last or 0) > MAX_REPEAT:
+                    self.__error("uncorrect count of repeats")
+                bounds = (first, last)
+            else:
+                return node
+            if self.__peek() in ('?', '+'):
+                self.__error("lazy and possessive quantifiers")
+            node = ('rep', node, bounds[0], bounds[1])
+
+    def __parse_atom(self)-> tuple:
+        char = self.__peek()
+        if char == '(':
+            self.__pos += 1
+            if self.__pattern.startswith('?:', self.__pos):
+                self.__pos += 2
+            elif self.__peek() == '?':
+                self.__error("extensions of groups")
+            node = self.__parse_alt()
+            if self.__peek() != ')':
+                self.__error("missing ')'")
+            self.__pos += 1
+            return node
+        elif char == '[':
+            return ('set', self.__parse_class())
+        elif char == '.':
+            self.__pos += 1
+            return ('set', invert_ranges(((0x0A, 0x0A),)))
+        elif char == '\\':
+            ranges = self.__parse_escape()
+            return ('set', ranges)
+        elif char in ('*', '+', '?'):
+            self.__error("nothing to repeat")
+        elif char in ('^', '$'):
+            self.__error("anchors")
+        self.__pos += 1
+        return ('set', ((ord(char), ord(char)),))
+
+    def __parse_escape(self)-> tuple:
+        """
+        Parse escape after backslash
+        :return: ranges of codes of chars
+        """
+        self.__pos += 1
+        char = self.__peek()
+        if char == '':
+            self.__error("bad escape")
+        self.__pos += 1
+        if char.lower() in CLASS_ESCAPES:
+            ranges = CLASS_ESCAPES[char.lower()]
+            return normalize_ranges(ranges) if char.islower() else invert_ranges(ranges)
+        elif char in CHAR_ESCAPES:
+            code = ord(CHAR_ESCAPES[char])
+        elif char in ('x', 'u', 'U'):
+            size = {'x': 2, 'u': 4, 'U': 8}[char]
+            digits = self.__pattern[self.__pos: self.__pos + size]
+            if len(digits) != size or re.fullmatch(r'[0-9A-Fa-f]+', digits) is None:
+                self.__error("bad escape")
+            self.__pos += size
+            code = int(digits, 16)
+        elif char.isalnum():
+            self.__error(f"escape '\\{char}'")
+        else:
+            code = ord(char)
+        return ((code, code),)
+
+    def __parse_class(self)-> tuple:
+        """
+        Parse class of chars [...]
+        :return: ranges of codes of chars
+        """
+        self.__pos += 1
+        negative = self.__peek() == '^'
+        if negative:
+            self.__pos += 1
+        ranges = []
+        first_item = True
+        while True:
+            char = self.__peek()
+            if char == '':
+                self.__error("missing ']'")
+            elif char == ']' and not first_item:
+                self.__pos += 1
+                break
+            first_item = False
+            if char == '\\':
+                item = self.__parse_escape()
+            else:
+                self.__pos += 1
+                item = ((ord(char), ord(char)),)
+            if (len(item) == 1 and item[0][0] == item[0][1] and self.__peek() == '-'
+                    and self.__pos + 1 < len(self.__pattern) and self.__pattern[self.__pos + 1] != ']'):
+                self.__pos += 1                     # range of chars
+                if self.__peek() == '\\':
+                    last = self.__parse_escape()
+                else:
+                    self.__pos += 1
+                    last = ((ord(self.__pattern[self.__pos - 1]),) * 2,)
+                if len(last) != 1 or last[0][0] != last[0][1] or last[0][0] < item[0][0]:
+                    self.__error("bad range of chars")
+                item = ((item[0][0], last[0][0]),)
+            ranges.extend(item)
+        return invert_ranges(ranges) if negative else normalize_ranges(ranges)
+
+
+class NFA:
+    """
+    NFA is nondeterministic finite automaton
+    built by regular expressions of rules
+    """
+    moves: list                     # transitions by chars: [[(ranges, state), ...], ...]
+    epsilons: list                  # transitions without chars: [[state, ...], ...]
+    accepts: dict                   # indices of rules by accepting states
+    start: int                      # start state
+
+    def __init__(self, patterns: tuple):
+        self.moves = []
+        self.epsilons = []
+        self.accepts = {}
+        self.start = self.new_state()
+        for irule, pattern in enumerate(patterns):
+            start, end = self.new_state(), self.new_state()
+            self.epsilons[self.start].append(start)
+            self.build(RegexParser(pattern).parse(), start, end)
+            self.accepts[end] = irule
+
+    def new_state(self)-> int:
+        """
+        Create new state
+        :return: index of state
+        """
+        self.moves.append([])
+        self.epsilons.append([])
+        return len(self.moves) - 1
+
+    def build(self, node: tuple, start: int, end: int)-> None:
+        """
+        Build transitions of tree of regular expression
+        from start state to end state
+        :param node: tree of regular expression
+        :param start: start state
+        :param end: end state
+        :return: None
+        """
+        if node[0] == 'set':
+            self.moves[start].append((node[1], end))
+        elif node[0] == 'cat':
+            for child in node[1][:-1]:
+                state = self.new_state()
+                self.build(child, start, state)
+                start = state
+            self.build(node[1][-1], start, end)
+        elif node[0] == 'alt':
+            for child in node[1]:
+                child_start, child_end = self.new_state(), self.new_state()
+                self.epsilons[start].append(child_start)
+                self.build(child, child_start, child_end)
+                self.epsilons[child_end].append(end)
+        else:
+            child, first, last = node[1:]
+            for i in range(first):                          # required repeats
+                state = self.new_state()
+                self.build(child, start, state)
+                start = state
+            if last is None:                                # any count of repeats
+                loop_start, loop_end = self.new_state(), self.new_state()
+                self.epsilons[start].append(loop_start)
+                self.build(child, loop_start, loop_end)
+                self.epsilons[loop_end].append(loop_start)
+                self.epsilons[loop_start].append(end)
+            else:
+                for i in range(last - first):               # optional repeats
+                    state = self.new_state()
+                    self.epsilons[start].append(end)
+                    self.build(child, start, state)
+                    start = state
+                self.epsilons[start].append(end)
+
+    def closure(self, states)-> frozenset:
+        """
+        Get epsilon closure of states
+        :param states: states
+        :return: set of states
+        """
+        result = set(states)
+        stack = list(result)
+        while len(stack) > 0:
+            for state in self.epsilons[stack.pop()]:
+                if state not in result:
+                    result.add(state)
+                    stack.append(state)
+        return frozenset(result)
+
+
+class DFAMatch:
+    """
+    DFAMatch is result of matching of DFA.
+    It has interface of match object of module re used by Lexer.
+    """
+    __slots__ = ('string', '__start', '__end', 'lastgroup')
+    string: str                     # matched string
+    __start: int                    # start of match
+    __end: int                      # end of match
+    lastgroup: str                  # name of matched rule
+    def __init__(self, string: str, start: int, end: int, lastgroup: str):
+        self.string = string
+        self.__start = start
+        self.__end = end
+        self.lastgroup = lastgroup
+
+    def start(self)-> int:
+        return self.__start
+
+    def end(self)-> int:
+        return self.__end
+
+    def span(self)-> tuple:
+        return self.__start, self.__end
+
+    def group(self)-> str:
+        return self.string[self.__start: self.__end]
+
+
+class CharClasses(dict):
+    """
+    CharClasses is dict of classes of chars by chars.
+    Class of char that isn't in dict is found by bisect
+    among bounds of intervals of codes of chars and stored in dict.
+    """
+    __bounds: list                  # first codes of intervals of chars
+    __classes: list                 # classes of intervals of chars
+
+    def __init__(self, bounds: list, classes: list):
+        super().__init__()
+        self.__bounds = bounds
+        self.__classes = classes
+        for code in range(128):                             # classes of ASCII chars
+            self[chr(code)] = self[chr(code)]
+
+    def __missing__(self, char: str)-> int:
+        cls = self.__classes[bisect_right(self.__bounds, ord(char)) - 1]
+        self[char] = cls
+        return cls
+
+
+class DFA:
+    """
+    DFA is minimized deterministic finite automaton of lexical specification.
+    It matches longest lexeme among rules of specification,
+    if some rules match lexeme of the same length, then first rule is chosen.
+    Tables of DFA are arrays:
+        transitions - next states by states and classes of chars (-1 is no state),
+        accepts - indices of rules by states (-1 for not accepting states).
+    Start state is 0.
+    """
+    __names: tuple                  # names of rules
+    __count_classes: int            # count of classes of chars
+    __transitions: array            # next states, index is state * count_classes + class
+    __rows: list                    # rows of transitions by states
+    __accepts: array                # indices of rules by states
+    __char_classes: CharClasses     # classes of chars
+    __runs: list                    # functions of matching of chars of loops of states
+
+    def __init__(self, specification: tuple):
+        """
+        Compile lexical specification in DFA
+        :param specification: tuple of rules (name, regex)
+        :raise: ValueError
+        """
+        self.__names = tuple(name for name, regex in specification)
+        nfa = NFA(tuple(regex for name, regex in specification))
+        bounds = self.__char_bounds(nfa)
+        transitions, accepts = self.__build(nfa, bounds)
+        transitions, accepts = self.__minimize(transitions, accepts)
+        self.__compress(transitions, accepts, bounds)
+
+    @property
+    def names(self)-> tuple:
+        return self.__names
+
+    @property
+    def count_states(self)-> int:
+        return len(self.__accepts)
+
+    @property
+    def count_classes(self)-> int:
+        return self.__count_classes
+
+    @property
+    def transitions(self)-> array:
+        return self.__transitions
+
+    @property
+    def accepts(self)-> array:
+        return self.__accepts
+
+    @staticmethod
+    def __char_bounds(nfa: NFA)-> list:
+        """
+        Split codes of chars in intervals, every set of chars of NFA
+        is union of intervals
+        :param nfa: NFA
+        :return: sorted first codes of intervals
+        """
+        bounds = {0}
+        for moves in nfa.moves:
+            for ranges, state in moves:
+                for first, last in ranges:
+                    bounds.add(first)
+                    if last < MAX_CHAR:
+                        bounds.add(last + 1)
+        return sorted(bounds)
+
+    @staticmethod
+    def __build(nfa: NFA, bounds: list)-> tuple:
+        """
+        Build DFA by NFA by subset construction
+        :param nfa: NFA
+        :param bounds: first codes of intervals of chars
+        :return: tuple of transitions by states and intervals and accepts by states
+        """
+        moves = []                                          # transitions by intervals of NFA
+        for state_moves in nfa.moves:
+            moves.append([])
+            for ranges, state in state_moves:
+                intervals = []
+                for first, last in ranges:
+                    intervals.extend(range(bisect_right(bounds, first) - 1,
+                                           bisect_right(bounds, last)))
+                moves[-1].append((intervals, state))
+        start = nfa.closure((nfa.start,))
+        dstates = {start: 0}
+        queue = [start]
+        transitions, accepts = [], []
+        for dstate in queue:
+            rules = [nfa.accepts[state] for state in dstate if state in nfa.accepts]
+            accepts.append(min(rules) if len(rules) > 0 else -1)
+            targets = {}                                    # NFA states by intervals
+            for state in dstate:
+                for intervals, target in moves[state]:
+                    for interval in intervals:
+                        targets.setdefault(interval, set()).add(target)
+            row = [-1] * len(bounds)
+            for interval, states in targets.items():
+                target = nfa.closure(states)
+                if target not in dstates:
+                    dstates[target] = len(queue)
+                    queue.append(target)
+                row[interval] = dstates[target]
+            transitions.append(row)
+        return transitions, accepts
+
+    @staticmethod
+    def __minimize(transitions: list, accepts: list)-> tuple:
+        """
+        Minimize DFA by refinement of partition of states
+        :param transitions: transitions by states and intervals
+        :param accepts: accepts by states
+        :return: tuple of transitions and accepts of minimized DFA
+        """
+        blocks = accepts                                    # initial partition by rules
+        count_blocks = -1
+        while True:
+            signatures = {}
+            new_blocks = []
+            for state, row in enumerate(transitions):
+                signature = (blocks[state], tuple(-1 if target < 0 else blocks[target] for target in row))
+                new_blocks.append(signatures.setdefault(signature, len(signatures)))
+            blocks = new_blocks
+            if len(signatures) == count_blocks:
+                break
+            count_blocks = len(signatures)
+        order = {}                                          # blocks in order of states, start is 0
+        for block in blocks:
+            order.setdefault(block, len(order))
+        min_transitions = [None] * len(order)
+        min_accepts = [-1] * len(order)
+        for state, row in enumerate(transitions):
+            block = order[blocks[state]]
+            if min_transitions[block] is None:
+                min_transitions[block] = [-1 if target < 0 else order[blocks[target]] for target in row]
+                min_accepts[block] = accepts[state]
+        return min_transitions, min_accepts
+
+    def __compress(self, transitions: list, accepts: list, bounds: list)-> None:
+        """
+        Merge intervals of chars with equal transitions in classes
+        and create tables of DFA
+        :param transitions: transitions by states and intervals
+        :param accepts: accepts by states
+        :param bounds: first codes of intervals of chars
+        :return: None
+        """
+        columns = {}
+        classes = []                                        # classes by intervals
+        for interval in range(len(bounds)):
+            column = tuple(row[interval] for row in transitions)
+            classes.append(columns.setdefault(column, len(columns)))
+        count_classes = len(columns)
+        table = array('i', [-1]) * (len(transitions) * count_classes)
+        for column, cls in columns.items():
+            for state, target in enumerate(column):
+                table[state * count_classes + cls] = target
+        self.__count_classes = count_classes
+        self.__transitions = table
+        self.__rows = [table[state * count_classes: (state + 1) * count_classes]
+                       for state in range(len(transitions))]
+        self.__accepts = array('i', accepts)
+        self.__char_classes = CharClasses(bounds, classes)
+        self.__runs = []
+        for state in range(len(transitions)):               # chars of loops, they don't change state
+            ranges = []
+            for interval, cls in enumerate(classes):
+                if table[state * count_classes + cls] == state:
+                    last = bounds[interval + 1] - 1 if interval + 1 < len(bounds) else MAX_CHAR
+                    ranges.append((bounds[interval], last))
+            if len(ranges) > 0:
+                pattern = "".join("\\U%08x-\\U%08x" % rng for rng in normalize_ranges(ranges))
+                self.__runs.append(re.compile("[%s]*" % pattern).match)
+            else:
+                self.__runs.append(None)
+
+    def match(self, string: str, pos = 0, endpos = None)-> DFAMatch:
+        """
+        Match longest lexeme in string from position
+        :param string: string
+        :param pos: start position
+        :param endpos: end position (not included)
+        :return: match or None if lexeme isn't found
+        """
+        if endpos is None or endpos > len(string):
+            endpos = len(string)
+        rows = self.__rows
+        accepts = self.__accepts
+        char_classes = self.__char_classes
+        runs = self.__runs
+        state = 0
+        rule = accepts[0]
+        end = pos if rule >= 0 else -1                      # end of longest lexeme
+        i = pos
+        while i < endpos:
+            prev_state = state
+            state = rows[state][char_classes[string[i]]]
+            if state < 0:
+                break
+            i += 1
+            if state == prev_state:                         # skip rest of chars of loop of state
+                i = runs[state](string, i, endpos).end()
+            if accepts[state] >= 0:
+                rule = accepts[state]
+                end = i
+        if end < 0:
+            return None
+        return DFAMatch(string, pos, end, self.__names[rule])
@@ -6,11 +6,16 @@ class Token:
     """
     Token is class for tokenization of data
     """
+    __slots__ = ('kind', 'value', 'start', 'end')
     kind: object        # token kind
     value: object       # token value
-    def __init__(self, kind = None, value = None):
+    start: int          # offset of start of lexeme in data or None
+    end: int            # offset of end of lexeme in data or None
+    def __init__(self, kind = None, value = None, start = None, end = None):
         self.kind = kind
         self.value = value
+        self.start = start
+        self.end = end
 
     def __str__(self)-> str:
         return f"Token(kind='{self.kind}'; value='{self.value}')"
@@ -23,6 +28,9 @@ class ILexer(abc.ABC):
     """
     ILexer is interface of lexical analyzer for strings analyzing
     """
+    __lexemes_generation = 0            # generation of identifiers of kinds and lexemes
+    __lexeme_ids = None                 # default table of identifiers of lexemes
+
     @property
     @abc.abstractmethod
     def kind_ids(self)-> dict:
@@ -55,6 +63,65 @@ class ILexer(abc.ABC):
                  among lexemes of this kind.
         """
 
+    @property
+    def lexeme_ids(self)-> list:
+        """
+        Get table of identifiers of lexemes.
+        Default table is kept in lexer and is extended
+        by table of lexemes at every access, so lexers
+        that keep own table should override this property.
+        :return: list of dicts of lexemes, grouped by kinds.
+                 row index is kind identifier,
+                 dict is {lexeme0: index0, ..., lexemeN: indexN},
+                 where index is index of lexeme in table of lexemes.
+        """
+        lexeme_ids = self.__lexeme_ids
+        if lexeme_ids is None:
+            lexeme_ids = self.__lexeme_ids = []
+        lexemes = self.lexemes
+        del lexeme_ids[len(lexemes):]                       # tables are cleared
+        while len(lexeme_ids) < len(lexemes):
+            lexeme_ids.append({})
+        for kind_lexemes, ids in zip(lexemes, lexeme_ids):
+            if len(ids) > len(kind_lexemes):                # row of lexemes is cleared
+                ids.clear()
+            for index in range(len(ids), len(kind_lexemes)):
+                ids.setdefault(kind_lexemes[index], index)
+        return lexeme_ids
+
+    @property
+    def keep_lexemes(self)-> bool:
+        """
+        Get flag of keeping of tables of kinds and lexemes
+        between calls of tokens(). If flag is True, then
+        identifiers of kinds and lexemes are the same for all analyzed data.
+        :return: flag of keeping of tables
+        """
+        return False
+
+    @property
+    def lexemes_generation(self)-> int:
+        """
+        Get generation of tables of kinds and lexemes.
+        Generation is changed whenever tables are cleared,
+        so while it is the same, identifiers of kinds and lexemes
+        given before are valid and tables are only extended.
+        :return: generation of tables
+        """
+        return self.__lexemes_generation
+
+    def clear_lexemes(self)-> None:
+        """
+        Clear tables of kinds and lexemes
+        and change generation of tables
+        :return: None
+        """
+        self.kind_ids.clear()                       # clear tables of kinds
+        self.kinds.clear()
+        self.lexemes.clear()                        # clear table of lexemes
+        self.lexeme_ids.clear()
+        self.__lexemes_generation += 1
+
     def tokens(self):
         """
         Peforms search lexemes in string data
@@ -62,12 +129,28 @@ class ILexer(abc.ABC):
                  where kind is index in table of kinds,
                  and kind and value is indexes in table of lexemes
         """
-        self.kind_ids.clear()                       # clear tables of kinds
-        self.kinds.clear()
-        self.lexemes.clear()                        # clear table of lexemes
+        if not self.keep_lexemes:
+            self.clear_lexemes()
         for token in self._tokens():
             yield self.new_id_token(token)          # return indexed token
 
+    def new_kind_id(self, kind)-> int:
+        """
+        Get identifier of kind.
+        Append new kind to dictionary of kinds
+        and new row to table of lexemes, if kind isn't in them.
+        :param kind: kind
+        :return: identifier of kind
+        """
+        kind_id = self.kind_ids.get(kind, None)
+        if kind_id is None:
+            kind_id = len(self.kind_ids)             # create new kind id
+            self.kind_ids[kind] = kind_id
+            self.kinds.append(kind)                  # append new kind
+            self.lexemes.append([])
+            self.lexeme_ids.append({})
+        return kind_id
+
     def new_id_token(self, token: Token)-> Token:
         """
         Create new indexed token.
@@ -76,20 +159,16 @@ class ILexer(abc.ABC):
         :param token: string token, Token(kind, value)
         :return: indexed token, Token(kind_id, value_id)
         """
-        if token.kind not in self.kind_ids:
-            kind_id = len(self.kind_ids)             # create new kind id
-            self.kind_ids[token.kind] = kind_id
-            self.kinds.append(token.kind)            # append new kind
-            self.lexemes.append([token.value,])      # append new lexeme
-            value_id = 0
-        else:
-            kind_id = self.kind_ids[token.kind]      # return already existing kind id
-            try:
-                value_id = self.lexemes[kind_id].index(token.value)
-            except ValueError:
-                self.lexemes[kind_id].append(token.value)    # append new lexeme
-                value_id = len(self.lexemes[kind_id]) - 1
-        new_token = Token(kind_id, value_id)
+        kind_id = self.kind_ids.get(token.kind, None)     # already existing kind id
+        if kind_id is None:
+            kind_id = self.new_kind_id(token.kind)
+        lexeme_ids = self.lexeme_ids[kind_id]
+        value_id = lexeme_ids.get(token.value, None)      # already existing lexeme id
+        if value_id is None:
+            value_id = len(lexeme_ids)
+            lexeme_ids[token.value] = value_id
+            self.lexemes[kind_id].append(token.value)    # append new lexeme
+        new_token = Token(kind_id, value_id, token.start, token.end)
         return new_token
 
     @abc.abstractmethod
@@ -117,6 +196,16 @@ class ILexer(abc.ABC):
         """
         return 0
 
+    def position(self, offset: int)-> tuple:
+        """
+        Get position of offset in data.
+        By default offsets aren't tracked, so position
+        of current processed lexeme is returned.
+        :param offset: offset in data, for example start of token
+        :return: tuple of number of line and number of column
+        """
+        return self.num_line, self.num_column
+
     @property
     @abc.abstractmethod
     def data_reader(self)-> IStrReader:
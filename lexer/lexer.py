@@ -1,5 +1,7 @@
 from .ilexer import (ILexer, Token, UnexceptedLexError,
                      NoneDataReaderError, IStrReader)
+from .dfa import DFA
+from bisect import bisect_right
 import re
 
 
@@ -8,26 +10,39 @@ class Lexer(ILexer):
     Lexer is lexical analyzer for strings analyzing
     """
     DEFAULT_SIZE_READ_DATA = 256         # default size one portion of read data
+    RE_ENGINE = "re"                     # specification is matched by alternation of module re
+    DFA_ENGINE = "dfa"                   # specification is matched by minimized DFA
+    ENGINES = (RE_ENGINE, DFA_ENGINE)    # available engines of matching
+    DEFAULT_ENGINE = RE_ENGINE           # default engine of matching
     __data_reader: IStrReader            # reader of string data
     __specification: tuple               # lexical specification. Example: (('KIND','[Regex]'),...)
-    __token_regex: object                # compiled specification in regex
+    __token_regex: object                # compiled specification in regex or DFA
+    __engine: str                        # engine of matching of specification
     __size_read_data: int                # size one portion of read data
-    __num_line: int                      # current processed line
-    __num_column: int                    # current processed column
+    __offset: int                        # offset of current processed lexeme
+    __line_starts: list                  # offsets of starts of lines
     __kind_ids: dict                     # dictionary of kinds
     __kinds: list                        # list of kinds
     __lexemes: list                      # table of lexemes
+    __lexeme_ids: list                   # table of identifiers of lexemes
+    __keep_lexemes: bool                 # keep tables of kinds and lexemes between analyses?
 
     def __init__(self, **kwargs):
         self.__token_regex = None
         self.__kind_ids = {}
         self.__kinds = []
         self.__lexemes = []
-        self.__num_line = 1
-        self.__num_column = 1
+        self.__lexeme_ids = []
+        self.__offset = 0
+        self.__line_starts = [0]
+        self.__specification = ()
+        self.engine = kwargs.get("engine", self.DEFAULT_ENGINE)
         self.data_reader = kwargs.get("data_reader", None)
         self.size_read_data = kwargs.get("size_read_data", self.DEFAULT_SIZE_READ_DATA)
         self.specification = kwargs.get("specification", ())
+        self.keep_lexemes = kwargs.get("keep_lexemes", False)
+        if kwargs.get("seed_lexemes", False):
+            self.seed_lexemes()
 
     @property
     def kind_ids(self) -> dict:
@@ -56,6 +71,42 @@ class Lexer(ILexer):
         """
         return self.__lexemes
 
+    @property
+    def lexeme_ids(self) -> list:
+        """
+        Get table of identifiers of lexemes.
+        :return: table of identifiers of lexemes.
+        """
+        return self.__lexeme_ids
+
+    @property
+    def keep_lexemes(self)-> bool:
+        """
+        Get flag of keeping of tables of kinds and lexemes
+        between calls of tokens()
+        :return: flag of keeping of tables
+        """
+        return self.__keep_lexemes
+
+    @keep_lexemes.setter
+    def keep_lexemes(self, value: bool)-> None:
+        """
+        Set flag of keeping of tables of kinds and lexemes
+        between calls of tokens()
+        :param value: flag of keeping of tables
+        :return: None
+        """
+        self.__keep_lexemes = bool(value)
+
+    def seed_lexemes(self)-> None:
+        """
+        Append kinds of specification to tables of kinds and lexemes,
+        so identifiers of kinds don't depend on analyzed data
+        :return: None
+        """
+        for kind, regex in self.specification:
+            self.new_kind_id(kind)
+
     def _tokens(self):
         """
         Peforms search lexemes in string data
@@ -65,59 +116,109 @@ class Lexer(ILexer):
         if self.__data_reader is None:                                # checks data reader
             raise NoneDataReaderError("Data reader is None!!!")
 
-        self.__data_reader.reset()                                     # resets data reader in init state
-        data = self.__data_reader.read(self.size_read_data)            # reads portion of data
+        reader = self.__data_reader
+        reader.reset()                                                  # resets data reader in init state
+        data = reader.read(self.size_read_data)                         # reads portion of data
         if len(data) == 0 or len(self.specification) == 0:
             return
 
-        self.__num_line = 1             # number of line
-        self.__num_column = 1           # number of column
-        newline_flag = False            # endpos is newline character?
-        start_line = -1                 # position start line
+        self.__offset = 0               # offset of current lexeme
+        line_starts = self.__line_starts = [0]          # offsets of starts of lines
+        end_data = False                # all data is read?
 
+        end_lexemes = self._end_lexemes()            # end lexemes of multitokens
+        base = 0                         # offset of start of data
         pos = 0                          # set current pos in data
-        endpos = -1                      # pos newline character or end pos of portion data
+        endpos = -1                      # pos newline character or end pos of data
+        findpos = 0                      # pos from which newline character is searched
         while True:
-            if pos >= endpos + 1:
-                if newline_flag:
-                    self.__num_line += 1
-                    start_line = pos - 1
-                endpos = data.find('\n', endpos + 1, len(data))                  # try find newline character
-                if endpos == -1:
-                    next_data = self.__data_reader.read(self.size_read_data)     # try find newline in next portion
-                    if len(next_data) > 0:
-                        data += next_data
-                        endpos = data.find('\n', pos + 1, len(data))
-                    if endpos == -1:                                             # if still can't find newline
-                        endpos = len(data) - 1                                   # set in end of data
-                newline_flag = data[endpos] == '\n'
-
-            mtch = self.__token_regex.match(data, pos, endpos + 1)               # find matches of lexeme
+            if pos > endpos:
+                endpos = data.find('\n', findpos)                       # try find newline character
+                while endpos == -1 and not end_data:
+                    # lexemes don't straddle lines, so line is read up to its end before matching,
+                    # next portion is not less than rest of data, then copying of data is linear
+                    next_data = reader.read(max(self.size_read_data, len(data) - pos))
+                    if len(next_data) == 0:
+                        end_data = True
+                        break
+                    findpos = len(data) - pos                           # newline isn't in rest of data
+                    data = data[pos:] + next_data                       # remove processed data
+                    base += pos
+                    pos = 0
+                    endpos = data.find('\n', findpos)
+                if endpos != -1:
+                    findpos = endpos + 1
+                    line_starts.append(base + findpos)                  # start of next line
+                else:                                                   # last line of data
+                    endpos = len(data) - 1
+                    findpos = len(data)
+
+            mtch = self.__token_regex.match(data, pos, endpos + 1)      # find matches of lexeme
             if mtch is None:
-                next_data = self.__data_reader.read(self.size_read_data)         # try read yet portion of data
-                if len(next_data) > 0:
-                    data += next_data
-                    continue
                 break
 
-            self.__num_column = mtch.start() - start_line
-
+            start = mtch.start()
             kind = mtch.lastgroup                       # define kind and value of lexeme
-            value = mtch.group()
-            yield Token(kind, value)                    # return token
-
             pos = mtch.end()                            # set new pos
-            if pos >= self.size_read_data:              # remove processed portion of data
-                data = data[pos:]
-                endpos -= pos
-                start_line -= pos
-                pos = 0
+            if kind in end_lexemes:                     # lexeme is start of multitoken?
+                end_lexeme = end_lexemes[kind]
+                findend = pos                           # pos from which end lexeme is searched
+                while True:
+                    iend = data.find(end_lexeme, findend)
+                    if iend != -1 or end_data:
+                        break
+                    next_data = reader.read(max(self.size_read_data, len(data) - start))
+                    if len(next_data) == 0:
+                        end_data = True
+                        continue
+                    # end lexeme can straddle boundary of portions of data
+                    findend = max(len(data) - len(end_lexeme) + 1, pos) - start
+                    data = data[start:] + next_data     # remove processed data
+                    base += start
+                    findpos -= start
+                    endpos -= start
+                    pos -= start
+                    start = 0
+                pos = len(data) if iend == -1 else iend + len(end_lexeme)
+                if pos > endpos + 1:                    # multitoken consists of some lines
+                    newline = data.find('\n', findpos, pos)
+                    while newline != -1:
+                        line_starts.append(base + newline + 1)
+                        newline = data.find('\n', newline + 1, pos)
+                    findpos = pos
+                    endpos = -1                         # search end of line again
+                value = data[start: pos]
+            else:
+                value = mtch.group()
+            self.__offset = base + start
+            yield Token(kind, value, base + start, base + pos)      # return token
 
         if pos < len(data):
-            self.__num_column += 1
+            self.__offset = base + pos
+            num_line, num_column = self.position(self.__offset)
             msg = f"Unexcepted character '{data[pos]}'" + \
-                  f" in line {self.__num_line} in column {self.__num_column}!!!"
-            raise UnexceptedLexError(data[pos], self.__num_line, self.__num_column, msg)
+                  f" in line {num_line} in column {num_column}!!!"
+            raise UnexceptedLexError(data[pos], num_line, num_column, msg)
+
+    def _end_lexemes(self)-> dict:
+        """
+        Get end lexemes of multitokens.
+        Multitoken is lexeme that starts with lexeme of its kind
+        and ends with end lexeme, it can consist of some lines.
+        :return: dict of end lexemes by kinds of multitokens
+        """
+        return {}
+
+    def position(self, offset: int)-> tuple:
+        """
+        Get position of offset in data.
+        Position is calculated by offsets of starts of lines,
+        i.e. only at request.
+        :param offset: offset in data, for example start of token
+        :return: tuple of number of line and number of column
+        """
+        num_line = bisect_right(self.__line_starts, offset)
+        return num_line, offset - self.__line_starts[num_line - 1] + 1
 
     @property
     def num_line(self):
@@ -125,7 +226,7 @@ class Lexer(ILexer):
         Get number of current processed line
         :return: number of line
         """
-        return self.__num_line
+        return self.position(self.__offset)[0]
 
     @property
     def num_column(self):
@@ -133,12 +234,14 @@ class Lexer(ILexer):
         Get number of current processed column
         :return: number of column
         """
-        return self.__num_column
+        return self.position(self.__offset)[1]
 
     @property
     def size_read_data(self)-> int:
         """
-        Get size read data
+        Get size read data.
+        Window of unprocessed data isn't bounded by this size,
+        it holds at least the whole current line.
         :return: size one portion of read data
         """
         return self.__size_read_data
@@ -155,6 +258,30 @@ class Lexer(ILexer):
             raise ValueError('Size read data value must be greater 0!!!')
         self.__size_read_data = value
 
+    @property
+    def engine(self)-> str:
+        """
+        Get engine of matching of specification
+        :return: name of engine, RE_ENGINE or DFA_ENGINE
+        """
+        return self.__engine
+
+    @engine.setter
+    def engine(self, value: str)-> None:
+        """
+        Set engine of matching of specification.
+        RE_ENGINE matches first rule of specification, whose regex matches lexeme,
+        DFA_ENGINE matches longest lexeme (first rule for lexemes of the same length)
+        and supports only subset of syntax of regular expressions (see lexer.dfa).
+        :param value: name of engine, RE_ENGINE or DFA_ENGINE
+        :return: None
+        :raise: ValueError
+        """
+        if value not in self.ENGINES:
+            raise ValueError(f"Engine '{value}' isn't supported!!!")
+        self.__engine = value
+        self.specification = self.__specification       # compile specification again
+
     @property
     def specification(self)-> tuple:
         """
@@ -174,8 +301,12 @@ class Lexer(ILexer):
         if value is None:
             raise ValueError("specification must be is not None!!!")
         self.__specification = value
-        # compile specification in regex
-        self.__token_regex = re.compile("|".join("(?P<%s>%s)" % rule for rule in self.__specification))
+        if self.__engine == self.DFA_ENGINE:
+            # compile specification in DFA
+            self.__token_regex = DFA(self.__specification)
+        else:
+            # compile specification in regex
+            self.__token_regex = re.compile("|".join("(?P<%s>%s)" % rule for rule in self.__specification))
 
     @property
     def data_reader(self)-> IStrReader:
@@ -1,5 +1,4 @@
-from .lexer import Lexer, UnexceptedLexError
-import re
+from .lexer import Lexer, Token, UnexceptedLexError
 from collections import namedtuple
 
 
@@ -21,18 +20,65 @@ class ProgLangLexer(Lexer):
     id_kind: str                                # kind of lexeme that is identifier
     keyword_kind: str                           # kind of lexeme taht is keyword
     __keywords: tuple                           # keywords of programming language
-    case_sensitive: bool                        # is case sensitive?
+    __keyword_set: frozenset                    # keywords in case of analysis
+    __case_sensitive: bool                      # is case sensitive?
+    __folded_ids: dict                          # folded identifiers and flags of keywords by identifiers
     __multitokens: dict                         # multitokens of programming language
-    __multiregexs: dict                         # compiled regural expressions of multitokens
+    __end_lexemes: dict                         # end lexemes of multitokens
 
     def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+        self.__keywords = ()
+        self.__case_sensitive = True
+        self.__folded_ids = {}
         self.skip_kind = kwargs.get("skip_kind", "")
         self.id_kind = kwargs.get("id_kind", "")
         self.keyword_kind = kwargs.get("keyword_kind", "")
         self.keywords = kwargs.get("keywords", ())
         self.case_sensitive = kwargs.get("case_sensitive", True)
         self.multitokens = kwargs.get("multitokens", dict())
+        super().__init__(**kwargs)
+
+    def seed_lexemes(self)-> None:
+        """
+        Append kinds of specification and keywords
+        to tables of kinds and lexemes, so identifiers
+        of kinds and keywords don't depend on analyzed data
+        :return: None
+        """
+        super().seed_lexemes()
+        for keyword in self.__keywords:
+            if not self.__case_sensitive:
+                keyword = keyword.lower()
+            self.new_id_token(Token(self.keyword_kind, keyword))
+
+    def clear_lexemes(self)-> None:
+        """
+        Clear tables of kinds and lexemes
+        :return: None
+        """
+        super().clear_lexemes()
+        self.__folded_ids.clear()
+
+    def _fold_identifier(self, value: str)-> tuple:
+        """
+        Convert case of identifier and check identifier is keyword.
+        Result is cached for every identifier.
+        :param value: identifier
+        :return: tuple of identifier in case of analysis and flag of keyword
+        """
+        folded = self.__folded_ids.get(value, None)
+        if folded is None:
+            folded_value = value if self.__case_sensitive else value.lower()
+            folded = (folded_value, folded_value in self.__keyword_set)
+            self.__folded_ids[value] = folded
+        return folded
+
+    def _end_lexemes(self)-> dict:
+        """
+        Get end lexemes of multitokens
+        :return: dict of end lexemes by kinds of multitokens
+        """
+        return self.__end_lexemes
 
     def _tokens(self):
         """
@@ -40,42 +86,27 @@ class ProgLangLexer(Lexer):
         :return: tokenized parts of data i.e. tokens
         :raise: UnexceptedLexError
         """
-        total_regex = self._Lexer__token_regex                              # get total compiled regex
-        token_gen = super()._tokens()                                        # get tokens generator
-        try:
-            while True:
-                token = next(token_gen)                                     # get token
-                if token.kind == self.id_kind:
-                    if not self.case_sensitive:
-                        token.value = token.value.lower()
-                    if token.value in self.__keywords:                       # token is identifier or keyword?
-                        token.kind = self.keyword_kind
-                elif token.kind in self.__multitokens:                       # token is multitoken?
-                    kind = token.kind
-                    bounds = self.__multitokens[kind]                        # get bounds of multitoken
-                    if token.value != bounds.start.value:
-                        msg = f"Unexcepted character '{token.value}'" + \
-                              f" in line {self.num_line} in column {self.num_column}!!!"
-                        raise UnexceptedLexError(token.value, self.num_line, self.num_column, msg)
-                    skip_kind_in = self.skip_kind in token.kind
-                    if not skip_kind_in:
-                        yield token
-                    self._Lexer__token_regex = self.__multiregexs[kind]      # set compiled regex for multitoken
-                    while token.value != bounds.end.value:                   # get values of multitoken
-                        token = next(token_gen)
-                        token.kind = kind
-                        if not skip_kind_in:
-                            yield token
-                    self._Lexer__token_regex = total_regex                   # comeback total regex
-                    token = None
-                elif self.skip_kind in token.kind:
-                    token = None                                             # skip token
-                if not token is None:
-                    yield token
-        except StopIteration:
-            pass
-        finally:
-            self._Lexer__token_regex = total_regex                           # comeback total regex
+        folded_ids = self.__folded_ids                                      # cache of identifiers
+        multitokens = self.__multitokens
+        for token in super()._tokens():
+            if token.kind == self.id_kind:
+                folded = folded_ids.get(token.value, None)
+                if folded is None:
+                    folded = self._fold_identifier(token.value)
+                token.value = folded[0]
+                if folded[1]:                                               # token is identifier or keyword?
+                    token.kind = self.keyword_kind
+            elif token.kind in multitokens:                                 # token is multitoken?
+                start = multitokens[token.kind].start.value                 # get start bound of multitoken
+                if not token.value.startswith(start):
+                    msg = f"Unexcepted character '{token.value[:len(start)]}'" + \
+                          f" in line {self.num_line} in column {self.num_column}!!!"
+                    raise UnexceptedLexError(token.value[:len(start)], self.num_line, self.num_column, msg)
+                if self.skip_kind in token.kind:
+                    continue                                                # skip multitoken
+            elif self.skip_kind in token.kind:
+                continue                                                    # skip token
+            yield token
 
     @property
     def keywords(self)-> tuple:
@@ -96,6 +127,37 @@ class ProgLangLexer(Lexer):
         if value is None:
             raise ValueError('keywords can not be None!!!')
         self.__keywords = value
+        self.__compile_keywords()
+
+    @property
+    def case_sensitive(self)-> bool:
+        """
+        Get flag of case sensitivity of programming language
+        :return: is case sensitive?
+        """
+        return self.__case_sensitive
+
+    @case_sensitive.setter
+    def case_sensitive(self, value: bool)-> None:
+        """
+        Set flag of case sensitivity of programming language
+        :param value: is case sensitive?
+        :return: None
+        """
+        self.__case_sensitive = bool(value)
+        self.__compile_keywords()
+
+    def __compile_keywords(self)-> None:
+        """
+        Create set of keywords in case of analysis
+        and clear cache of identifiers
+        :return: None
+        """
+        if self.__case_sensitive:
+            self.__keyword_set = frozenset(self.__keywords)
+        else:
+            self.__keyword_set = frozenset(keyword.lower() for keyword in self.__keywords)
+        self.__folded_ids.clear()
 
     @property
     def multitokens(self)-> dict:
@@ -122,7 +184,4 @@ class ProgLangLexer(Lexer):
         if value is None:
             raise ValueError('multitokens can not be None!!!')
         self.__multitokens = value
-        self.__multiregexs = dict()
-        for kind in self.__multitokens:                             # compile regex of multitokens
-            regex = self.__multitokens[kind].end.regex
-            self.__multiregexs[kind] = re.compile('((%s)|([^%s]+))' % (regex, regex))
\ No newline at end of file
+        self.__end_lexemes = {kind: bounds.end.value for kind, bounds in value.items()}
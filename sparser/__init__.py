@@ -1 +1 @@
-from .isparser import ISParser, Node, SParserError, NoneLexerError
\ No newline at end of file
+from .isparser import ISParser, Node, ColumnarTree, SParserError, NoneLexerError
\ No newline at end of file
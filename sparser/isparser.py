@@ -1,27 +1,176 @@
 import abc
+import sys
+import struct
+from array import array
 from lexer import ILexer
 
 
 class Node:
+    """
+    Node is node of parse tree.
+    Node has slots instead of dict of attributes,
+    so parse tree of big file takes less memory.
+    List of child nodes is stored as is, without copying.
+    """
+    __slots__ = ('kind', 'value', 'parent', '__childs')
     kind: object                         # node kind
     value: object                        # node value
     parent: object                       # parent node
     __childs: list                       # child nodes
-    def __init__(self, **kwargs):
-        self.parent = kwargs.get('parent', None)
-        self.value = kwargs.get('value', None)
-        self.kind = kwargs.get('kind', None)
-        childs = kwargs.get('childs', None)
-        self.__childs = [] if childs is None else [child for child in childs]
+    def __init__(self, kind = None, value = None, childs = None, parent = None):
+        self.kind = kind
+        self.value = value
+        self.parent = parent
+        self.__childs = childs
 
     @property
     def childs(self)-> list:
         """
-        Get list child nodes
+        Get list child nodes.
+        List is created at first access,
+        so leaves of parse tree don't keep empty lists.
         :return:
         """
+        if self.__childs is None:
+            self.__childs = []
         return self.__childs
 
+    @property
+    def span(self)-> tuple:
+        """
+        Get span of node in data, i.e. start of first token
+        and end of last token of node. Span is calculated
+        by tokens of leaves only at request.
+        :return: tuple of start and end or (None, None)
+                 if tokens don't have offsets
+        """
+        return self.__bound(0, 'start'), self.__bound(-1, 'end')
+
+    def __bound(self, side: int, attr: str):
+        """
+        Get bound of span of node
+        :param side: 0 for first token, -1 for last token
+        :param attr: name of attribute of bound of token
+        :return: offset or None
+        """
+        stack = [self]
+        while len(stack) > 0:
+            node = stack.pop()
+            if node.value is not None:
+                offset = getattr(node.value, attr, None)
+                if offset is not None:
+                    return offset
+            elif node.__childs is not None:
+                if side == 0:
+                    stack.extend(reversed(node.__childs))
+                else:
+                    stack.extend(node.__childs)
+        return None
+
+
+class ColumnarTree:
+    """
+    ColumnarTree is parse tree in columnar form.
+    Nodes of tree are indices in parallel arrays:
+        kinds - kinds of nodes (sids of nterminals) or -1;
+        token_kinds, token_values - kind and lexeme ids
+        of tokens of leaves or -1 for inner nodes;
+        firsts, counts - indices of first child in childs
+        and count of childs of nodes;
+        childs - indices of child nodes;
+        starts, ends - span of nodes in offsets of tokens
+        in data of lexer or -1 for empty tokens.
+    Position of node is calculated by lexer only at request.
+    Leaves of empty tokens dropped by folding stay in arrays,
+    but aren't reachable from root.
+    Arrays is serialized by to_bytes() without objects of nodes.
+    """
+    TYPECODE = 'i'                                  # type code of arrays
+    __FIELDS = ('kinds', 'token_kinds', 'token_values', 'firsts', 'counts',
+                'childs', 'starts', 'ends')
+    __HEADER = struct.Struct('<' + 'I' * (len(__FIELDS) + 1))
+    def __init__(self):
+        self.root = -1                              # index of root node
+        for field in self.__FIELDS:
+            setattr(self, field, array(self.TYPECODE))
+
+    def __len__(self)-> int:
+        """
+        Get count of nodes
+        :return: count of nodes
+        """
+        return len(self.kinds)
+
+    def childs_of(self, inode: int)-> array:
+        """
+        Get indices of child nodes
+        :param inode: index of node
+        :return: indices of child nodes
+        """
+        first = self.firsts[inode]
+        return self.childs[first: first + self.counts[inode]]
+
+    def is_leaf(self, inode: int)-> bool:
+        """
+        Check node is leaf, i.e. node of token
+        :param inode: index of node
+        :return: True if node is leaf
+        """
+        return self.token_kinds[inode] != -1
+
+    def position(self, inode: int, lexer: ILexer)-> tuple:
+        """
+        Get position of first token of node
+        :param inode: index of node
+        :param lexer: lexer that gave tokens of tree
+        :return: tuple of number of line and number of column or (-1, -1)
+        """
+        start = self.starts[inode]
+        if start == -1:
+            return -1, -1
+        return lexer.position(start)
+
+    def to_bytes(self)-> bytes:
+        """
+        Serialize tree in bytes
+        :return: bytes
+        """
+        arrays = [getattr(self, field) for field in self.__FIELDS]
+        data = bytearray(self.__HEADER.pack(self.root + 1, *(len(arr) for arr in arrays)))
+        for arr in arrays:
+            if arr.itemsize != 4 or sys.byteorder != 'little':
+                arr = array('i', arr)
+                if sys.byteorder != 'little':
+                    arr.byteswap()
+            data += arr.tobytes()
+        return bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        """
+        Deserialize tree from bytes
+        :param data: bytes
+        :return: tree
+        :raise: ValueError
+        """
+        tree = cls()
+        try:
+            root, *lens = cls.__HEADER.unpack_from(data, 0)
+        except struct.error:
+            raise ValueError("Uncorrect data of columnar tree!!!")
+        pos = cls.__HEADER.size
+        if pos + 4 * sum(lens) != len(data):
+            raise ValueError("Uncorrect data of columnar tree!!!")
+        for field, count in zip(cls.__FIELDS, lens):
+            arr = array('i')
+            arr.frombytes(data[pos: pos + 4 * count])
+            if sys.byteorder != 'little':
+                arr.byteswap()
+            setattr(tree, field, arr)
+            pos += 4 * count
+        tree.root = root - 1
+        return tree
+
 
 class ISParser(abc.ABC):
     """
@@ -1,36 +1,22 @@
+import os
+import json
+import hashlib
+import tempfile
 import struct
-import random
-import time
+import sys
+import mmap
+from collections import deque
+from array import array
 from lexer import ILexer, Token
-from .isparser import (ISParser, Node, SParserError,
+from .isparser import (ISParser, Node, ColumnarTree, SParserError,
                        NoneLexerError, ParseSyntaxError)
 
 
-def merge_ranges(*rngs):
-    """
-    Merge ranges
-    :param rngs: list of ranges
-    :return: value from range
-    """
-    for rng in rngs:
-        for e in rng:
-            yield e
-
-
-def range_objs(*objs):
-    """
-    Create range of objects
-    :param objs: list of objects
-    :return: string from list of objects
-    """
-    for obj in objs:
-        yield obj
-
-
 class Rule:
     """
     Rule is rule of grammar of language
     """
+    __slots__ = ('key', '__value')
     key: object                              # key of rule
     __value: tuple                           # value of rule
     def __init__(self, key = None, *value):
@@ -77,6 +63,7 @@ class IndRule(Rule):
     """
     IndRule is rule of grammar of language with index
     """
+    __slots__ = ('index',)
     index: int                        # index of rule
     def __init__(self, key = None, *value):
         super().__init__(key, *value)
@@ -87,6 +74,7 @@ class LR0Point:
     """
     LR0Point is LR0-point of grammar of language
     """
+    __slots__ = ('__rule', '__iptr')
     __rule: Rule                           # rule of grammar
     __iptr: int                            # position of pointer ● in value of rule
     def __init__(self, **kwargs):
@@ -177,6 +165,7 @@ class LR1Point(LR0Point):
     """
     LR1Point is LR1-point of grammar of language
     """
+    __slots__ = ('__lookahead',)
     __lookahead: list                   # terminal symbols of lookahead
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -230,6 +219,7 @@ class LRState:
     """
     LRState is state of LR state machine
     """
+    __slots__ = ('index', '__lrpoints', '__goto', '__rgoto')
     index: int                              # index of LR-state
     __lrpoints: list                        # LR-points of LR-state
     __goto: dict                            # transitions in other states
@@ -324,244 +314,520 @@ class LRState:
         return ans
 
 
-def first_term(rules: list, terminal_func, value)-> list:
+def index_rules(rules: list)-> dict:
+    """
+    Create index of rules by nterminals.
+    :param rules: rules of grammar
+    :return: dict where key is nterminal and
+             value is list of rules of nterminal
+    """
+    nterm_rules = {}
+    for rule in rules:
+        nterm_rules.setdefault(rule.key, []).append(rule)
+    return nterm_rules
+
+def first_sets(rules: list, terminal_func)-> tuple:
     """
-    Calculate set of FIRST(value) for specified value.
+    Calculate sets of FIRST(...) for all symbols of grammar
+    and set NULLABLE of grammar.
     FIRST(A) - the set of terminal characters that begin
-    strings derived from 'A'
+    strings derived from 'A', FIRST(a) = {a} for terminal 'a'.
+    NULLABLE - the set of nterminals from which derived
+    empty string, i.e. there is rule [A -> ] without values.
+    Empty terminal is shifted by parser how special token,
+    so it is included in sets of FIRST(...) how terminal
+    and it isn't nullable.
+    Sets are calculated by fixpoint iteration.
     :param rules: rules of grammar
     :param terminal_func: predicate for definition terminal symbols
-    :param value: symbol who need calulate set of FIRST(...)
-    :return: list of terminal symbols
+    :return: dict of FIRST(...) sets by symbols and set NULLABLE
     """
-    ans = []                    # list of found terminal symbols
-    queue = []
-    queue.append(value)
-    checked_rules = set()
-    while len(queue) > 0:       # breadth-first search (BFS)
-        val = queue.pop(0)
-        if terminal_func(val):
-            ans.append(val)     # add terminal
-        else:
-            for rule in rules:
-                if rule.key == val and \
-                   rule.to_tuple() not in checked_rules:
-                    if len(rule.value) > 0:
-                        queue.append(rule.value[0])   # add new symbol for check
-                        checked_rules.add(rule.to_tuple())
-    return ans
-
-def closure_LR1(rules: list, terminal_func, entry_lrps: list)-> list:
+    firsts = {}
+    nullables = set()
+    for rule in rules:
+        firsts[rule.key] = set()
+        for val in rule.value:
+            if terminal_func(val):
+                firsts[val] = {val}              # FIRST(a) = {a}
+    changed = True
+    while changed:                               # calculate until sets stop changing
+        changed = False
+        for rule in rules:
+            first = firsts[rule.key]
+            count = len(first)
+            nullable = True
+            for val in rule.value:               # FIRST(A) includes FIRST(X1...Xn)
+                first |= firsts.get(val, set())
+                if val not in nullables:
+                    nullable = False
+                    break
+            if len(first) != count:
+                changed = True
+            if nullable and rule.key not in nullables:
+                nullables.add(rule.key)
+                changed = True
+    return firsts, nullables
+
+def first_seq(values, firsts: dict, nullables: set)-> tuple:
+    """
+    Calculate set of FIRST(X1...Xn) for sequence of symbols.
+    :param values: sequence of symbols
+    :param firsts: dict of FIRST(...) sets by symbols
+    :param nullables: set NULLABLE
+    :return: set of terminal symbols and
+             is sequence nullable?
+    """
+    ans = set()
+    for val in values:
+        ans |= firsts.get(val, set())
+        if val not in nullables:
+            return ans, False
+    return ans, True
+
+def follow_sets(rules: list, firsts: dict, nullables: set,
+                goal_nterm, end_term)-> dict:
+    """
+    Calculate sets of FOLLOW(...) for all nterminals of grammar.
+    FOLLOW(A) - the set of terminal characters that can
+    appear immediately to the right of 'A'.
+    Sets are calculated by fixpoint iteration.
+    :param rules: rules of grammar
+    :param firsts: dict of FIRST(...) sets by symbols
+    :param nullables: set NULLABLE
+    :param goal_nterm: goal nterminal of grammar
+    :param end_term: end terminal of grammar
+    :return: dict of FOLLOW(...) sets by nterminals
+    """
+    follows = {rule.key: set() for rule in rules}
+    follows.setdefault(goal_nterm, set()).add(end_term)
+    changed = True
+    while changed:                               # calculate until sets stop changing
+        changed = False
+        for rule in rules:
+            trailer = follows[rule.key].copy()   # FOLLOW(...) of end of rule
+            for val in reversed(rule.value):
+                follow = follows.get(val, None)
+                if not follow is None:           # if val is nterminal
+                    count = len(follow)
+                    follow |= trailer
+                    if len(follow) != count:
+                        changed = True
+                    if val in nullables:
+                        trailer = trailer | firsts[val]
+                    else:
+                        trailer = firsts[val].copy()
+                else:
+                    trailer = firsts.get(val, set()).copy()
+    return follows
+
+
+class LRItems:
+    """
+    LRItems is table of interned LR0-points of grammar.
+    Every LR0-point [A -> α●β] is packed in one int:
+    offset of rule plus position of pointer ●, where offset of rule
+    is count of LR0-points of all previous rules. So GOTO of
+    LR0-point [A -> α●Xβ] is next int [A -> αX●β].
+    Lookaheads of LR1-points are interned frozensets of terminal symbols.
+    """
+    __slots__ = ('rules', 'irules', 'iptrs', 'nexts', 'nterm_items',
+                 '__offsets', '__firstbs', '__lookaheads')
+    rules: list                        # rules of grammar by indices of rules in table
+    irules: list                       # indices of rules by LR0-points
+    iptrs: list                        # positions of pointer ● by LR0-points
+    nexts: list                        # symbols after pointer ● by LR0-points
+    nterm_items: dict                  # LR0-points [B -> ●γ] by nterminals
+    __offsets: dict                    # offsets of rules by id of rules
+    __firstbs: list                    # FIRST(β) and NULLABLE(β) by LR0-points [A -> α●Bβ]
+    __lookaheads: dict                 # interned lookaheads
+
+    def __init__(self, nterm_rules: dict, firsts: dict, nullables: set):
+        """
+        :param nterm_rules: index of rules of grammar by nterminals
+        :param firsts: dict of FIRST(...) sets by symbols
+        :param nullables: set NULLABLE
+        """
+        self.rules = []
+        self.irules = []
+        self.iptrs = []
+        self.nexts = []
+        self.nterm_items = {}
+        self.__offsets = {}
+        self.__firstbs = []
+        self.__lookaheads = {}
+        for key in nterm_rules:
+            starts = self.nterm_items[key] = []
+            for rule in nterm_rules[key]:
+                irule = len(self.rules)
+                self.rules.append(rule)
+                self.__offsets[id(rule)] = len(self.irules)
+                starts.append(len(self.irules))
+                for iptr in range(len(rule.value) + 1):
+                    self.irules.append(irule)
+                    self.iptrs.append(iptr)
+                    if iptr < len(rule.value):
+                        self.nexts.append(rule.value[iptr])
+                        firstb, nullable = first_seq(rule.value[iptr + 1:], firsts, nullables)
+                        self.__firstbs.append((self.lookahead(frozenset(firstb)), nullable))
+                    else:
+                        self.nexts.append(None)
+                        self.__firstbs.append(None)
+
+    def __len__(self):
+        return len(self.irules)
+
+    def item(self, rule: Rule, iptr: int)-> int:
+        """
+        Get LR0-point by rule and position of pointer ●
+        :param rule: rule of grammar from table
+        :param iptr: position of pointer ●
+        :return: LR0-point packed in int
+        """
+        return self.__offsets[id(rule)] + iptr
+
+    def rule(self, item: int)-> Rule:
+        """
+        Get rule of LR0-point
+        :param item: LR0-point packed in int
+        :return: rule of grammar
+        """
+        return self.rules[self.irules[item]]
+
+    def lookahead(self, value: frozenset)-> frozenset:
+        """
+        Intern lookahead
+        :param value: frozenset of terminal symbols
+        :return: interned frozenset of terminal symbols
+        """
+        return self.__lookaheads.setdefault(value, value)
+
+    def firstb(self, item: int)-> tuple:
+        """
+        Get FIRST(β) for LR0-point [A -> α●Bβ]
+        :param item: LR0-point packed in int
+        :return: frozenset of terminal symbols and is β nullable?
+        """
+        return self.__firstbs[item]
+
+    def to_lrpoint(self, item: int, lookahead = None):
+        """
+        Create LR-point by LR0-point packed in int
+        :param item: LR0-point packed in int
+        :param lookahead: lookahead of LR1-point or None for LR0-point
+        :return: LR0Point or LR1Point
+        """
+        if lookahead is None:
+            return LR0Point(rule=self.rule(item), iptr=self.iptrs[item])
+        return LR1Point(rule=self.rule(item), iptr=self.iptrs[item], lookahead=list(lookahead))
+
+
+def closure_LR1(items: LRItems, entry_lrps: dict)-> dict:
     """
     Calculate set of CLOSURE(...) for specified LR-points.
     CLOSURE(I) - closing LR-points.
     if [A -> α●Bβ, a] is included in CLOSURE(I)
     and there is rule [B -> γ], then in CLOSURE(I)
     append [B -> ●γ, b] for each terminal b ∈ FIRST(βa).
-    :param rules: rules of grammar
-    :param terminal_func: predicate for definition terminal symbols
-    :param entry_lrps: list of LR-points who need calulate set of CLOSURE(...)
-    :return: list of LR-points for LR-state
+    Lookaheads of LR-points with common LR0-point are united.
+    :param items: table of LR0-points
+    :param entry_lrps: dict of lookaheads by LR0-points
+                       who need calulate set of CLOSURE(...)
+    :return: dict of lookaheads by LR0-points for LR-state
     """
-    lrpoints = {}                   # CLOSURE(...), list of LR-points
-    queue = []                      # processing queue
-    for lrpoint in entry_lrps:      # add all entry LR-points
-        lrpoints[lrpoint.to_tuple()] = lrpoint
-        queue.append(lrpoint)
-    while len(queue) > 0:           # breadth-first search (BFS)
-        lrpoint = queue.pop(0)
-        iptr = lrpoint.iptr
-        rule = lrpoint.rule
-        if iptr < 0 or iptr > len(rule.value) - 1:
+    lrpoints = dict(entry_lrps)                 # CLOSURE(...)
+    queue = deque(lrpoints)                     # processing queue
+    nexts = items.nexts
+    nterm_items = items.nterm_items
+    while len(queue) > 0:                       # breadth-first search (BFS)
+        item = queue.popleft()
+        starts = nterm_items.get(nexts[item], None)                # get [B -> ●γ]
+        if starts is None:
             continue
-        B = rule.value[iptr]                            # calculate B
-        b = rule.value[iptr + 1] \
-            if iptr < len(rule.value) - 1 else None     # calculate β
-        firstb = first_term(rules, terminal_func, b)    # calculate FIRST(β)
-        if len(firstb) == 0:
-            firstb += lrpoint.lookahead                 # calculate FIRST(a)
-        for rule in rules:
-            if B == rule.key:
-                new_lrp = LR1Point(rule=rule, iptr=0, lookahead=firstb)  # add rule [B -> ●γ, FIRST(βa)]
-                if new_lrp.to_tuple() not in lrpoints:                   # if lrpoints not have new_lrp
-                    queue.append(new_lrp)
-                    lrpoints[new_lrp.to_tuple()] = new_lrp               # add rule [B -> ●γ, b]
-    return [lrpoints[key_lrp] for key_lrp in lrpoints]
-
-def goto_LR1Point(lrpoints: list, value)-> list:
+        firstb, nullable = items.firstb(item)                      # get FIRST(β)
+        if nullable:
+            firstb = items.lookahead(firstb | lrpoints[item])      # calculate FIRST(βa)
+        for start in starts:
+            lookahead = lrpoints.get(start, None)
+            if lookahead is None:                                  # add [B -> ●γ, FIRST(βa)]
+                lrpoints[start] = firstb
+                queue.append(start)
+            elif not firstb <= lookahead:                          # extend lookahead of [B -> ●γ]
+                lrpoints[start] = items.lookahead(lookahead | firstb)
+                queue.append(start)
+    return lrpoints
+
+def make_LRStates(items: LRItems, closures: list, gotos: list)-> list:
     """
-    Calculate LR-points for GOTO-transition by specified value.
-    GOTO_LR1Point([..., [A -> α●Xβ, a], ...], X) = [[A -> αX●β, a], ...]
-    GOTO(I, X) - set of transitions, I - LR-state,
-    X - symbol for transition.
-    if [A -> α●Xβ, a] in CLOSURE(Ii) then
-    GOTO(Ii, X) = CLOSURE([[A -> αX●β, a], ...]).
-    :param rules: rules of grammar
-    :param terminal_func: predicate for definition terminal symbols
-    :param lrpoints: list of LR1-points
-    :param value: symbol for transition
-    :return: list of GOTO LR1-points
+    Create LR-states of LR state machine by packed LR-states.
+    :param items: table of LR0-points
+    :param closures: dicts of lookaheads by LR0-points for every LR-state,
+                     lookahead is None for LR0-points of LR(0) state machine
+    :param gotos: dicts of indices of LR-states for transitions by symbols
+    :return: list of LR-states
     """
-    goto_lrps = []
-    for lrpoint in lrpoints:                # check all LR-points
-        iptr = lrpoint.iptr
-        rule = lrpoint.rule
-        lookahead = lrpoint.lookahead
-        if iptr < 0 or iptr > len(rule.value) - 1:
-            continue
-        B = rule.value[iptr]
-        if value == B:
-            goto_lrps += [LR1Point(rule=rule, iptr=iptr + 1, lookahead=lookahead)]
-    return goto_lrps
+    lrstates = [LRState(index=index,
+                        lrpoints=[items.to_lrpoint(item, closure[item]) for item in closure])
+                for index, closure in enumerate(closures)]
+    for lrstate in lrstates:
+        for B, index in gotos[lrstate.index].items():
+            new_lrst = lrstates[index]
+            lrstate.goto[B] = new_lrst                        # set transition
+            new_lrst.rgoto.setdefault(B, []).append(lrstate)  # set reverse transition
+    return lrstates
 
-def create_LR1States(rules: list, term_func, start_lrp: LR1Point)-> list:
+def create_LR1States(items: LRItems, start_item: int, start_lookahead: frozenset)-> list:
     """
-    Create all LR-states of LR state machine by LR-point with goal symbol
-    :param rules: rules of grammar
-    :param term_func: predicate for definition terminal symbols
-    :param start_lrp: LR1-point who need calulate LR-states
+    Create all LR-states of LR state machine by LR-point with goal symbol.
+    :param items: table of LR0-points
+    :param start_item: LR0-point with goal symbol
+    :param start_lookahead: lookahead of LR-point with goal symbol
     :return: list of all LR-states of LR state machine
     """
-    index = 0
-    lrpts = [start_lrp]
-    lrst = LRState(index=index)                            # LR-state I0
-    lrst.lrpoints = closure_LR1(rules, term_func, lrpts)   # calculate CLOSURE(I0)
-    created_lrsts = {}                    # all created LR-states and LR-points with that they were created
-    queue = []                            # queue of LR-states processing
-    ans_lrsts = []
-    ans_lrsts.append(lrst)
-    lrst_key = tuple(lrp.to_tuple() for lrp in lrpts)
-    created_lrsts[lrst_key] = lrst        # add I0 how created
-    queue.append(lrst)                    # add I0 for processing
-    while len(queue) > 0:
-        curr_lrst = queue.pop(0)
-        goto_symbols = set()
-        for lrpoint in curr_lrst.lrpoints:
-            rule = lrpoint.rule
-            iptr = lrpoint.iptr
-            if iptr < 0 or iptr > len(rule.value) - 1:      # if after ● there is a symbol
-                continue
-            B = rule.value[iptr]
-            goto_symbols.add(B)
-        for B in goto_symbols:
-            new_lrps = goto_LR1Point(curr_lrst.lrpoints, B)  # get LR1-points for GOTO-transition
-            if len(new_lrps) == 0:
-                continue
-            lrst_key = tuple(lrp.to_tuple() for lrp in new_lrps)
-            new_lrst = created_lrsts.get(lrst_key, None)
-            if new_lrst is None:                     # create new LR-state
-                index += 1
-                new_lrst = LRState(index=index)
-                new_lrst.lrpoints = closure_LR1(rules, term_func, new_lrps)
-                queue.append(new_lrst)                # add Ii for processing
-                created_lrsts[lrst_key] = new_lrst    # add Ii how created
-                ans_lrsts.append(new_lrst)
-            curr_lrst.goto[B] = new_lrst              # set transition
-            refs = new_lrst.rgoto.get(B, [])          # set reverse transition
-            refs.append(curr_lrst)
-            new_lrst.rgoto[B] = refs
-    return ans_lrsts
+    return make_LRStates(items, *create_packed_LR1States(items, start_item, start_lookahead))
 
-def can_merge_LR1_states(lrst1: LRState, lrst2: LRState)-> bool:
+def create_packed_LR1States(items: LRItems, start_item: int, start_lookahead: frozenset)-> tuple:
     """
-    Check can merge first LR1-state and second LR1-state?
-    :param lrst1: LR1-state
-    :param lrst2: LR1-state
-    :return: bool
+    Create all packed LR-states of LR state machine by LR-point with goal symbol.
+    Kernel LR-points are sorted, so order of LR-points in LR-state
+    doesn't depend on the way by which LR-state was reached.
+    :param items: table of LR0-points
+    :param start_item: LR0-point with goal symbol
+    :param start_lookahead: lookahead of LR-point with goal symbol
+    :return: dicts of lookaheads by LR0-points for every LR-state and
+             dicts of indices of LR-states for transitions by symbols
     """
-    if len(lrst1.lrpoints) == len(lrst2.lrpoints):
-        for k in range(len(lrst1.lrpoints)):
-            lrp1 = lrst1.lrpoints[k]
-            lrp2 = lrst2.lrpoints[k]
-            if lrp1.iptr != lrp2.iptr or \
-               lrp1.rule != lrp2.rule:       # check pointers ● and rules
-                return False
-        return True
-    return False
-
-def merge_LR1_states(lrst1: LRState, lrst2: LRState)-> LRState:
+    nexts = items.nexts
+    kernel = {start_item: items.lookahead(frozenset(start_lookahead))}
+    closures = [closure_LR1(items, kernel)]                      # calculate CLOSURE(I0)
+    gotos = [{}]
+    created_lrsts = {frozenset(kernel.items()): 0}               # all created LR-states by their kernels
+    index = 0
+    while index < len(closures):                                 # breadth-first search (BFS)
+        goto_kernels = {}
+        closure = closures[index]
+        for item in closure:                                     # [A -> α●Xβ, a] -> [A -> αX●β, a]
+            B = nexts[item]
+            if not B is None:
+                goto_kernels.setdefault(B, {})[item + 1] = closure[item]
+        for B in goto_kernels:
+            kernel = dict(sorted(goto_kernels[B].items()))
+            lrst_key = frozenset(kernel.items())
+            new_index = created_lrsts.get(lrst_key, None)
+            if new_index is None:                                # create new LR-state
+                new_index = len(closures)
+                closures.append(closure_LR1(items, kernel))
+                gotos.append({})
+                created_lrsts[lrst_key] = new_index
+            gotos[index][B] = new_index                           # set transition
+        index += 1
+    return closures, gotos
+
+def merge_packed_LR1States(closures: list, gotos: list)-> tuple:
     """
-    Merge first LR1-state and second LR1-state
-    :param lrst1: LR1-state
-    :param lrst2: LR1-state
-    :return: new LR1-state
+    Merge packed LR1-states in packed LALR1-states.
+    LR1-states are grouped by their core, i.e. by set of their LR0-points.
+    LR1-states with common core are merged in one LALR1-state,
+    lookaheads of common LR0-points are united.
+    :param closures: dicts of lookaheads by LR0-points for every LR1-state
+    :param gotos: dicts of indices of LR1-states for transitions by symbols
+    :return: dicts of lookaheads by LR0-points for every LALR1-state and
+             dicts of indices of LALR1-states for transitions by symbols
     """
-    new_lrst = LRState()                        # create new LR-state
-    for k in range(len(lrst1.lrpoints)):        # merge LR1-points
-        lrp1 = lrst1.lrpoints[k]
-        lrp2 = lrst2.lrpoints[k]
-        lrp = LR1Point(rule=lrp1.rule, iptr=lrp1.iptr,
-                       lookahead=lrp1.lookahead + lrp2.lookahead)
-        new_lrst.lrpoints.append(lrp)
-
-    for key in lrst1.goto:                        # add all goto transitions from lrst1
-        lrst = lrst1.goto[key]
-        new_lrst.goto[key] = lrst                 # add goto transition
-        lrst.rgoto[key].remove(lrst1)             # fix rgoto transition in other states
-        lrst.rgoto[key].append(new_lrst)
-
-    for key in lrst2.goto:                        # add all goto transitions from lrst2
-        lrst = lrst2.goto[key]
-        if new_lrst.goto.get(key, None) is None:
-            new_lrst.goto[key] = lrst             # add goto transition
-        lrst.rgoto[key].remove(lrst2)             # fix rgoto transition in other states
-        lrst.rgoto[key].append(new_lrst)
-
-    new_lrst.rgoto = {key: lrst1.rgoto[key].copy()  # add all rgoto transitions from lrst1
-                      for key in lrst1.rgoto}
-    for key in lrst2.rgoto:                         # add all rgoto transitions from lrst2
-        refs = new_lrst.rgoto.get(key, [])
-        for lrst1 in lrst2.rgoto[key]:              # add rgoto transitions excluding duplicates
-            add_flag = True
-            for lrst2 in refs:
-                if lrst1 is lrst2:
-                    add_flag = False
-                    break
-            if add_flag:
-                refs.append(lrst1)
-        new_lrst.rgoto[key] = refs
-
-    for key in new_lrst.rgoto:                 # fix goto transitions in other states
-        for lrst in new_lrst.rgoto[key]:
-            lrst.goto[key] = new_lrst
-    return new_lrst
+    cores = {}                                  # indices of LALR1-states by cores
+    merged = []                                 # indices of LALR1-states by indices of LR1-states
+    ans_closures = []
+    for closure in closures:                    # merge all LR-states with common core
+        core = frozenset(closure)
+        index = cores.get(core, None)
+        if index is None:
+            index = cores[core] = len(ans_closures)
+            ans_closures.append({item: set() for item in closure})
+        merged.append(index)
+        lookaheads = ans_closures[index]
+        for item in closure:                    # unite lookaheads of LR0-points
+            lookaheads[item] |= closure[item]
+    ans_gotos = [{} for closure in ans_closures]
+    for index in range(len(gotos)):             # set transitions between LALR1-states
+        ans_gotos[merged[index]].update((B, merged[new_index])
+                                        for B, new_index in gotos[index].items())
+    return ans_closures, ans_gotos
 
 def states_LR1_to_LALR1(lrstates: list)-> list:
     """
     Transform list of LR1-states to LALR1-states.
+    LR1-states are grouped by their core, i.e. by set of
+    pairs (index of rule, position of pointer ●) of LR1-points.
+    LR1-states with common core are merged in one LALR1-state,
+    lookaheads of LR1-points with common rule and pointer ● are united.
     :param lrstates: list of LR1-states
-    :return: None
+    :return: list of LALR1-states
     """
-    lrstates = lrstates.copy()
-    pos_i = 0
-    pos_j = len(lrstates) - 1
-    # merge all LR-states with common core
-    while pos_i < len(lrstates) - 1:
-        merge_flag = False
-        for i in range(pos_i, len(lrstates)):
-            pos_i = i
-            if pos_j == len(lrstates) - 1:
-                pos_j = i + 1
-            for j in range(pos_j, len(lrstates)):
-                pos_j = j
-                if i != j and\
-                   can_merge_LR1_states(lrstates[i], lrstates[j]):
-                    new_lrst = merge_LR1_states(lrstates[pos_i], lrstates[pos_j])
-                    lrstates[pos_i] = new_lrst
-                    lrstates.pop(pos_j)
-                    pos_j -= 1
-                    merge_flag = True
-                    break
-            if merge_flag:
-                break
-    for i in range(len(lrstates)):              # fix indices in LR-states
-        lrstates[i].index = i
-    return lrstates
+    cores = {}                                  # LALR1-states by cores
+    merged_lrsts = {}                           # LALR1-states by id of LR1-states
+    lookaheads = []                             # lookaheads of LR1-points of LALR1-states
+    ans_lrsts = []
+    for lrstate in lrstates:                    # merge all LR-states with common core
+        core = frozenset((lrp.rule.index, lrp.iptr) for lrp in lrstate.lrpoints)
+        new_lrst = cores.get(core, None)
+        if new_lrst is None:
+            new_lrst = LRState(index=len(ans_lrsts))
+            cores[core] = new_lrst
+            lookaheads.append({})
+            ans_lrsts.append(new_lrst)
+        merged_lrsts[id(lrstate)] = new_lrst
+        lrp_lookaheads = lookaheads[new_lrst.index]
+        for lrpoint in lrstate.lrpoints:        # unite lookaheads of LR1-points
+            key = (lrpoint.rule.index, lrpoint.iptr)
+            lrp_la = lrp_lookaheads.get(key, None)
+            if lrp_la is None:
+                lrp_la = lrp_lookaheads[key] = {}
+                new_lrst.lrpoints.append(LR1Point(rule=lrpoint.rule, iptr=lrpoint.iptr))
+            lrp_la.update(dict.fromkeys(lrpoint.lookahead))
+    linked = set()                              # added reverse transitions
+    for lrstate in lrstates:                    # set transitions between LALR1-states
+        new_lrst = merged_lrsts[id(lrstate)]
+        for key in lrstate.goto:
+            goto_lrst = merged_lrsts[id(lrstate.goto[key])]
+            new_lrst.goto[key] = goto_lrst
+            if (new_lrst.index, key, goto_lrst.index) not in linked:
+                linked.add((new_lrst.index, key, goto_lrst.index))
+                goto_lrst.rgoto.setdefault(key, []).append(new_lrst)
+    for new_lrst in ans_lrsts:                  # set lookaheads of LR1-points
+        lrp_lookaheads = lookaheads[new_lrst.index]
+        for lrpoint in new_lrst.lrpoints:
+            lrpoint.lookahead = list(lrp_lookaheads[(lrpoint.rule.index, lrpoint.iptr)])
+    return ans_lrsts
+
+def closure_LR0(items: LRItems, entry_items: list)-> list:
+    """
+    Calculate set of CLOSURE(...) for specified LR0-points.
+    if [A -> α●Bβ] is included in CLOSURE(I)
+    and there is rule [B -> γ], then in CLOSURE(I)
+    append [B -> ●γ].
+    :param items: table of LR0-points
+    :param entry_items: list of LR0-points who need calulate set of CLOSURE(...)
+    :return: list of LR0-points for LR-state
+    """
+    lrpoints = list(entry_items)                # CLOSURE(...)
+    added = set(lrpoints)
+    nexts = items.nexts
+    nterm_items = items.nterm_items
+    for item in lrpoints:                       # breadth-first search (BFS)
+        for start in nterm_items.get(nexts[item], ()):
+            if start not in added:              # add [B -> ●γ]
+                added.add(start)
+                lrpoints.append(start)
+    return lrpoints
+
+def create_LR0States(items: LRItems, start_item: int)-> tuple:
+    """
+    Create all LR-states of LR(0) state machine by LR0-point with goal symbol.
+    Kernel LR0-points of every state are sorted and placed at the beginning
+    of its list of LR0-points, count of them is saved in kernels.
+    :param items: table of LR0-points
+    :param start_item: LR0-point with goal symbol
+    :return: lists of LR0-points of all LR-states of LR(0) state machine,
+             list of counts of kernel LR0-points in every LR-state and
+             dicts of indices of LR-states for transitions by symbols
+    """
+    nexts = items.nexts
+    closures = [closure_LR0(items, [start_item])]          # calculate CLOSURE(I0)
+    kernels = [1]
+    gotos = [{}]
+    created_lrsts = {frozenset((start_item,)): 0}           # all created LR-states by their kernels
+    index = 0
+    while index < len(closures):                            # breadth-first search (BFS)
+        goto_kernels = {}
+        for item in closures[index]:                        # [A -> α●Xβ] -> [A -> αX●β]
+            B = nexts[item]
+            if not B is None:
+                goto_kernels.setdefault(B, []).append(item + 1)
+        for B in goto_kernels:
+            kernel = sorted(goto_kernels[B])
+            lrst_key = frozenset(kernel)
+            new_index = created_lrsts.get(lrst_key, None)
+            if new_index is None:                           # create new LR-state
+                new_index = len(closures)
+                closures.append(closure_LR0(items, kernel))
+                kernels.append(len(kernel))
+                gotos.append({})
+                created_lrsts[lrst_key] = new_index
+            gotos[index][B] = new_index                      # set transition
+        index += 1
+    return closures, kernels, gotos
+
+def create_LALR1States(items: LRItems, start_item: int, start_lookahead: frozenset)-> list:
+    """
+    Create all LR-states of LALR(1) state machine by LR-point with goal symbol
+    without building of LR(1) state machine.
+    LR(0) state machine is built and lookaheads are calculated
+    for its LR-points by propagation:
+        1) for every kernel LR-point [A -> α●β] of Ii calculate
+        J = CLOSURE([[A -> α●β, #]]), where # is dummy lookahead
+        2) if [B -> γ●Xδ, a] is included in J and a != # then a is generated
+        spontaneously for [B -> γX●δ] in GOTO(Ii, X)
+        3) if [B -> γ●Xδ, #] is included in J then lookaheads propagate
+        from [A -> α●β] in Ii to [B -> γX●δ] in GOTO(Ii, X)
+        4) lookaheads are propagated until they stop changing
+    :param items: table of LR0-points
+    :param start_item: LR0-point with goal symbol
+    :param start_lookahead: lookahead of LR-point with goal symbol
+    :return: list of all LR-states of LALR(1) state machine
+    """
+    dummy = object()                                          # dummy lookahead #
+    dummy_lookahead = items.lookahead(frozenset((dummy,)))
+    closures, kernels, gotos = create_LR0States(items, start_item)
+    nexts = items.nexts
+    count_items = len(items)
+    lookaheads = [{item: set() for item in closure}           # lookaheads of LR-points by LR-states
+                  for closure in closures]
+    lookaheads[0][start_item].update(start_lookahead)
+    propagations = {}                           # lookaheads propagations between LR-points
+    kernel_closures = {}                        # CLOSURE([[A -> α●β, #]]) by kernel LR0-points
+    for index in range(len(closures)):
+        for kernel in closures[index][:kernels[index]]:
+            lrps = kernel_closures.get(kernel, None)
+            if lrps is None:
+                lrps = closure_LR1(items, {kernel: dummy_lookahead})
+                kernel_closures[kernel] = lrps
+            targets = propagations.setdefault(index * count_items + kernel, [])
+            for item in lrps:
+                lookahead = lrps[item]
+                if item != kernel:                            # lookaheads of non-kernel LR-points
+                    if dummy in lookahead:
+                        targets.append(index * count_items + item)
+                    lookaheads[index][item].update(s for s in lookahead if s is not dummy)
+                B = nexts[item]
+                if B is None:
+                    continue
+                new_index = gotos[index][B]
+                if dummy in lookahead:                        # lookaheads are propagated
+                    targets.append(new_index * count_items + item + 1)
+                lookaheads[new_index][item + 1].update(s for s in lookahead    # lookaheads are generated spontaneously
+                                                       if s is not dummy)
+    changed = True
+    while changed:                                           # propagate lookaheads
+        changed = False
+        for source_key in propagations:
+            source = lookaheads[source_key // count_items][source_key % count_items]
+            if len(source) == 0:
+                continue
+            for target_key in propagations[source_key]:
+                target = lookaheads[target_key // count_items][target_key % count_items]
+                count = len(target)
+                target |= source
+                if len(target) != count:
+                    changed = True
+    return make_LRStates(items, lookaheads, gotos)
 
 
 class CellSParseTab:
     """
-    CellSParseTab is cell for SParse table
+    CellSParseTab is cell for SParse table.
+    Action and value of cell are packed in one int:
+    code = value << ACTION_BITS | action.
+    Cell is view of code in content of SParse table
+    or of own code if content is not specified.
     """
     vDEF: int                                           # default value
     EMP: int                                            # empty action
@@ -569,13 +835,75 @@ class CellSParseTab:
     RUL: int                                            # apply rule action
     SHF: int                                            # shift action
     GOTO: int                                           # goto action
+    ACTION_BITS: int                                    # count of bits of cell action in code
+    ACTION_MASK: int                                    # mask of cell action in code
     EMP, ACC, RUL, SHF, GOTO = range(0, 5)              # values of cell action
     vDEF = 0                                            # values of cell value
-    action: int                                         # cell action
-    value: int                                          # cell value
+    ACTION_BITS = 3
+    ACTION_MASK = (1 << ACTION_BITS) - 1
+    __slots__ = ('__content', '__pos')
+    __content: array                                    # content with code of cell
+    __pos: int                                          # position of code of cell in content
     def __init__(self, **kwargs):
-        self.action = kwargs.get("action", self.EMP)
-        self.value = kwargs.get("value", self.vDEF)
+        self.__content = kwargs.get("content", None)
+        self.__pos = kwargs.get("pos", 0)
+        if self.__content is None:
+            self.__content = array('i', (self.encode(kwargs.get("action", self.EMP),
+                                                     kwargs.get("value", self.vDEF)),))
+            self.__pos = 0
+
+    @classmethod
+    def encode(cls, action: int, value: int)-> int:
+        """
+        Pack action and value of cell in one int
+        :param action: cell action
+        :param value: cell value
+        :return: code of cell
+        """
+        return value << cls.ACTION_BITS | action
+
+    @classmethod
+    def decode(cls, code: int)-> tuple:
+        """
+        Unpack action and value of cell from one int
+        :param code: code of cell
+        :return: cell action and cell value
+        """
+        return code & cls.ACTION_MASK, code >> cls.ACTION_BITS
+
+    @property
+    def action(self)-> int:
+        """
+        Get cell action
+        :return: cell action
+        """
+        return self.__content[self.__pos] & self.ACTION_MASK
+
+    @action.setter
+    def action(self, value: int)-> None:
+        """
+        Set cell action
+        :param value: cell action
+        :return: None
+        """
+        self.__content[self.__pos] = self.encode(value, self.value)
+
+    @property
+    def value(self)-> int:
+        """
+        Get cell value
+        :return: cell value
+        """
+        return self.__content[self.__pos] >> self.ACTION_BITS
+
+    @value.setter
+    def value(self, value: int)-> None:
+        """
+        Set cell value
+        :param value: cell value
+        :return: None
+        """
+        self.__content[self.__pos] = self.encode(self.action, value)
 
     def __str__(self):
         cond =  True
@@ -603,14 +931,22 @@ class SParseTab:
     """
     SParseTab is table of parsing or
     сanonical matrix of syntax analysis.
+    Matrix is stored by rows in one array of codes of cells,
+    cells returned by table are views of this array.
     """
     __headers: dict                                 # headers of table
-    __content: list                                 # matrix
+    __content: array                                # matrix, codes of cells
+    __rows: int                                     # count of rows
     def __init__(self, **kwargs):
         self.__headers = dict()
-        self.__content = []
+        self.__content = array('i')
+        self.__rows = 0
         self.headers = kwargs.get('headers', ())
-        self.create(kwargs.get('rows', 0))
+        if kwargs.get('content') is None:
+            self.create(kwargs.get('rows', 0))
+        else:                                       # array of codes given as is, e.g. mapped file
+            self.__content = kwargs['content']
+            self.__rows = kwargs.get('rows', 0)
 
     def create(self, rows: int)-> None:
         """
@@ -620,11 +956,12 @@ class SParseTab:
         :return: None
         """
         self.clear()
-        for i in range(rows):
-            self.__content.append([CellSParseTab() for i in range(len(self.__headers))])
+        self.__content = array('i', (0,)) * (rows * len(self.__headers))
+        self.__rows = rows
 
     def clear(self)-> None:
-        self.__content.clear()
+        self.__content = array('i')
+        self.__rows = 0
 
     def cell_ind(self, irow: int, icol: int)-> CellSParseTab:
         """
@@ -632,8 +969,12 @@ class SParseTab:
         :param irow: index of row
         :param icol: index of column
         :return: cell
+        :raise: IndexError
         """
-        return self.__content[irow][icol]
+        if irow >= self.__rows or icol >= len(self.__headers):
+            raise IndexError("Index of cell out of range!!!")
+        return CellSParseTab(content=self.__content,
+                             pos=irow * len(self.__headers) + icol)
 
     def cell_hdr(self, irow: int, ncol)-> CellSParseTab:
         """
@@ -641,8 +982,53 @@ class SParseTab:
         :param irow: index of row
         :param ncol: key of column
         :return: cell
+        :raise: KeyError, IndexError
         """
-        return self.__content[irow][self.__headers[ncol]]
+        return self.cell_ind(irow, self.__headers[ncol])
+
+    def code(self, irow: int, icol: int)-> int:
+        """
+        Get code of cell by index of row and index of column
+        :param irow: index of row
+        :param icol: index of column
+        :return: code of cell
+        """
+        return self.__content[irow * len(self.__headers) + icol]
+
+    def row(self, irow: int)-> memoryview:
+        """
+        Get codes of cells of row, i.e. view of part of matrix
+        :param irow: index of row
+        :return: codes of cells by indices of columns
+        """
+        columns = len(self.__headers)
+        return memoryview(self.__content)[irow * columns: (irow + 1) * columns]
+
+    def column(self, ncol)-> int:
+        """
+        Get index of column by name of column
+        :param ncol: key of column
+        :return: index of column
+        :raise: KeyError
+        """
+        return self.__headers[ncol]
+
+    def columns_tab(self)-> dict:
+        """
+        Get indices of columns by names of columns
+        :return: dict of indices of columns
+        """
+        return self.__headers.copy()
+
+    @property
+    def content(self)-> array:
+        """
+        Get matrix, i.e. array of codes of cells.
+        Code of cell [irow, icol] is placed
+        in position irow * columns + icol.
+        :return: array of codes of cells
+        """
+        return self.__content
 
     @property
     def headers(self)-> tuple:
@@ -671,7 +1057,7 @@ class SParseTab:
         Count of matrix rows
         :return: count of rows
         """
-        return len(self.__content)
+        return self.__rows
 
     @property
     def columns(self)-> int:
@@ -679,14 +1065,342 @@ class SParseTab:
         Count of matrix columns
         :return: count of columns
         """
-        if len(self.__content) > 0:
-            return len(self.__content[0])
+        if self.__rows > 0:
+            return len(self.__headers)
         else:
             return 0
 
 
+class CompressedSParseTab:
+    """
+    CompressedSParseTab is compressed table of parsing:
+        1) most frequent reduction of row is default code of row,
+        so empty cells of row are replaced by this reduction as in yacc,
+        i.e. error is found later, before shift of next token.
+        Rows with empty action in column of empty terminal aren't changed,
+        because empty terminal is tried in empty cells. Default code of
+        other rows is most frequent code of cells of row;
+        2) most frequent goto of column of nterminal is default code
+        of column, goto of column is looked only after reduction, so its
+        empty cells never are looked and they get default code of column too;
+        3) equal rows are merged in one row;
+        4) other cells of rows are placed in one comb vector by
+        row displacement: cell [irow, icol] is placed in position
+        base[irow] + icol of vector, if check of this position
+        is equal irow, else cell has default code of column
+        or default code of row if column hasn't default code.
+    Compression doesn't change results of parsing, but only
+    cells that aren't empty are restored by decompression.
+    """
+    __headers: dict                                 # headers of table
+    __rows: int                                     # count of rows
+    __row_ids: array                                # indices of merged rows by rows
+    __defaults: array                               # default codes of cells by merged rows
+    __column_defaults: array                        # default codes of cells by columns, 0 is no default
+    __bases: array                                  # displacements of merged rows in comb vector
+    __checks: array                                 # owners of positions of comb vector
+    __codes: array                                  # comb vector, codes of cells
+    def __init__(self, **kwargs):
+        self.__headers = dict()
+        self.headers = kwargs.get('headers', ())
+        self.__rows = kwargs.get('rows', 0)
+        self.__row_ids = kwargs.get('row_ids', array('i', (0,)) * self.__rows)
+        self.__defaults = kwargs.get('defaults', array('i', (0,)) if self.__rows > 0 else array('i'))
+        self.__column_defaults = kwargs.get('column_defaults', array('i', (0,)) * len(self.__headers))
+        self.__bases = kwargs.get('bases', array('i', (0,)) * len(self.__defaults))
+        self.__checks = kwargs.get('checks', array('i'))
+        self.__codes = kwargs.get('codes', array('i'))
+
+    @classmethod
+    def compress(cls, sparse_tab: SParseTab, empty_col = None, default_gotos = True):
+        """
+        Create compressed table of parsing by table of parsing
+        :param sparse_tab: table of parsing
+        :param empty_col: index of column of empty terminal or None
+        :param default_gotos: use default codes of columns of nterminals?
+        :return: compressed table of parsing
+        """
+        columns = len(sparse_tab.headers)
+        content = sparse_tab.content
+        emp_code = CellSParseTab.encode(CellSParseTab.EMP, CellSParseTab.vDEF)
+        action_mask = CellSParseTab.ACTION_MASK
+        column_defaults = array('i', (emp_code,)) * columns
+        if default_gotos:
+            for icol in range(columns):                    # most frequent gotos of columns
+                counts = {}
+                for code in content[icol::columns]:
+                    if code & action_mask == CellSParseTab.GOTO:
+                        counts[code] = counts.get(code, 0) + 1
+                if len(counts) > 0:
+                    column_defaults[icol] = max(counts, key=lambda code: (counts[code], -code))
+        merged_rows = {}                                   # indices of merged rows by defaults and cells
+        row_ids = array('i')
+        for irow in range(sparse_tab.rows):                # find defaults and merge equal rows
+            codes = content[irow * columns: (irow + 1) * columns]
+            counts = {}
+            for icol, code in enumerate(codes):
+                if column_defaults[icol] == emp_code:
+                    counts[code] = counts.get(code, 0) + 1
+            reductions = [code for code in counts if code & action_mask == CellSParseTab.RUL]
+            if (len(reductions) > 0 and (empty_col is None or codes[empty_col] == emp_code)
+                    and all(code & action_mask != CellSParseTab.ACC for code in counts)):
+                default = max(reductions, key=lambda code: (counts[code], -code))
+                skipped = (default, emp_code)              # empty cells get default reduction
+            else:
+                default = max(counts, key=lambda code: (counts[code], code == emp_code))
+                skipped = (default,)
+            cells = []
+            for icol, code in enumerate(codes):
+                column_default = column_defaults[icol]
+                if column_default == emp_code:
+                    if code not in skipped:
+                        cells.append((icol, code))
+                elif code != column_default and code != emp_code:
+                    cells.append((icol, code))             # empty gotos aren't looked
+            cells = tuple(cells)
+            row_ids.append(merged_rows.setdefault((default, cells), len(merged_rows)))
+        defaults = array('i', (0,)) * len(merged_rows)
+        bases = array('i', (0,)) * len(merged_rows)
+        exceptions = [None] * len(merged_rows)             # cells of merged rows with not default codes
+        for (default, cells), imrow in merged_rows.items():
+            defaults[imrow] = default
+            exceptions[imrow] = cells
+        checks = array('i')
+        codes = array('i')
+        occupied = 0                                       # bit mask of occupied positions of comb vector
+        first_free = 0                                     # first free position of comb vector
+        for imrow in sorted(range(len(exceptions)),        # place rows in comb vector, first fit
+                            key=lambda imrow: -len(exceptions[imrow])):
+            cells = exceptions[imrow]
+            if len(cells) == 0:
+                continue
+            first_col = cells[0][0]
+            mask = 0                                       # bit mask of cells shifted to first cell
+            for icol, code in cells:
+                mask |= 1 << (icol - first_col)
+            pos = first_free                               # position of first cell
+            while occupied & (mask << pos):
+                pos += 1
+            occupied |= mask << pos
+            base = pos - first_col
+            for icol, code in cells:
+                if base + icol >= len(checks):
+                    count = base + icol + 1 - len(checks)
+                    checks.extend(array('i', (-1,)) * count)
+                    codes.extend(array('i', (0,)) * count)
+                checks[base + icol] = imrow
+                codes[base + icol] = code
+            bases[imrow] = base
+            while occupied >> first_free & 1:
+                first_free += 1
+        return cls(headers=sparse_tab.headers, rows=sparse_tab.rows, row_ids=row_ids,
+                   defaults=defaults, column_defaults=column_defaults,
+                   bases=bases, checks=checks, codes=codes)
+
+    def decompress(self)-> SParseTab:
+        """
+        Create table of parsing by compressed table of parsing
+        :return: table of parsing
+        """
+        sparse_tab = SParseTab(headers=self.headers, rows=self.__rows)
+        content = sparse_tab.content
+        columns = len(self.__headers)
+        for irow in range(self.__rows):
+            for icol in range(columns):
+                content[irow * columns + icol] = self.code(irow, icol)
+        return sparse_tab
+
+    def code(self, irow: int, icol: int)-> int:
+        """
+        Get code of cell by index of row and index of column
+        :param irow: index of row
+        :param icol: index of column
+        :return: code of cell
+        """
+        imrow = self.__row_ids[irow]
+        pos = self.__bases[imrow] + icol
+        if 0 <= pos < len(self.__checks) and self.__checks[pos] == imrow:
+            return self.__codes[pos]
+        return self.__column_defaults[icol] or self.__defaults[imrow]
+
+    def row(self, irow: int):
+        """
+        Get codes of cells of row, i.e. view of row of compressed table
+        :param irow: index of row
+        :return: codes of cells by indices of columns
+        """
+        imrow = self.__row_ids[irow]
+        return RowCompressedSParseTab(imrow=imrow, base=self.__bases[imrow],
+                                      default=self.__defaults[imrow],
+                                      column_defaults=self.__column_defaults,
+                                      checks=self.__checks, codes=self.__codes)
+
+    def cell_ind(self, irow: int, icol: int)-> CellSParseTab:
+        """
+        Get copy of cell by index of row and index of column
+        :param irow: index of row
+        :param icol: index of column
+        :return: cell
+        :raise: IndexError
+        """
+        if irow >= self.__rows or icol >= len(self.__headers):
+            raise IndexError("Index of cell out of range!!!")
+        action, value = CellSParseTab.decode(self.code(irow, icol))
+        return CellSParseTab(action=action, value=value)
+
+    def cell_hdr(self, irow: int, ncol)-> CellSParseTab:
+        """
+        Get copy of cell by index of row and name of column
+        :param irow: index of row
+        :param ncol: key of column
+        :return: cell
+        :raise: KeyError, IndexError
+        """
+        return self.cell_ind(irow, self.__headers[ncol])
+
+    def column(self, ncol)-> int:
+        """
+        Get index of column by name of column
+        :param ncol: key of column
+        :return: index of column
+        :raise: KeyError
+        """
+        return self.__headers[ncol]
+
+    def columns_tab(self)-> dict:
+        """
+        Get indices of columns by names of columns
+        :return: dict of indices of columns
+        """
+        return self.__headers.copy()
+
+    @property
+    def row_ids(self)-> array:
+        """
+        Get indices of merged rows by rows
+        :return: array of indices
+        """
+        return self.__row_ids
+
+    @property
+    def defaults(self)-> array:
+        """
+        Get default codes of cells by merged rows
+        :return: array of codes of cells
+        """
+        return self.__defaults
+
+    @property
+    def column_defaults(self)-> array:
+        """
+        Get default codes of cells by columns,
+        0 (empty cell) is used if column hasn't default code
+        :return: array of codes of cells
+        """
+        return self.__column_defaults
+
+    @property
+    def bases(self)-> array:
+        """
+        Get displacements of merged rows in comb vector
+        :return: array of displacements
+        """
+        return self.__bases
+
+    @property
+    def checks(self)-> array:
+        """
+        Get owners, i.e. indices of merged rows,
+        of positions of comb vector
+        :return: array of indices of merged rows
+        """
+        return self.__checks
+
+    @property
+    def codes(self)-> array:
+        """
+        Get comb vector, i.e. codes of cells
+        :return: array of codes of cells
+        """
+        return self.__codes
+
+    @property
+    def headers(self)-> tuple:
+        """
+        Get headers
+        :return: tuple of headers
+        """
+        return tuple(hdr for hdr in self.__headers)
+
+    @headers.setter
+    def headers(self, value)-> None:
+        """
+        Set headers
+        :param value: list of headers
+        :return: None
+        """
+        self.__headers.clear()
+        ind = 0
+        for e in value:
+            self.__headers[e] = ind
+            ind += 1
+
+    @property
+    def rows(self)-> int:
+        """
+        Count of matrix rows
+        :return: count of rows
+        """
+        return self.__rows
+
+    @property
+    def columns(self)-> int:
+        """
+        Count of matrix columns
+        :return: count of columns
+        """
+        if self.__rows > 0:
+            return len(self.__headers)
+        else:
+            return 0
+
+
+class RowCompressedSParseTab:
+    """
+    RowCompressedSParseTab is view of row of compressed
+    table of parsing, codes of cells are got by indices of columns.
+    """
+    __slots__ = ('__imrow', '__base', '__default', '__column_defaults', '__checks', '__codes')
+    __imrow: int                                    # index of merged row
+    __base: int                                     # displacement of merged row in comb vector
+    __default: int                                  # default code of cells of merged row
+    __column_defaults: array                        # default codes of cells by columns
+    __checks: array                                 # owners of positions of comb vector
+    __codes: array                                  # comb vector, codes of cells
+    def __init__(self, **kwargs):
+        self.__imrow = kwargs.get('imrow', 0)
+        self.__base = kwargs.get('base', 0)
+        self.__default = kwargs.get('default', 0)
+        self.__column_defaults = kwargs.get('column_defaults', array('i'))
+        self.__checks = kwargs.get('checks', array('i'))
+        self.__codes = kwargs.get('codes', array('i'))
+
+    def __getitem__(self, icol: int)-> int:
+        """
+        Get code of cell by index of column
+        :param icol: index of column
+        :return: code of cell
+        """
+        pos = self.__base + icol
+        if 0 <= pos < len(self.__checks) and self.__checks[pos] == self.__imrow:
+            return self.__codes[pos]
+        if icol < len(self.__column_defaults) and self.__column_defaults[icol] != 0:
+            return self.__column_defaults[icol]
+        return self.__default
+
+
 def create_sparse_tab(rules: list, lrstates: list,
-                      term_func, goal_nterm, end_term)-> SParseTab:
+                      term_func, goal_nterm, end_term, headers = None)-> SParseTab:
     """
     Create SParse table.
     Creating by next rules:
@@ -703,15 +1417,19 @@ def create_sparse_tab(rules: list, lrstates: list,
     :param term_func: predicate for definition terminal symbols
     :param goal_nterm: goal nterminal of grammar
     :param end_term: end terminal of grammar
+    :param headers: symbols of columns of table,
+                    if None then symbols of transitions in ascending order
     :return: SParse table
     """
     if len(lrstates) == 0:
         return
-    headers = set()
-    for lrstate in lrstates:         # get all symbols of transitions
-        for key in lrstate.goto:
-            headers.add(key)
-    headers.add(end_term)
+    if headers is None:
+        headers = set()
+        for lrstate in lrstates:         # get all symbols of transitions
+            for key in lrstate.goto:
+                headers.add(key)
+        headers.add(end_term)
+        headers = sorted(headers)
     sparse_tab = SParseTab(headers=headers,         # init matrix
                            rows=len(lrstates))
     for i in range(len(lrstates)):
@@ -778,19 +1496,35 @@ class ReadingSTabFileErr(SParserError):
 
 
 class SParser(ISParser):
-    SID_BYTES = 8
+    SID_BYTES = 4
     MAX_SID = 2 ** (8 * SID_BYTES) - 1
     DEFAULT_TERM_SEGREG = ("'", "'")        # default terminal segregation
     DEFAULT_EXT_GOAL_SIGN = "'"             # default sign for designation extended goal
     DEFAULT_END_TERM = '⊥'                  # default end terminal
     DEFAULT_EMPTY_TERM = 'ε'                # default empty terminal
+    MODE_LR1_TO_LALR1 = "LR1_TO_LALR1"      # build LR(1) states and merge them in LALR(1) states
+    MODE_LALR1 = "LALR1"                    # build LALR(1) states by propagation of lookaheads
+    DEFAULT_MODE = MODE_LR1_TO_LALR1        # default mode of building parsing table
+    GENERATOR_VERSION = "3"                 # version of generator of parsing tables
+    CACHE_FILE_EXT = ".prstab"              # extension of files of cache of parsing tables
+    EMPTY_KIND = -2                         # kind of empty token
+    END_KIND = -1                           # kind of end token
     FILE_KEYWORD_IN_START = "SPARSER"
     FILE_KEYWORD_BEFORE_RULES = "RULES"
     FILE_KEYWORD_BEFORE_HEADERS = "HDRS"
     FILE_KEYWORD_BEFORE_TABLE = "STAB"
+    FILE_KEYWORD_BEFORE_COMPR_TABLE = "CTAB"
+    FILE_KEYWORD_MAPPED = "PRSTAB"          # keyword in start of file of version 2
+    FILE_FORMAT_VERSION = 4                 # version of format of file
+    FILE_ALIGN = 8                          # alignment of arrays in file of version 2
+    __UINT32 = struct.Struct('<I')
+    __UINT64 = struct.Struct('<Q')
+    __CELL = struct.Struct('<BI')           # action and value of cell
     __sid2symbol_tab: dict
     __symbol2sid_tab: dict
+    __next_sid: int                         # id for next new symbol
     __rules: list                           # rules of grammar
+    __nterm_rules: dict                     # index of rules by nterminals
     __tokens: tuple                         # tokens
     __goal_nterm: int                       # goal nterminal symbol
     __end_term: int                         # end terminal symbol
@@ -798,16 +1532,28 @@ class SParser(ISParser):
     __term_segreg: tuple                    # terminal segregation
     __ext_goal_sign: str                    # sign for designation extended goal
     __sparse_tab: SParseTab                 # parsing table
+    __firsts: dict                          # sets of FIRST(...) by symbols
+    __nullables: set                        # set NULLABLE of nterminals
+    __follows: dict                         # sets of FOLLOW(...) by nterminals
+    __parent_links: bool                    # set parents of nodes of parse tree
+    __parse_tabs: tuple                     # tables of parsing by parsing table and rules or None
+    __token_cols: list                      # columns of tokens by kind ids and lexeme ids
+    __token_generation: int                 # generation of lexemes of lexer of columns of tokens
 
     def __init__(self, **kwargs):
         self.__init_symbols_tab()
         self.__rules = list()
+        self.__nterm_rules = dict()
         self.__tokens = tuple()
         self.__goal_nterm = None
         self.__end_term = None
         self.__empty_term = None
         self.__sparse_tab = None
+        self.__token_cols = []
+        self.__token_generation = None
+        self.__reset_grammar_sets()
         self.lexer = kwargs.get("lexer", None)
+        self.parent_links = kwargs.get("parent_links", True)
         self.term_segreg = kwargs.get("term_segreg", self.DEFAULT_TERM_SEGREG)
         self.__ext_goal_sign = self.DEFAULT_EXT_GOAL_SIGN
         tokens = kwargs.get("tokens", None)
@@ -825,26 +1571,59 @@ class SParser(ISParser):
         if not goal_nterm is None:
             self.goal_nterm = goal_nterm
 
-    def __init_symbols_tab(self):
-        self.__symbol2sid_tab = {}
-        self.__sid2symbol_tab = {}
+    def __init_symbols_tab(self, symbols = ()):
+        """
+        Init table of symbols, id of symbol is its index in list of symbols
+        :param symbols: list of symbols
+        :return: None
+        """
+        self.__sid2symbol_tab = dict(enumerate(symbols))
+        self.__symbol2sid_tab = {symbol: sid for sid, symbol in self.__sid2symbol_tab.items()}
+        self.__next_sid = len(self.__sid2symbol_tab)
 
     def __clear_symbols_tab(self):
         self.__sid2symbol_tab.clear()
         self.__symbol2sid_tab.clear()
+        self.__next_sid = 0
 
     def __add_symbol_to_tab(self, symbol: str):
         if symbol not in self.__symbol2sid_tab:
-            min_sid = 0
-            if len(self.__sid2symbol_tab) == self.MAX_SID - min_sid + 1:
-                raise MemoryError('Symbol table in SParser is full!!!')
-            new_sid = lambda: random.randint(min_sid, self.MAX_SID)
-            sid = new_sid()
+            sid = self.__next_sid                   # ids of symbols are dense
             while sid in self.__sid2symbol_tab:
-                sid = new_sid()
+                sid += 1
+            if sid > self.MAX_SID:
+                raise MemoryError('Symbol table in SParser is full!!!')
+            self.__next_sid = sid + 1
             self.__symbol2sid_tab[symbol] = sid
             self.__sid2symbol_tab[sid] = symbol
 
+    def __renumber_symbols(self)-> None:
+        """
+        Renumber ids of symbols of grammar densely and deterministically:
+        terminals go first, then nterminals, each in order of first
+        appearance in end and empty terminals, tokens, goal nterminal and rules.
+        Symbols that are not used by grammar are removed from table of symbols.
+        :return: None
+        """
+        sids = [self.__end_term, self.__empty_term, *self.__tokens, self.__goal_nterm]
+        for rule in self.__rules:
+            sids.append(rule.key)
+            sids.extend(rule.value)
+        sids = [sid for sid in dict.fromkeys(sids) if sid in self.__sid2symbol_tab]
+        sids = [sid for sid in sids if self.__is_terminal(sid)] + \
+               [sid for sid in sids if not self.__is_terminal(sid)]
+        new_sids = {sid: new_sid for new_sid, sid in enumerate(sids)}
+        self.__init_symbols_tab([self.__sid2symbol_tab[sid] for sid in sids])
+        for rule in self.__rules:
+            rule.key = new_sids[rule.key]
+            rule.value = tuple(new_sids[val] for val in rule.value)
+        self.__nterm_rules = index_rules(self.__rules)
+        self.__tokens = tuple(new_sids[sid] for sid in self.__tokens if sid in new_sids)
+        self.__goal_nterm = new_sids.get(self.__goal_nterm)
+        self.__end_term = new_sids.get(self.__end_term)
+        self.__empty_term = new_sids.get(self.__empty_term)
+        self.__reset_grammar_sets()
+
     def __del_symbol_frm_tab(self, symbol: str):
         if symbol in self.__symbol2sid_tab:
             sid = self.__symbol2sid_tab[symbol]
@@ -901,6 +1680,26 @@ class SParser(ISParser):
         :return: None
         """
         self.__lexer = value
+        self.__reset_token_cols()
+
+    @property
+    def parent_links(self)-> bool:
+        """
+        Get flag of setting of parents of nodes of parse tree.
+        Parse tree without parents takes less memory
+        and is freed without cyclic garbage collector.
+        :return: True or False
+        """
+        return self.__parent_links
+
+    @parent_links.setter
+    def parent_links(self, value: bool)-> None:
+        """
+        Set flag of setting of parents of nodes of parse tree
+        :param value: True or False
+        :return: None
+        """
+        self.__parent_links = bool(value)
 
     @property
     def term_segreg(self)-> tuple:
@@ -924,11 +1723,13 @@ class SParser(ISParser):
         :return: None
         """
         self.__term_segreg = tuple(str(value[i]) for i in range(2))
+        self.__reset_grammar_sets()
 
     def clear_tokens(self):
         for sid_tok in self.__tokens:
             self.__del_sid_frm_tab(sid_tok)
         self.__tokens = tuple()
+        self.__reset_grammar_sets()
 
     @property
     def tokens(self)-> tuple:
@@ -961,6 +1762,8 @@ class SParser(ISParser):
             for val in rule.value:
                 self.__del_sid_frm_tab(val)
         self.__rules.clear()
+        self.__nterm_rules.clear()
+        self.__reset_grammar_sets()
 
     @property
     def rules(self) -> list:
@@ -999,6 +1802,8 @@ class SParser(ISParser):
                 ind_rule_value.append(self.__symbol2sid_tab[val])
             ind_rule.value = tuple(ind_rule_value)
             self.__rules.append(ind_rule)
+            index += 1
+        self.__nterm_rules = index_rules(self.__rules)
 
     def parse_rules(self, specification: str) -> None:
         """
@@ -1024,6 +1829,7 @@ class SParser(ISParser):
                 rule.value = tuple(rule_value)
                 self.__rules.append(rule)
                 index += 1
+        self.__nterm_rules = index_rules(self.__rules)
 
     @property
     def goal_nterm(self)-> str:
@@ -1034,6 +1840,7 @@ class SParser(ISParser):
         self.__del_sid_frm_tab(self.__goal_nterm)
         self.__add_symbol_to_tab(value)
         self.__goal_nterm = self.__symbol2sid_tab[value]
+        self.__reset_grammar_sets()
 
     @property
     def end_term(self) -> str:
@@ -1044,6 +1851,7 @@ class SParser(ISParser):
         self.__del_sid_frm_tab(self.__end_term)
         self.__add_symbol_to_tab(value)
         self.__end_term = self.__symbol2sid_tab[value]
+        self.__reset_grammar_sets()
 
     @property
     def empty_term(self) -> str:
@@ -1054,6 +1862,7 @@ class SParser(ISParser):
         self.__del_sid_frm_tab(self.__empty_term)
         self.__add_symbol_to_tab(value)
         self.__empty_term = self.__symbol2sid_tab[value]
+        self.__reset_grammar_sets()
 
     def __is_terminal(self, value: int)-> bool:
         """
@@ -1076,22 +1885,106 @@ class SParser(ISParser):
                     return True
         return False
 
-    def create_sparse_tab(self)-> None:
+    def __reset_grammar_sets(self)-> None:
+        self.__firsts = None
+        self.__nullables = None
+        self.__follows = None
+        self.__reset_parse_tabs()
+
+    def __reset_parse_tabs(self)-> None:
         """
-        Creates parsing table for parser
+        Reset tables of parsing built by parsing table and rules
         :return: None
         """
-        rule = None
+        self.__parse_tabs = None
+        self.__reset_token_cols()
+
+    def __reset_token_cols(self)-> None:
+        """
+        Reset table of columns of tokens of lexer
+        :return: None
+        """
+        self.__token_cols = []
+        self.__token_generation = None
+
+    def __goal_rule(self)-> IndRule:
+        """
+        Find rule of goal nterminal
+        :return: goal rule or first rule if goal rule not found
+        :raise: EmptyRulesError
+        """
         if not self.symbol(self.__goal_nterm) is None:
             for r in self.__rules:              # find goal rule
                 if r.key == self.__goal_nterm:
-                    rule = r
-                    break
-        if rule is None:
-            if len(self.__rules) > 0:
-                rule = self.__rules[0]
-            else:
-                raise EmptyRulesError("List of rules is empty!!!")
+                    return r
+        if len(self.__rules) > 0:
+            return self.__rules[0]
+        raise EmptyRulesError("List of rules is empty!!!")
+
+    def analyze_grammar(self)-> None:
+        """
+        Calculates sets of FIRST(...), NULLABLE and FOLLOW(...)
+        for all symbols of grammar
+        :return: None
+        :raise: EmptyRulesError
+        """
+        goal_nterm = self.__goal_rule().key
+        self.__firsts, self.__nullables = first_sets(self.__rules, self.__is_terminal)
+        self.__follows = follow_sets(self.__rules, self.__firsts, self.__nullables,
+                                     goal_nterm, self.__end_term)
+
+    def first_set(self, symbol: str)-> set:
+        """
+        Get set of FIRST(symbol)
+        :param symbol: symbol of grammar
+        :return: set of terminal symbols
+        """
+        if self.__firsts is None:
+            self.analyze_grammar()
+        return set(self.__sid2symbol_tab[sid]
+                   for sid in self.__firsts.get(self.sid(symbol), set()))
+
+    def follow_set(self, symbol: str)-> set:
+        """
+        Get set of FOLLOW(symbol)
+        :param symbol: nterminal symbol of grammar
+        :return: set of terminal symbols
+        """
+        if self.__follows is None:
+            self.analyze_grammar()
+        return set(self.__sid2symbol_tab[sid]
+                   for sid in self.__follows.get(self.sid(symbol), set()))
+
+    def is_nullable(self, symbol: str)-> bool:
+        """
+        Is empty string derived from symbol?
+        :param symbol: symbol of grammar
+        :return: True or False
+        """
+        if self.__nullables is None:
+            self.analyze_grammar()
+        return self.sid(symbol) in self.__nullables
+
+    def create_sparse_tab(self, mode = DEFAULT_MODE, compressed = False)-> None:
+        """
+        Creates parsing table for parser.
+        Ids of symbols are renumbered before, so that
+        id of symbol is index of its column in table.
+        :param mode: mode of building LALR(1) states:
+            MODE_LR1_TO_LALR1 - LR(1) states are built and
+                                states with common core are merged;
+            MODE_LALR1 - LR(0) states are built and lookaheads
+                         are calculated by their propagation.
+        :param compressed: create compressed parsing table?
+        :return: None
+        :raise: EmptyRulesError, ValueError
+        """
+        if mode not in (self.MODE_LR1_TO_LALR1, self.MODE_LALR1):
+            raise ValueError(f"Unknown mode '{mode}' of building parsing table!!!")
+        self.__renumber_symbols()                                               # terminals get first ids
+        rule = self.__goal_rule()
+        count_symbols = len(self.__sid2symbol_tab)                              # ids are indices of columns
+        self.analyze_grammar()                                                  # calculate FIRST(...) and NULLABLE
         goal_nterm = self.__sid2symbol_tab[rule.key] + self.__ext_goal_sign
         self.__add_symbol_to_tab(goal_nterm)
         goal_nterm = self.__symbol2sid_tab[goal_nterm]
@@ -1099,14 +1992,122 @@ class SParser(ISParser):
         goal_rule = IndRule(goal_nterm, rule.key)
         goal_rule.index = -1
         ext_rules = [goal_rule] + self.__rules.copy()                           # create extended grammar
-        lrpt = LR1Point(rule=goal_rule, iptr=0, lookahead=[end_term])           # create goal LR1-point
-        lrstates = create_LR1States(ext_rules, self.__is_terminal, lrpt)        # create LR1-states of LR1 state machine
-        lrstates = states_LR1_to_LALR1(lrstates)                                # transform LR1-states to LALR1-states
+        ext_nterm_rules = self.__nterm_rules.copy()
+        ext_nterm_rules[goal_nterm] = [goal_rule]
+        items = LRItems(ext_nterm_rules, self.__firsts, self.__nullables)       # create table of LR0-points
+        start_item = items.item(goal_rule, 0)                                   # create goal LR1-point
+        if mode == self.MODE_LALR1:
+            lrstates = create_LALR1States(items, start_item, {end_term})        # create LALR1-states directly
+        else:
+            closures, gotos = create_packed_LR1States(items, start_item,        # create LR1-states of LR1 state machine
+                                                      {end_term})
+            closures, gotos = merge_packed_LR1States(closures, gotos)           # merge LR1-states in LALR1-states
+            lrstates = make_LRStates(items, closures, gotos)
         self.__sparse_tab = create_sparse_tab(ext_rules, lrstates,              # create parsing table
                                               self.__is_terminal,
                                               goal_nterm,
-                                              end_term)
+                                              end_term,
+                                              range(count_symbols))
+        if compressed:
+            self.__sparse_tab = self.__compress_sparse_tab(self.__sparse_tab)
         self.__del_sid_frm_tab(goal_nterm)
+        self.__reset_parse_tabs()
+
+    def __compress_sparse_tab(self, sparse_tab: SParseTab, default_gotos = True)-> CompressedSParseTab:
+        """
+        Compress parsing table, default reductions
+        aren't used in rows where empty terminal is expected
+        :param sparse_tab: parsing table
+        :param default_gotos: use default codes of columns of nterminals?
+        :return: compressed parsing table
+        """
+        empty_col = sparse_tab.columns_tab().get(self.__empty_term, None)
+        return CompressedSParseTab.compress(sparse_tab, empty_col, default_gotos)
+
+    def grammar_hash(self, mode = DEFAULT_MODE, compressed = False)-> str:
+        """
+        Get hash of grammar and settings of building of parsing table.
+        Hash is calculated by rules, tokens, goal nterminal,
+        end and empty terminals, terminal segregation,
+        version of generator and version of format of file,
+        so it doesn't depend on ids of symbols.
+        :param mode: mode of building LALR(1) states
+        :param compressed: is parsing table compressed?
+        :return: hex digest of hash
+        """
+        symbol = self.__sid2symbol_tab.get
+        grammar = {
+            "generator": self.GENERATOR_VERSION,
+            "format": self.FILE_FORMAT_VERSION,
+            "mode": mode,
+            "compressed": bool(compressed),
+            "rules": [[symbol(rule.key), [symbol(val) for val in rule.value]]
+                      for rule in self.__rules],
+            "tokens": sorted(symbol(sid) for sid in self.__tokens),
+            "goal_nterm": self.goal_nterm,
+            "end_term": self.end_term,
+            "empty_term": self.empty_term,
+            "term_segreg": list(self.__term_segreg),
+        }
+        data = json.dumps(grammar, ensure_ascii=False, separators=(',', ':'))
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    def create_sparse_tab_cached(self, cache_dir: str, mode = DEFAULT_MODE, compressed = False)-> bool:
+        """
+        Creates parsing table for parser by cache of parsing tables.
+        Parsing table is read from file of cache directory,
+        which name is hash of grammar. If there is no such file
+        (or it is damaged), then parsing table is created and stored
+        in cache directory atomically.
+        :param cache_dir: path to cache directory
+        :param mode: mode of building LALR(1) states
+        :param compressed: create compressed parsing table?
+        :return: True if parsing table is read from cache else False
+        :raise: EmptyRulesError, ValueError, OSError
+        """
+        if mode not in (self.MODE_LR1_TO_LALR1, self.MODE_LALR1):
+            raise ValueError(f"Unknown mode '{mode}' of building parsing table!!!")
+        filename = os.path.join(cache_dir, self.grammar_hash(mode, compressed) + self.CACHE_FILE_EXT)
+        if os.path.isfile(filename):
+            parser = SParser()                                  # grammar of parser isn't lost
+            try:                                                # if file of cache is damaged
+                parser.read_stab_from_file(filename)
+            except ReadingSTabFileErr:
+                pass
+            else:
+                goal_nterm = self.goal_nterm
+                self.__init_symbols_tab(parser.__sid2symbol_tab.values())
+                self.__rules = parser.__rules
+                self.__nterm_rules = parser.__nterm_rules
+                self.__tokens = parser.__tokens
+                self.__goal_nterm = self.__symbol2sid_tab.get(goal_nterm)
+                self.__end_term = parser.__end_term
+                self.__empty_term = parser.__empty_term
+                self.__term_segreg = parser.__term_segreg
+                self.__sparse_tab = parser.__sparse_tab
+                self.__reset_grammar_sets()
+                return True
+        self.create_sparse_tab(mode, compressed)
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_filename = tempfile.mkstemp(suffix=self.CACHE_FILE_EXT, dir=cache_dir)
+        os.close(fd)
+        try:
+            self.write_stab_to_file(tmp_filename)
+            umask = os.umask(0)                                 # temporary file is private,
+            os.umask(umask)                                     # but cache can be shared
+            os.chmod(tmp_filename, 0o666 & ~umask)
+            os.replace(tmp_filename, filename)                  # store file of cache atomically
+        except BaseException:
+            os.remove(tmp_filename)
+            raise
+        return False
+
+    def is_compressed_sparse_tab(self)-> bool:
+        """
+        Is parsing table of parser compressed?
+        :return: True or False
+        """
+        return isinstance(self.__sparse_tab, CompressedSParseTab)
 
     def parse(self) -> Node:
         """
@@ -1116,118 +2117,372 @@ class SParser(ISParser):
                 EmptyRulesError, ParseSyntaxError,
                 UncorrectSParseTabErr
         """
+        empty_kind = self.EMPTY_KIND
+        parent_links = self.__parent_links
+        rule_keys = [rule.key for rule in self.__rules]             # nterminals of rules
+
+        def shift(token: Token)-> Node:
+            return Node(None, token)                                # shift token in buffer
+
+        def reduce(irule: int, values: list)-> Node:
+            if len(values) > 1:
+                childs = [child for child in values                 # elements for roll up
+                          if child.value is None or child.value.kind != empty_kind]
+                if len(childs) > 1:
+                    node = Node(None, None, childs)                 # add elements as child nodes
+                    if parent_links:
+                        for child in childs:
+                            child.parent = node
+                elif len(childs) == 1:
+                    node = childs[0]
+                else:
+                    node = values[-1]
+            elif len(values) == 1:
+                node = values[0]
+            else:                                                   # empty rule is rolled up
+                node = shift(Token(empty_kind, empty_kind))         # like empty terminal
+            if node.kind is None:
+                node.kind = rule_keys[irule]
+            return node                                             # replace elements to new node
+
+        return self.__parse(shift, reduce)
+
+    def parse_columnar(self)-> ColumnarTree:
+        """
+        Parses tokens and constructs parse tree
+        in columnar form, i.e. in parallel arrays
+        without objects of nodes. Shape of tree is
+        the same as shape of tree returned by parse().
+        :return: columnar parse tree or None if there isn't tokens
+        :raises: NoneLexerError, NoneSParseTabErr,
+                EmptyRulesError, ParseSyntaxError,
+                UncorrectSParseTabErr
+        """
+        tree = ColumnarTree()
+        empty_kind = self.EMPTY_KIND
+        rule_keys = [rule.key for rule in self.__rules]             # nterminals of rules
+        kinds, token_kinds, token_values = tree.kinds, tree.token_kinds, tree.token_values
+        firsts, counts, childs = tree.firsts, tree.counts, tree.childs
+        starts, ends = tree.starts, tree.ends
+
+        def shift(token: Token)-> int:
+            kinds.append(-1)
+            token_kinds.append(token.kind)
+            token_values.append(token.value)
+            firsts.append(len(childs))
+            counts.append(0)
+            if token.kind == empty_kind or token.start is None:
+                starts.append(-1)                                   # token hasn't offsets
+                ends.append(-1)
+            else:
+                starts.append(token.start)
+                ends.append(token.end)
+            return len(kinds) - 1
+
+        def reduce(irule: int, values: list)-> int:
+            if len(values) > 1:
+                inodes = [inode for inode in values if token_kinds[inode] != empty_kind]
+                if len(inodes) > 1:
+                    node = len(kinds)                               # add elements as child nodes
+                    kinds.append(-1)
+                    token_kinds.append(-1)
+                    token_values.append(-1)
+                    firsts.append(len(childs))
+                    counts.append(len(inodes))
+                    childs.extend(inodes)
+                    starts.append(starts[inodes[0]])
+                    ends.append(ends[inodes[-1]])
+                elif len(inodes) == 1:
+                    node = inodes[0]
+                else:
+                    node = values[-1]
+            elif len(values) == 1:
+                node = values[0]
+            else:                                                   # empty rule is rolled up
+                node = shift(Token(empty_kind, empty_kind))         # like empty terminal
+            if kinds[node] == -1:
+                kinds[node] = rule_keys[irule]
+            return node
+
+        root = self.__parse(shift, reduce)
+        if root is None:
+            return None
+        tree.root = root
+        return tree
+
+    def parse_events(self, on_shift = None, on_reduce = None)-> None:
+        """
+        Parses tokens without construction of parse tree.
+        Functions of events are called during parsing:
+            on_shift(token) - token of lexer is shifted, position
+            of token is returned by self.lexer.position(token.start);
+            on_reduce(irule) - symbols are rolled up by rule with index irule,
+            i.e. self.rules[irule].
+        Only stack of states is kept, so memory doesn't depend on size of input.
+        :param on_shift: function of event of shift or None
+        :param on_reduce: function of event of reduce or None
+        :return: None
+        :raises: NoneLexerError, NoneSParseTabErr,
+                EmptyRulesError, ParseSyntaxError,
+                UncorrectSParseTabErr
+        """
+        empty_kind = self.EMPTY_KIND
+
+        def shift(token: Token)-> None:
+            if on_shift is not None and token.kind != empty_kind:
+                on_shift(token)
+
+        def reduce(irule: int, values: list)-> None:
+            if on_reduce is not None:
+                on_reduce(irule)
+
+        self.__parse(shift, reduce, keep_values=False)
+
+    def rule_index(self, rule: str)-> int:
+        """
+        Get index of rule by text of rule,
+        for example 'E -> E + T'
+        :param rule: text of rule
+        :return: index of rule
+        :raise: ValueError
+        """
+        try:
+            key, value = rule.split('->', 1)
+        except ValueError:
+            raise ValueError(f"Uncorrect rule '{rule}'!!!")
+        key = self.__symbol2sid_tab.get(key.strip(), None)
+        value = tuple(self.__symbol2sid_tab.get(val, None) for val in value.split())
+        for irule, ind_rule in enumerate(self.__rules):
+            if ind_rule.key == key and ind_rule.value == value:
+                return irule
+        raise ValueError(f"Rule '{rule}' not found!!!")
+
+    def parse_actions(self, actions: dict, token_value = None):
+        """
+        Parses tokens and evaluates semantic actions of rules
+        during reductions without construction of parse tree.
+        Action of rule is function action(values),
+        where values is list of values of symbols of rule,
+        result of action is value of nterminal of rule.
+        Value of rule without action is value of first symbol
+        or None for empty rule.
+        Value of token is token_value(token) or token
+        if token_value is None; value of empty token is None.
+        :param actions: dict of actions by indices of rules or by texts of rules
+        :param token_value: function of value of token or None
+        :return: value of goal nterminal or None if there isn't tokens
+        :raises: ValueError, NoneLexerError, NoneSParseTabErr,
+                EmptyRulesError, ParseSyntaxError,
+                UncorrectSParseTabErr
+        """
+        rule_actions = [None] * len(self.__rules)           # actions by indices of rules
+        for rule, action in actions.items():
+            irule = self.rule_index(rule) if isinstance(rule, str) else rule
+            if not isinstance(irule, int) or not 0 <= irule < len(rule_actions):
+                raise ValueError(f"Rule with index {irule} not found!!!")
+            rule_actions[irule] = action
+        empty_kind = self.EMPTY_KIND
+
+        def shift(token: Token):
+            if token.kind == empty_kind:
+                return None
+            elif token_value is None:
+                return token
+            return token_value(token)
+
+        def reduce(irule: int, values: list):
+            action = rule_actions[irule]
+            if action is None:
+                return values[0] if len(values) > 0 else None
+            return action(values)
+
+        return self.__parse(shift, reduce)
+
+    def __create_parse_tabs(self)-> tuple:
+        """
+        Create tables of parsing by parsing table and rules,
+        they are kept until parsing table or rules are changed
+        :return: tuple of rows of parsing table, indices of columns by sids,
+                 sids by indices of columns, lengths, nterminals and columns of nterminals of rules
+        """
+        sparse_tab = self.__sparse_tab
+        rows = [sparse_tab.row(irow)                        # codes of cells by states and columns
+                for irow in range(sparse_tab.rows)]
+        hdr_cols = sparse_tab.columns_tab()                 # indices of columns by sids
+        headers = sparse_tab.headers                        # sids by indices of columns
+        rule_lens = [len(rule.value) for rule in self.__rules]          # lengths of rules
+        rule_keys = [rule.key for rule in self.__rules]                 # nterminals of rules
+        rule_cols = [hdr_cols.get(rule.key) for rule in self.__rules]   # columns of nterminals of rules
+        return rows, hdr_cols, headers, rule_lens, rule_keys, rule_cols
+
+    def __parse(self, shift, reduce, keep_values = True):
+        """
+        Parses tokens by parsing table, i.e. drives LR-analysis.
+        Values of symbols are created by functions:
+            shift(token) - create value of shifted token;
+            reduce(irule, values) - create value of nterminal of rule
+            by values of symbols of rule.
+        :param shift: function of shift
+        :param reduce: function of reduce
+        :param keep_values: keep stack of values of symbols?
+                            if False then values aren't kept,
+                            values of reduce is None and result is None
+        :return: value of goal nterminal or None if there isn't tokens
+        :raises: NoneLexerError, NoneSParseTabErr,
+                EmptyRulesError, ParseSyntaxError,
+                UncorrectSParseTabErr
+        """
         if self.lexer is None:
             raise NoneLexerError("Lexer is None!!!")
         elif self.__sparse_tab is None:
             raise NoneSParseTabErr("Parsing table is None!!!")
         elif len(self.__rules) == 0:
             raise EmptyRulesError("List of rules is empty!!!")
-        st_stack = [0]         # stack of states
-        buf = []               # buffer tokens and nodes
-        root = None            # root of parse tree
-        empty_kind, end_kind = range(-2, 0)
-        # create token generator
-        # add end terminal how end token
-        gen_token = merge_ranges(self.lexer.tokens(),
-                      range_objs(Token(end_kind, end_kind)))
-        curr_gen_token = gen_token
-        token = next(curr_gen_token)            # generate first token
-        last_lex = ""                           # last looked lexeme
-        flag = token.kind != end_kind           # if there is still tokens
-        added_empty = False
-        while flag:
-            if token.kind == end_kind:               # transform token to sid_term
-                sid_term = self.__end_term
-            elif token.kind == empty_kind:
-                sid_term = self.__empty_term
-            else:
-                last_lex = self.lexer.lexemes[token.kind][token.value]
-                nline_lex = self.lexer.num_line
-                ncol_lex = self.lexer.num_column
-                sid_term = self.__symbol2sid_tab.get(self.lexer.kinds[token.kind], None)
-                if sid_term is None:
-                    term = self.term_segreg[0] + \
-                           self.lexer.lexemes[token.kind][token.value] + \
-                           self.term_segreg[-1]
-                    try:
-                        sid_term = self.__symbol2sid_tab[term]
-                    except KeyError:
-                        msg = f"Unexcepted '{last_lex}' in line {nline_lex} in column {ncol_lex}!!!"
-                        raise ParseSyntaxError(lexeme=last_lex, num_line=nline_lex,
-                                               num_column=ncol_lex, message=msg)
-            try:
-                # get cell of matrix of syntax analysis
-                cell = self.__sparse_tab.cell_hdr(st_stack[-1], sid_term)
-            except KeyError:
-                raise UncorrectSParseTabErr(f"'{self.__sid2symbol_tab[sid_term]}' " +
-                                            "not found in the SParseTable!!!")
-            if cell.action == cell.SHF:
-                added_empty = False
-                st_stack.append(cell.value)    # go to a new state
-                buf.append(Node(value=token))  # shift token in buffer
+        lexer = self.lexer
+        if self.__parse_tabs is None:
+            self.__parse_tabs = self.__create_parse_tabs()
+        rows, hdr_cols, headers, rule_lens, rule_keys, rule_cols = self.__parse_tabs
+        action_bits = CellSParseTab.ACTION_BITS
+        action_mask = CellSParseTab.ACTION_MASK
+        SHF, RUL, GOTO, ACC = CellSParseTab.SHF, CellSParseTab.RUL, CellSParseTab.GOTO, CellSParseTab.ACC
+        empty_kind, end_kind = self.EMPTY_KIND, self.END_KIND
+        end_col = hdr_cols.get(self.__end_term)             # column of end terminal
+        empty_col = hdr_cols.get(self.__empty_term)         # column of empty terminal
+        token_cols = self.__token_cols                      # columns of tokens by kind ids and lexeme ids
+        if not lexer.keep_lexemes or lexer.lexemes_generation != self.__token_generation:
+            token_cols.clear()                              # ids of lexemes of lexer are changed
+        self.__token_generation = lexer.lexemes_generation
+
+        def token_column(token: Token)-> int:
+            """
+            Find column of token by kind or by lexeme of token
+            and extend table of columns of tokens up to this token
+            :param token: token of lexer
+            :return: index of column or None if there isn't terminal for token
+            :raise: UncorrectSParseTabErr
+            """
+            while len(token_cols) <= token.kind:
+                token_cols.append([])
+            cols = token_cols[token.kind]
+            kind = lexer.kinds[token.kind]
+            lexemes = lexer.lexemes[token.kind]
+            for ilex in range(len(cols), token.value + 1):
+                sid = self.__symbol2sid_tab.get(kind, None)
+                if sid is None:
+                    term = self.term_segreg[0] + lexemes[ilex] + self.term_segreg[-1]
+                    sid = self.__symbol2sid_tab.get(term, None)
+                if sid is None:
+                    cols.append(None)
+                elif sid in hdr_cols:
+                    cols.append(hdr_cols[sid])
+                else:
+                    raise UncorrectSParseTabErr(f"'{self.__sid2symbol_tab[sid]}' " +
+                                                "not found in the SParseTable!!!")
+            return cols[token.value]
+
+        def syntax_error()-> ParseSyntaxError:
+            """
+            Create error of unexcepted last looked lexeme
+            :return: error
+            """
+            last_lex = ""
+            nline_lex, ncol_lex = position
+            if last_token is not None:
+                last_lex = lexer.lexemes[last_token.kind][last_token.value]
+                if last_token.start is not None:
+                    nline_lex, ncol_lex = lexer.position(last_token.start)
+            msg = f"Unexcepted '{last_lex}' in line {nline_lex} in column {ncol_lex}!!!"
+            return ParseSyntaxError(lexeme=last_lex, num_line=nline_lex,
+                                    num_column=ncol_lex, message=msg)
+
+        tokens = iter(lexer.tokens())
+        end_token = Token(end_kind, end_kind)   # end terminal is added how end token
+        empty_token = Token(empty_kind, empty_kind)
+        token = next(tokens, end_token)         # lookahead token
+        next_token = None                       # token after added empty token
+        last_token = None                       # last looked token of lexer
+        position = (None, None)                 # position of last looked token without offsets
+        st_stack = [0]                          # stack of states
+        buf = []                                # stack of values of symbols
+        values = None                           # values for roll up
+        if token is end_token:                  # if there isn't tokens
+            return None
+        while True:
+            kind = token.kind
+            if kind >= 0:                       # transform token to column of terminal
+                if token is not last_token:
+                    last_token = token
+                    if token.start is None:     # lexer doesn't give offsets of tokens
+                        position = (lexer.num_line, lexer.num_column)
                 try:
-                    token = next(curr_gen_token)        # generate new token
-                except StopIteration:
+                    icol = token_cols[kind][token.value]
+                except IndexError:
+                    icol = token_column(token)
+                if icol is None:
+                    raise syntax_error()
+            else:
+                icol = end_col if kind == end_kind else empty_col
+                if icol is None:
+                    sid_term = self.__end_term if kind == end_kind else self.__empty_term
+                    raise UncorrectSParseTabErr(f"'{self.__sid2symbol_tab[sid_term]}' " +
+                                                "not found in the SParseTable!!!")
+            code = rows[st_stack[-1]][icol]         # get cell of matrix of syntax analysis
+            action = code & action_mask
+            if action == SHF:
+                if token is end_token:
                     raise UncorrectSParseTabErr(f"Last looked cell in the " +
-                          f"SParseTable [{st_stack[-2]}]['{self.__sid2symbol_tab[sid_term]}']")
-            elif cell.action == cell.RUL:
-                added_empty = False
-                rule = self.__rules[cell.value]  # roll up by rule
-                if len(rule.value) > 1:
-                    ibuf = len(buf) - len(rule.value)  # index of first element for roll up
-                    childs = []
-                    child = None
-                    for i in range(len(rule.value)):
-                        child = buf.pop(ibuf)
-                        st_stack.pop(-1)
-                        if not child.value is None and\
-                           child.value.kind == empty_kind:
-                            continue
-                        childs.append(child)
-                    if len(childs) > 1:
-                        node = Node()
-                        for child in childs:                # add elements as child nodes
-                            node.childs.append(child)
-                            child.parent = node
-                        buf.append(node)                    # replace elements to new node
-                    elif len(childs) == 1:
-                        buf.append(childs[0])                # replace elements to new node
-                    else:
-                        buf.append(child)
+                          f"SParseTable [{st_stack[-1]}]['{self.__sid2symbol_tab[headers[icol]]}']")
+                st_stack.append(code >> action_bits)    # go to a new state
+                value = shift(token)
+                if keep_values:
+                    buf.append(value)                   # shift value of token in buffer
+                if next_token is None:
+                    token = next(tokens, end_token)     # generate new token
                 else:
-                    st_stack.pop(-1)
-                try:
-                    cell = self.__sparse_tab.cell_hdr(st_stack[-1], rule.key)
-                    if cell.action != cell.GOTO:
-                        raise UncorrectSParseTabErr(f"Action of cell [{st_stack[-2]}]" +
-                                                    f"['{self.__sid2symbol_tab[sid_term]}'] must be GOTO!!!")
-                except KeyError:
-                    raise UncorrectSParseTabErr(f"'{self.__sid2symbol_tab[rule.key]}' " +
+                    token, next_token = next_token, None
+            elif action == RUL:
+                irule = code >> action_bits             # roll up by rule
+                count = rule_lens[irule]                # count is 0 for empty rule
+                del st_stack[len(st_stack) - count:]
+                if keep_values:
+                    values = buf[len(buf) - count:]     # values for roll up
+                    del buf[len(buf) - count:]
+                icol_rule = rule_cols[irule]
+                if icol_rule is None:
+                    raise UncorrectSParseTabErr(f"'{self.__sid2symbol_tab[rule_keys[irule]]}' " +
                                                 "not found in the SParseTable!!!")
-                st_stack.append(cell.value)  # go to new state
-                if buf[-1].kind is None:
-                    buf[-1].kind = rule.key
-            elif cell.action == cell.ACC:
-                root = buf[-1]  # set root
-                return root
+                code = rows[st_stack[-1]][icol_rule]
+                if code & action_mask != GOTO:
+                    raise UncorrectSParseTabErr(f"Action of cell [{st_stack[-1]}]" +
+                                                f"['{self.__sid2symbol_tab[headers[icol_rule]]}'] must be GOTO!!!")
+                st_stack.append(code >> action_bits)    # go to new state
+                value = reduce(irule, values)
+                if keep_values:
+                    buf.append(value)                   # replace values to value of nterminal
+            elif action == ACC:
+                return buf[-1] if keep_values else None     # value of goal nterminal
+            elif next_token is None:                    # try to add empty token
+                next_token = token
+                token = empty_token
             else:
-                if added_empty:
-                    msg = f"Unexcepted '{last_lex}' in line {nline_lex} in column {ncol_lex}!!!"
-                    raise ParseSyntaxError(lexeme=last_lex, num_line=nline_lex,
-                                           num_column=ncol_lex, message=msg)
-                else:
-                    added_empty = True
-                    curr_gen_token = merge_ranges(range_objs(token), gen_token)
-                    token = Token(empty_kind, empty_kind)
-        return root
+                raise syntax_error()
 
-    def write_stab_to_file(self, filename: str, buffering = -1)-> None:
+    def write_stab_to_file(self, filename: str, buffering = -1, compressed = None,
+                           version = FILE_FORMAT_VERSION)-> None:
         """
-        Write rules and SParseTable to file
+        Write rules and SParseTable to file.
+        Content of file is built in memory and written at once.
         :param filename: path to file
+        :param compressed: write compressed SParseTable?
+                           if None then SParseTable is written as is
+        :param version: version of format of file,
+                        1 is format with cells packed one by one,
+                        2 is aligned format for mapping in memory,
+                        3 is format 2 with 32-bit ids of symbols,
+                        4 is format 3 with default gotos of compressed table
         :return: None
         :raises: NoneSParseTabErr, NoneSParseTabErr,
-                EmptyRulesError
+                EmptyRulesError, ValueError
         """
         if self.__sparse_tab is None:
             raise NoneSParseTabErr("Parsing table is None!!!")
@@ -1235,127 +2490,363 @@ class SParser(ISParser):
             raise NoneSParseTabErr("Parsing table is empty!!!")
         elif len(self.__rules) == 0:
             raise EmptyRulesError("List of rules is empty!!!")
+        elif not 1 <= version <= self.FILE_FORMAT_VERSION:
+            raise ValueError(f"Unknown version of format of file {version}!!!")
+        sparse_tab = self.__sparse_tab
+        if compressed is None:
+            compressed = self.is_compressed_sparse_tab()
+        if compressed and not isinstance(sparse_tab, CompressedSParseTab):
+            sparse_tab = self.__compress_sparse_tab(sparse_tab, version >= 4)
+        elif not compressed and isinstance(sparse_tab, CompressedSParseTab):
+            sparse_tab = sparse_tab.decompress()
+        elif compressed and version < 4 and any(sparse_tab.column_defaults):
+            sparse_tab = sparse_tab.decompress()        # default gotos aren't stored in old formats
+        data = bytearray()
+        if version == 1:
+            self.__pack_grammar(data, sparse_tab, 'Q')
+            self.__pack_packed_tab(data, sparse_tab)
+        else:
+            data += self.FILE_KEYWORD_MAPPED.encode().ljust(self.FILE_ALIGN, b'\0')
+            data += self.__UINT32.pack(version)                   # write version of format
+            self.__pack_grammar(data, sparse_tab, 'Q' if version == 2 else 'I')
+            self.__pack_mapped_tab(data, sparse_tab, version)
         with open(filename, 'wb', buffering) as file:
-            data = self.FILE_KEYWORD_IN_START.encode()
-            file.write(struct.pack(f'<{len(data)}s', data))              # write "SPARSER"
-            file.write(struct.pack('<Q', len(self.__symbol2sid_tab)))    # write count symbols
-            for symbol in self.__symbol2sid_tab:                         # write table of symbols
-                sid = self.__symbol2sid_tab[symbol]
-                bsymbol = symbol.encode()
-                file.write(struct.pack(f'<I{len(bsymbol)}sQ', len(bsymbol), bsymbol, sid))
-
-            data = self.FILE_KEYWORD_BEFORE_RULES.encode()
-            file.write(struct.pack(f'<{len(data)}s', data))                  # write "RULES"
-            count_rules = len(self.__rules)
-            file.write(struct.pack(f'<I', count_rules))                      # write count rules
-            for i in range(count_rules):
-                file.write(struct.pack(f'<Q', self.__rules[i].key))          # write key
-                file.write(struct.pack('<I', len(self.__rules[i].value)))    # write count of values in rule
-                for val in self.__rules[i].value:                            # write values
-                    file.write(struct.pack(f'<Q', val))
-
-            file.write(struct.pack('<Q', self.__end_term))        # write end term
-            file.write(struct.pack('<Q', self.__empty_term))      # write empty term
-            file.write(struct.pack('<Q', len(self.__tokens)))     # write count tokens
-            for sid_token in self.__tokens:                       # write tokens
-                file.write(struct.pack('<Q', sid_token))
-
-            for i in range(2):                                    # write term segreg
-                btseg = self.__term_segreg[i].encode()
-                file.write(struct.pack(f'<I{len(btseg)}s', len(btseg), btseg))
-
-            data = self.FILE_KEYWORD_BEFORE_HEADERS.encode()
-            file.write(struct.pack(f'<{len(data)}s', data))    # write "HDRS"
-            hdrs = self.__sparse_tab.headers
-            file.write(struct.pack(f'<I', len(hdrs)))          # write count of hdrs
-            for hdr in hdrs:                                   # write headers
-                file.write(struct.pack(f'<Q', hdr))
-
-            data = self.FILE_KEYWORD_BEFORE_TABLE.encode()
-            file.write(struct.pack(f'<{len(data)}s', data))            # write "TAB"
-            file.write(struct.pack(f'<I', self.__sparse_tab.rows))     # write count of rows
-            for i in range(self.__sparse_tab.rows):                    # write sparse table
-                for j in range(self.__sparse_tab.columns):
-                    cell = self.__sparse_tab.cell_ind(i, j)
-                    file.write(struct.pack(f'<BI', cell.action, cell.value))
-
-    def read_stab_from_file(self, filename: str, buffering = -1)-> None:
-        """
-        Read rules and SParseTable from file
+            file.write(data)
+
+    def __pack_grammar(self, data: bytearray, sparse_tab, sid_code: str)-> None:
+        """
+        Pack symbols, rules, terminals and headers of SParseTable
+        :param data: buffer of content of file
+        :param sparse_tab: SParseTable or CompressedSParseTable
+        :param sid_code: struct code of id of symbol, 'Q' or 'I'
+        :return: None
+        """
+        data += self.FILE_KEYWORD_IN_START.encode()                  # write "SPARSER"
+        data += self.__UINT64.pack(len(self.__sid2symbol_tab))       # write count symbols
+        for sid in sorted(self.__sid2symbol_tab):                    # write table of symbols
+            bsymbol = self.__sid2symbol_tab[sid].encode()
+            data += struct.pack(f'<I{len(bsymbol)}s{sid_code}', len(bsymbol), bsymbol, sid)
+
+        data += self.FILE_KEYWORD_BEFORE_RULES.encode()              # write "RULES"
+        data += self.__UINT32.pack(len(self.__rules))                # write count rules
+        for rule in self.__rules:                                    # write key, count of values and values
+            data += struct.pack(f'<{sid_code}I{len(rule.value)}{sid_code}',
+                                rule.key, len(rule.value), *rule.value)
+
+        data += struct.pack(f'<{sid_code}{sid_code}Q',               # write end term, empty term
+                            self.__end_term, self.__empty_term,      # and count tokens
+                            len(self.__tokens))
+        data += struct.pack(f'<{len(self.__tokens)}{sid_code}', *self.__tokens)  # write tokens
+
+        for i in range(2):                                           # write term segreg
+            btseg = self.__term_segreg[i].encode()
+            data += struct.pack(f'<I{len(btseg)}s', len(btseg), btseg)
+
+        data += self.FILE_KEYWORD_BEFORE_HEADERS.encode()            # write "HDRS"
+        hdrs = sparse_tab.headers
+        data += self.__UINT32.pack(len(hdrs))                        # write count of hdrs
+        data += struct.pack(f'<{len(hdrs)}{sid_code}', *hdrs)        # write headers
+
+    def __pack_packed_tab(self, data: bytearray, sparse_tab)-> None:
+        """
+        Pack SParseTable, cells are packed one by one
+        :param data: buffer of content of file
+        :param sparse_tab: SParseTable or CompressedSParseTable
+        :return: None
+        """
+        def pack_cells(codes)-> None:
+            mask, bits = CellSParseTab.ACTION_MASK, CellSParseTab.ACTION_BITS
+            data.extend(b''.join(map(self.__CELL.pack, (code & mask for code in codes),
+                                     (code >> bits for code in codes))))
+
+        if isinstance(sparse_tab, CompressedSParseTab):
+            data += self.FILE_KEYWORD_BEFORE_COMPR_TABLE.encode()      # write "CTAB"
+            data += struct.pack('<III', sparse_tab.rows,               # write count of rows,
+                                len(sparse_tab.defaults),              # count of merged rows
+                                len(sparse_tab.codes))                 # and size of comb vector
+            self.__pack_array(data, sparse_tab.row_ids)                # write indices of merged rows
+            pack_cells(sparse_tab.defaults)                            # write default cells of merged rows
+            self.__pack_array(data, sparse_tab.bases)                  # write displacements of merged rows
+            self.__pack_array(data, sparse_tab.checks)                 # write owners of comb vector
+            pack_cells(sparse_tab.codes)                               # write comb vector
+        else:
+            data += self.FILE_KEYWORD_BEFORE_TABLE.encode()            # write "STAB"
+            data += self.__UINT32.pack(sparse_tab.rows)                # write count of rows
+            pack_cells(sparse_tab.content)                             # write sparse table
+
+    def __pack_mapped_tab(self, data: bytearray, sparse_tab, version: int)-> None:
+        """
+        Pack SParseTable as aligned arrays of codes of cells,
+        that can be used in place after mapping of file in memory.
+        :param data: buffer of content of file
+        :param sparse_tab: SParseTable or CompressedSParseTable
+        :param version: version of format of file
+        :return: None
+        """
+        def pack_aligned_array(values)-> None:
+            data.extend(bytes(-len(data) % self.FILE_ALIGN))           # align start of array
+            self.__pack_array(data, values)
+
+        if isinstance(sparse_tab, CompressedSParseTab):
+            data += self.FILE_KEYWORD_BEFORE_COMPR_TABLE.encode()      # write "CTAB"
+            data += struct.pack('<III', sparse_tab.rows,               # write count of rows,
+                                len(sparse_tab.defaults),              # count of merged rows
+                                len(sparse_tab.codes))                 # and size of comb vector
+            pack_aligned_array(sparse_tab.row_ids)                     # write indices of merged rows
+            pack_aligned_array(sparse_tab.defaults)                    # write default codes of merged rows
+            pack_aligned_array(sparse_tab.bases)                       # write displacements of merged rows
+            pack_aligned_array(sparse_tab.checks)                      # write owners of comb vector
+            pack_aligned_array(sparse_tab.codes)                       # write comb vector
+            if version >= 4:
+                pack_aligned_array(sparse_tab.column_defaults)         # write default codes of columns
+        else:
+            data += self.FILE_KEYWORD_BEFORE_TABLE.encode()            # write "STAB"
+            data += self.__UINT32.pack(sparse_tab.rows)                # write count of rows
+            pack_aligned_array(sparse_tab.content)                     # write codes of cells
+
+    @staticmethod
+    def __pack_array(data: bytearray, values)-> None:
+        """
+        Pack array of int32 in little-endian order
+        :param data: buffer of content of file
+        :param values: array of int32
+        :return: None
+        """
+        values = array('i', values)
+        if sys.byteorder != 'little':
+            values.byteswap()
+        data += values.tobytes()
+
+    def read_stab_from_file(self, filename: str, buffering = -1, mapped = True)-> None:
+        """
+        Read rules and SParseTable from file.
+        File is read at once and decoded by sections.
+        File of version 2, 3 or 4 is mapped in memory and
+        SParseTable uses arrays of codes of cells in place,
+        so processes that read same file share its memory pages.
+        SParseTable read in this way is read-only.
         :param filename: path to file
+        :param mapped: map file of version 2, 3 or 4 in memory?
+                       if False then arrays of codes are copied
         :return: None
         :raise: ReadingSTabFileErr
         """
         read_err_msg = "Uncorrect format of file that contain SParseTable!!!"
-        def search_keyword(file, keyword: str, err_msg: str)-> None:
-            count_bytes = len(keyword.encode())
-            data = struct.unpack(f'<{count_bytes}s', file.read(count_bytes))[0]
-            if data.decode() != keyword:
-                raise ReadingSTabFileErr(err_msg + " Not found " + keyword + " keyword!!!")
-
         try:
+            self.__reset_grammar_sets()
+            self.__sparse_tab = None
             with open(filename, 'rb', buffering) as file:
-                search_keyword(file, self.FILE_KEYWORD_IN_START, read_err_msg)   # read "SPARSER"
-                count_symbols = struct.unpack('<Q', file.read(8))[0]             # read count symbols
-                self.__symbol2sid_tab.clear()
-                self.__sid2symbol_tab.clear()
-                for i in range(count_symbols):                                   # read table of symbols
-                    len_symbol = struct.unpack('<I', file.read(4))[0]
-                    symbol = struct.unpack(f'<{len_symbol}s', file.read(len_symbol))[0]
-                    sid = struct.unpack(f'<Q', file.read(8))[0]
-                    symbol = symbol.decode()
-                    self.__symbol2sid_tab[symbol] = sid
-                    self.__sid2symbol_tab[sid] = symbol
-
-                search_keyword(file, self.FILE_KEYWORD_BEFORE_RULES, read_err_msg)  # read "RULES"
-                count_rules = struct.unpack('<I', file.read(4))[0]                  # read count rules
-                self.__rules.clear()
-                for irule in range(count_rules):                                    # read rules
-                    rule = IndRule()
-                    rule.index = irule
-                    rule.key = struct.unpack('<Q', file.read(8))[0]                 # read rule key
-                    count_vals = struct.unpack('<I', file.read(4))[0]               # read count of values
-                    vals = []
-                    for ival in range(count_vals):                                  # read rule values
-                        val = struct.unpack(f'<Q', file.read(8))[0]
-                        vals.append(val)
-                    rule.value = tuple(vals)
-                    self.__rules.append(rule)
-
-                self.__end_term = struct.unpack('<Q', file.read(8))[0]              # read end term
-                self.__empty_term = struct.unpack('<Q', file.read(8))[0]            # read empty term
-                len_tokens = struct.unpack('<Q', file.read(8))[0]                   # read count of tokens
-                tokens = []
-                for i in range(len_tokens):                                         # read tokens
-                    sid_token = struct.unpack('<Q', file.read(8))[0]
-                    tokens.append(sid_token)
-                self.__tokens = tuple(tokens)
-
-                term_segreg = []
-                for i in range(2):                                                  # read term segreg
-                    len_tseg = struct.unpack('<I', file.read(4))[0]
-                    tseg = struct.unpack(f'<{len_tseg}s', file.read(len_tseg))[0].decode()
-                    term_segreg.append(tseg)
-                self.__term_segreg = tuple(term_segreg)
-
-                search_keyword(file, self.FILE_KEYWORD_BEFORE_HEADERS, read_err_msg)  # read "HDRS"
-                count_hdrs = struct.unpack('<I', file.read(4))[0]                     # read count of headers
-                hdrs = []
-                for i in range(count_hdrs):                                           # read hdrs
-                    hdr = struct.unpack('<Q', file.read(8))[0]
-                    hdrs.append(hdr)
-
-                search_keyword(file, self.FILE_KEYWORD_BEFORE_TABLE, read_err_msg)  # read "TAB"
-                count_rows = struct.unpack(f'<I', file.read(4))[0]                  # read count of rows
-                sparse_tab = SParseTab(headers=hdrs, rows=count_rows)
-                for i in range(sparse_tab.rows):                                    # read SParseTable
-                    for j in range(sparse_tab.columns):
-                        cell = sparse_tab.cell_ind(i, j)
-                        cell.action, cell.value = struct.unpack('<BI', file.read(5))
-                self.__sparse_tab = sparse_tab
+                keyword = self.FILE_KEYWORD_MAPPED.encode().ljust(self.FILE_ALIGN, b'\0')
+                if file.read(len(keyword)) != keyword:                  # file of version 1
+                    file.seek(0)
+                    buffer = memoryview(file.read())
+                    hdrs, pos = self.__unpack_grammar(buffer, 0, 'Q', read_err_msg)
+                    self.__sparse_tab = self.__unpack_packed_tab(buffer, pos, hdrs, read_err_msg)
+                    return
+                if mapped:
+                    buffer = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+                else:
+                    file.seek(0)
+                    buffer = memoryview(file.read())
+            pos = len(keyword)
+            version, = self.__UINT32.unpack_from(buffer, pos)                # read version of format
+            if not 2 <= version <= self.FILE_FORMAT_VERSION:
+                raise ReadingSTabFileErr(read_err_msg + f" Unknown version {version}!!!")
+            hdrs, pos = self.__unpack_grammar(buffer, pos + self.__UINT32.size,
+                                              'Q' if version == 2 else 'I', read_err_msg)
+            self.__sparse_tab = self.__unpack_mapped_tab(buffer, pos, hdrs, mapped, version, read_err_msg)
         except struct.error as err:
             self.__sparse_tab = None
             raise ReadingSTabFileErr(read_err_msg + f" struct.error: {err}")
+        except KeyError as err:
+            self.__sparse_tab = None
+            raise ReadingSTabFileErr(read_err_msg + f" Unknown id of symbol {err}!!!")
+
+    def __unpack_grammar(self, buffer: memoryview, pos: int, sid_code: str, read_err_msg: str)-> tuple:
+        """
+        Unpack symbols, rules, terminals and headers of SParseTable.
+        Ids of symbols are renumbered densely in order of table of symbols.
+        :param buffer: content of file
+        :param pos: position of start of grammar in buffer
+        :param sid_code: struct code of id of symbol, 'Q' or 'I'
+        :param read_err_msg: message of error of reading
+        :return: headers of SParseTable and position of end of grammar in buffer
+        :raise: ReadingSTabFileErr, struct.error, KeyError
+        """
+        def search_keyword(pos: int, keyword: str)-> int:
+            bkeyword = keyword.encode()
+            if buffer[pos: pos + len(bkeyword)] != bkeyword:
+                raise ReadingSTabFileErr(read_err_msg + " Not found " + keyword + " keyword!!!")
+            return pos + len(bkeyword)
+
+        sid_size = struct.calcsize(f'<{sid_code}')
+        pos = search_keyword(pos, self.FILE_KEYWORD_IN_START)               # read "SPARSER"
+        count_symbols, = self.__UINT64.unpack_from(buffer, pos)              # read count symbols
+        pos += self.__UINT64.size
+        symbols = []
+        new_sids = {}                                                        # new ids by ids in file
+        for i in range(count_symbols):                                       # read table of symbols
+            len_symbol, = self.__UINT32.unpack_from(buffer, pos)
+            symbol, sid = struct.unpack_from(f'<{len_symbol}s{sid_code}', buffer,
+                                             pos + self.__UINT32.size)
+            pos += self.__UINT32.size + len_symbol + sid_size
+            new_sids[sid] = len(symbols)
+            symbols.append(symbol.decode())
+        self.__init_symbols_tab(symbols)
+        self.__goal_nterm = None                                             # goal nterminal isn't stored
+
+        pos = search_keyword(pos, self.FILE_KEYWORD_BEFORE_RULES)           # read "RULES"
+        count_rules, = self.__UINT32.unpack_from(buffer, pos)                # read count rules
+        pos += self.__UINT32.size
+        self.__rules.clear()
+        for irule in range(count_rules):                                     # read rules
+            rule = IndRule()
+            rule.index = irule
+            key, count_vals = struct.unpack_from(f'<{sid_code}I', buffer, pos)  # read key and count of values
+            pos += sid_size + self.__UINT32.size
+            rule.key = new_sids[key]
+            rule.value = tuple(new_sids[val] for val in                         # read values
+                               struct.unpack_from(f'<{count_vals}{sid_code}', buffer, pos))
+            pos += count_vals * sid_size
+            self.__rules.append(rule)
+        self.__nterm_rules = index_rules(self.__rules)
+
+        end_term, empty_term, len_tokens = \
+            struct.unpack_from(f'<{sid_code}{sid_code}Q', buffer, pos)       # read end term, empty term
+        pos += 2 * sid_size + self.__UINT64.size                             # and count of tokens
+        self.__end_term = new_sids[end_term]
+        self.__empty_term = new_sids[empty_term]
+        self.__tokens = tuple(new_sids[sid] for sid in                       # read tokens
+                              struct.unpack_from(f'<{len_tokens}{sid_code}', buffer, pos))
+        pos += len_tokens * sid_size
+
+        term_segreg = []
+        for i in range(2):                                                   # read term segreg
+            len_tseg, = self.__UINT32.unpack_from(buffer, pos)
+            tseg, = struct.unpack_from(f'<{len_tseg}s', buffer, pos + self.__UINT32.size)
+            pos += self.__UINT32.size + len_tseg
+            term_segreg.append(tseg.decode())
+        self.__term_segreg = tuple(term_segreg)
+
+        pos = search_keyword(pos, self.FILE_KEYWORD_BEFORE_HEADERS)         # read "HDRS"
+        count_hdrs, = self.__UINT32.unpack_from(buffer, pos)                 # read count of headers
+        pos += self.__UINT32.size
+        hdrs = [new_sids[hdr] for hdr in                                     # read hdrs
+                struct.unpack_from(f'<{count_hdrs}{sid_code}', buffer, pos)]
+        return hdrs, pos + count_hdrs * sid_size
+
+    def __unpack_packed_tab(self, buffer: memoryview, pos: int, hdrs: list, read_err_msg: str):
+        """
+        Unpack SParseTable, cells are packed one by one
+        :param buffer: content of file
+        :param pos: position of start of SParseTable in buffer
+        :param hdrs: headers of SParseTable
+        :param read_err_msg: message of error of reading
+        :return: SParseTable or CompressedSParseTable
+        :raise: ReadingSTabFileErr, struct.error
+        """
+        def unpack_cells(count: int)-> array:
+            nonlocal pos
+            size = count * self.__CELL.size
+            if pos + size > len(buffer):
+                raise struct.error("unexpected end of file")
+            bits = CellSParseTab.ACTION_BITS
+            codes = array('i', (value << bits | action for action, value
+                                in self.__CELL.iter_unpack(buffer[pos: pos + size])))
+            pos += size
+            return codes
+
+        def unpack_array(count: int):
+            nonlocal pos
+            values, pos = self.__unpack_array(buffer, pos, count, False)
+            return values
+
+        keyword = bytes(buffer[pos: pos + 4]).decode(errors='replace')       # read "STAB" or "CTAB"
+        pos += 4
+        if keyword == self.FILE_KEYWORD_BEFORE_COMPR_TABLE:
+            count_rows, count_mrows, size_comb = struct.unpack_from('<III', buffer, pos)
+            pos += 3 * self.__UINT32.size
+            row_ids = unpack_array(count_rows)                               # read indices of merged rows
+            defaults = unpack_cells(count_mrows)                             # read default cells
+            bases = unpack_array(count_mrows)                                # read displacements
+            checks = unpack_array(size_comb)                                 # read owners of comb vector
+            codes = unpack_cells(size_comb)                                  # read comb vector
+            return CompressedSParseTab(headers=hdrs, rows=count_rows, row_ids=row_ids,
+                                       defaults=defaults, bases=bases,
+                                       checks=checks, codes=codes)
+        elif keyword == self.FILE_KEYWORD_BEFORE_TABLE:
+            count_rows, = self.__UINT32.unpack_from(buffer, pos)             # read count of rows
+            pos += self.__UINT32.size
+            content = unpack_cells(count_rows * len(hdrs))                   # read SParseTable
+            return SParseTab(headers=hdrs, rows=count_rows, content=content)
+        raise ReadingSTabFileErr(read_err_msg + " Not found " +
+                                 self.FILE_KEYWORD_BEFORE_TABLE + " keyword!!!")
+
+    def __unpack_mapped_tab(self, buffer: memoryview, pos: int, hdrs: list,
+                            mapped: bool, version: int, read_err_msg: str):
+        """
+        Unpack SParseTable as aligned arrays of codes of cells.
+        Arrays of mapped file are used in place.
+        :param buffer: content of file
+        :param pos: position of start of SParseTable in buffer
+        :param hdrs: headers of SParseTable
+        :param mapped: use arrays in place?
+        :param version: version of format of file
+        :param read_err_msg: message of error of reading
+        :return: SParseTable or CompressedSParseTable
+        :raise: ReadingSTabFileErr, struct.error
+        """
+        def unpack_aligned_array(count: int):
+            nonlocal pos
+            pos += -pos % self.FILE_ALIGN                                    # skip alignment
+            values, pos = self.__unpack_array(buffer, pos, count, mapped)
+            return values
+
+        keyword = bytes(buffer[pos: pos + 4]).decode(errors='replace')       # read "STAB" or "CTAB"
+        pos += 4
+        if keyword == self.FILE_KEYWORD_BEFORE_COMPR_TABLE:
+            count_rows, count_mrows, size_comb = struct.unpack_from('<III', buffer, pos)
+            pos += 3 * self.__UINT32.size
+            row_ids = unpack_aligned_array(count_rows)                       # read indices of merged rows
+            defaults = unpack_aligned_array(count_mrows)                     # read default codes
+            bases = unpack_aligned_array(count_mrows)                        # read displacements
+            checks = unpack_aligned_array(size_comb)                         # read owners of comb vector
+            codes = unpack_aligned_array(size_comb)                          # read comb vector
+            column_defaults = array('i', (0,)) * len(hdrs)
+            if version >= 4:
+                column_defaults = unpack_aligned_array(len(hdrs))            # read default codes of columns
+            return CompressedSParseTab(headers=hdrs, rows=count_rows, row_ids=row_ids,
+                                       defaults=defaults, column_defaults=column_defaults,
+                                       bases=bases, checks=checks, codes=codes)
+        elif keyword == self.FILE_KEYWORD_BEFORE_TABLE:
+            count_rows, = self.__UINT32.unpack_from(buffer, pos)             # read count of rows
+            pos += self.__UINT32.size
+            content = unpack_aligned_array(count_rows * len(hdrs))           # read codes of cells
+            return SParseTab(headers=hdrs, rows=count_rows, content=content)
+        raise ReadingSTabFileErr(read_err_msg + " Not found " +
+                                 self.FILE_KEYWORD_BEFORE_TABLE + " keyword!!!")
+
+    @staticmethod
+    def __unpack_array(buffer: memoryview, pos: int, count: int, in_place: bool)-> tuple:
+        """
+        Unpack array of int32 in little-endian order
+        :param buffer: content of file
+        :param pos: position of start of array in buffer
+        :param count: count of values
+        :param in_place: use values in place if it is possible?
+        :return: array (or view of buffer) of values and position of end of array
+        :raise: struct.error
+        """
+        size = count * struct.calcsize('<i')
+        if pos + size > len(buffer):
+            raise struct.error("unexpected end of file")
+        if in_place and sys.byteorder == 'little':
+            return buffer[pos: pos + size].cast('i'), pos + size
+        values = array('i')
+        values.frombytes(buffer[pos: pos + size])
+        if sys.byteorder != 'little':
+            values.byteswap()
+        return values, pos + size
 
 
 def print_sparse_tab(parser: SParser, size_cell = 6):
@@ -1366,13 +2857,11 @@ def print_sparse_tab(parser: SParser, size_cell = 6):
         print(f"{str(parser.symbol(hdr)):^{size_cell}}|", end="")
     print()
     print('+' + ('-'*size_cell + '+') * (len(tab.headers) + 1))
-    irow = 0
-    for row in tab._SParseTab__content:
+    for irow in range(tab.rows):
         print(f"|{str(irow):^{size_cell}}|", end="")
-        for e in row:
-            print(f"{str(e):^{size_cell}}|", end="")
+        for icol in range(tab.columns):
+            print(f"{str(tab.cell_ind(irow, icol)):^{size_cell}}|", end="")
         print()
-        irow += 1
     print('+' + ('-' * size_cell + '+') * (len(tab.headers) + 1))
 
 
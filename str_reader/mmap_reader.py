@@ -0,0 +1,127 @@
+from .istr_reader import IStrReader
+import codecs
+import mmap
+
+
+class MmapFileReader(IStrReader):
+    """
+    MmapFileReader is string buffer for reading string data from file
+    mapped in memory. Bytes of file are available without copying by
+    buffer property, so lexer can analyze them without decoding.
+    """
+    DEFAULT_ENCODING = 'utf-8'                       # what encoding for reading from file
+    __file: object                                   # handler of file
+    __buffer: object                                 # bytes of file mapped in memory
+    __encoding: str                                  # encoding of bytes of file
+    __start: int                                     # position of start of data in buffer
+    __pos: int                                       # current position in buffer
+    __decoder: object                                # incremental decoder of bytes of file
+
+    def __init__(self, filename="", **kwargs):
+        super().__init__()
+        self.__file = None
+        self.__buffer = b""
+        self.__encoding = self.DEFAULT_ENCODING
+        self.__start = 0
+        self.__pos = 0
+        self.__decoder = None
+        if len(filename) > 0:
+            self.open(filename, **kwargs)
+
+    def close(self)-> None:
+        """
+        Close file
+        :return: None
+        """
+        if isinstance(self.__buffer, mmap.mmap):
+            self.__buffer.close()
+        self.__buffer = b""
+        if not self.__file is None:
+            self.__file.close()
+        self.__file = None
+
+    def open(self, filename: str, **kwargs)-> None:
+        """
+        Open file and map it in memory
+        :param filename: path to file
+        :param kwargs:
+            :param encoding: what encoding for reading from file
+        :return: None
+        :raises: all exception of file object, LookupError
+        """
+        try:
+            self.close()
+            encoding = codecs.lookup(kwargs.get("encoding", self.DEFAULT_ENCODING)).name
+            self.__file = open(filename, 'rb')
+            if self.__file.seek(0, 2) > 0:                      # empty file can't be mapped
+                self.__buffer = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.__start = 0
+            if encoding == 'utf-8-sig':                         # skip byte order mark
+                encoding = 'utf-8'
+                if self.__buffer[:len(codecs.BOM_UTF8)] == codecs.BOM_UTF8:
+                    self.__start = len(codecs.BOM_UTF8)
+            self.__encoding = encoding
+            self.reset()
+        except Exception as err:
+            self.close()
+            raise err
+
+    @property
+    def buffer(self):
+        """
+        Get bytes of file mapped in memory
+        :return: buffer of bytes
+        """
+        return self.__buffer
+
+    @property
+    def start(self)-> int:
+        """
+        Get position of start of data in buffer,
+        i.e. position after byte order mark
+        :return: position in buffer
+        """
+        return self.__start
+
+    @property
+    def encoding(self)-> str:
+        """
+        Get encoding of bytes of file
+        :return: name of encoding
+        """
+        return self.__encoding
+
+    def reset(self) -> None:
+        """
+        Reset string buffer and position in file to init state.
+        :return: None
+        """
+        self.__pos = self.__start
+        self.__decoder = codecs.getincrementaldecoder(self.__encoding)()
+
+    def read(self, count = 1) -> str:
+        """
+        Read specified number of chars from string buffer read from file.
+        Bytes are decoded by portions of count bytes,
+        so less than count chars can be returned.
+        :param count: number of read chars from string buffer
+        :return: string of read chars
+        :raise: ValueError, UnicodeDecodeError
+        """
+        if count < 1:
+            raise ValueError("count must be greater 0!!!")
+        ans = ""
+        while len(ans) == 0 and self.__pos < len(self.__buffer):
+            data = self.__buffer[self.__pos: self.__pos + count]
+            self.__pos += len(data)                             # update position in buffer
+            ans = self.__decoder.decode(data, self.__pos >= len(self.__buffer))
+        return ans
+
+    def filename(self)-> str:
+        """
+        :return: string filename
+        """
+        return "" if self.__file is None else self.__file.name
+
+    def __del__(self):
+        self.close()
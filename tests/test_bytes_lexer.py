@@ -0,0 +1,121 @@
+import os
+import tempfile
+import unittest
+from str_reader.str_reader import StrReader
+from str_reader.mmap_reader import MmapFileReader
+from lexer.prog_lang_lexer import ProgLangLexer, UnexceptedLexError
+from lexer.bytes_lexer import BytesLexer
+import example_pascalabc_lexer as pas_lexer
+
+
+CODE = """program Привет;
+// комментарий
+var s: string := 'строка';
+{ многострочный
+  комментарий }
+begin
+  writeln(s, 'мир', 12);
+end.
+"""
+
+ASCII_SPECIFICATION = [
+    ('SKIP', r'\s+'),
+    ('SKIP_LINE_COMMENT', r'//.*'),
+    ('STR', r"'[^']*'"),
+    ('ID', r'[_A-Za-z][_A-Za-z\d]*'),
+    ('NUM', r'\d+'),
+    ('OP_ASN', r':='),
+    ('DELIM', r'[:;,()\.]'),
+]
+
+
+def pas_kwargs()-> dict:
+    return dict(specification=pas_lexer.SPECIFICATION,
+                skip_kind=pas_lexer.SKIP_KIND,
+                keyword_kind=pas_lexer.KEYWORD_KIND,
+                id_kind=pas_lexer.ID_KIND,
+                keywords=pas_lexer.KEYWORDS,
+                multitokens=pas_lexer.MULTITOKENS,
+                case_sensitive=pas_lexer.CASE_SENSITIVE)
+
+
+def lexemes(lexer)-> list:
+    return [(lexer.kinds[token.kind], lexer.lexemes[token.kind][token.value],
+             lexer.position(token.start)) for token in lexer.tokens()]
+
+
+class TestEncodings(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def reader(self, code: str, encoding: str)-> MmapFileReader:
+        filename = os.path.join(self.tempdir.name, encoding + ".pas")
+        with open(filename, "w", encoding=encoding, newline='') as file:
+            file.write(code)
+        reader = MmapFileReader(filename, encoding=encoding)
+        self.addCleanup(reader.close)
+        return reader
+
+    def test_single_byte_encoding(self):
+        lexer = BytesLexer(data_reader=self.reader(CODE, 'cp1251'), **pas_kwargs())
+        self.assertEqual(lexemes(lexer),
+                         lexemes(ProgLangLexer(data_reader=StrReader(CODE), **pas_kwargs())))
+
+    def test_multibyte_class(self):
+        lexer = BytesLexer(data_reader=self.reader(CODE, 'utf-8'), **pas_kwargs())
+        with self.assertRaises(ValueError):
+            list(lexer.tokens())
+
+    def test_ascii_classes(self):
+        code = CODE.replace("Привет", "Hello").replace("{", "//").replace("  комментарий }", "")
+        kwargs = dict(specification=ASCII_SPECIFICATION, skip_kind='SKIP', id_kind='ID')
+        lexer = BytesLexer(data_reader=self.reader(code, 'utf-8'), **kwargs)
+        self.assertEqual(lexemes(lexer),
+                         lexemes(ProgLangLexer(data_reader=StrReader(code), **kwargs)))
+
+    def test_undecodable_lexeme(self):
+        specification = ASCII_SPECIFICATION + [('CHAR', r'.')]      # one byte of char
+        lexer = BytesLexer(data_reader=self.reader(CODE, 'utf-8'),
+                           specification=specification, skip_kind='SKIP', id_kind='ID')
+        with self.assertRaises(UnexceptedLexError) as context:
+            list(lexer.tokens())
+        self.assertEqual((context.exception.num_line, context.exception.num_column), (1, 9))
+
+    def test_unexpected_char(self):
+        lexer = BytesLexer(data_reader=self.reader(CODE, 'utf-8'),
+                           specification=ASCII_SPECIFICATION, skip_kind='SKIP', id_kind='ID')
+        with self.assertRaises(UnexceptedLexError) as context:
+            list(lexer.tokens())
+        self.assertEqual(context.exception.data, 'П')
+        self.assertEqual((context.exception.num_line, context.exception.num_column), (1, 9))
+
+    def test_lines(self):
+        kwargs = dict(specification=ASCII_SPECIFICATION + [('TEXT', r'[^;]+')],
+                      skip_kind='SKIP', id_kind='ID')
+        for code in ("x := 'abc\n def';", "x\n\n  y", "x := @\n@ 2;\n", "x := 'a';\n' b'"):
+            with self.subTest(code=code):
+                expected = ProgLangLexer(data_reader=StrReader(code), **kwargs)
+                lexer = BytesLexer(data_reader=self.reader(code, 'utf-8'), **kwargs)
+                try:
+                    tokens = lexemes(expected)
+                except UnexceptedLexError as err:
+                    with self.assertRaises(UnexceptedLexError) as context:
+                        lexemes(lexer)
+                    self.assertEqual((context.exception.num_line, context.exception.num_column),
+                                     (err.num_line, err.num_column))
+                else:
+                    self.assertEqual(lexemes(lexer), tokens)
+
+    def test_string_across_lines(self):
+        lexer = BytesLexer(data_reader=self.reader("x := 'abc\n def';", 'utf-8'),
+                           specification=ASCII_SPECIFICATION, skip_kind='SKIP', id_kind='ID')
+        with self.assertRaises(UnexceptedLexError) as context:
+            list(lexer.tokens())
+        self.assertEqual((context.exception.num_line, context.exception.num_column), (1, 6))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import os
+import tempfile
+import unittest
+from str_reader.file_reader import FileStrReader
+from str_reader.str_reader import StrReader
+from lexer.prog_lang_lexer import ProgLangLexer
+from sparser.sparser import SParser, CompressedSParseTab, SParseTab, ParseSyntaxError
+import example_pascalabc_lexer as pas_lexer
+import example_pascalabc_parser as pas_parser
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CODE_FILENAME = os.path.join(ROOT_DIR, "example_pascalabc_code.pas")
+
+
+def create_lexer(data_reader)-> ProgLangLexer:
+    return ProgLangLexer(data_reader=data_reader,
+                         specification=pas_lexer.SPECIFICATION,
+                         skip_kind=pas_lexer.SKIP_KIND,
+                         keyword_kind=pas_lexer.KEYWORD_KIND,
+                         id_kind=pas_lexer.ID_KIND,
+                         keywords=pas_lexer.KEYWORDS,
+                         multitokens=pas_lexer.MULTITOKENS,
+                         case_sensitive=pas_lexer.CASE_SENSITIVE)
+
+
+def create_parser(compressed: bool)-> SParser:
+    parser = SParser()
+    parser.tokens = pas_parser.TOKENS
+    parser.goal_nterm = pas_parser.GOAL_NTERM
+    parser.end_term = pas_parser.END_TERM
+    parser.empty_term = pas_parser.EMPTY_TERM
+    parser.parse_rules(pas_parser.RULES)
+    parser.create_sparse_tab(SParser.MODE_LALR1, compressed)
+    return parser
+
+
+def parse_events(parser: SParser, data_reader)-> list:
+    """
+    Parse data and get events of parsing or error
+    """
+    events = []
+    parser.lexer = create_lexer(data_reader)
+    try:
+        parser.parse_events(lambda token: events.append((token.kind, token.value, token.start)),
+                            lambda irule: events.append(irule))
+    except ParseSyntaxError as err:
+        events.append(str(err))
+    return events
+
+
+def table_size(sparse_tab)-> int:
+    if isinstance(sparse_tab, SParseTab):
+        return len(sparse_tab.content) * sparse_tab.content.itemsize
+    return sum(len(values) * values.itemsize
+               for values in (sparse_tab.row_ids, sparse_tab.defaults, sparse_tab.column_defaults,
+                              sparse_tab.bases, sparse_tab.checks, sparse_tab.codes))
+
+
+class TestCompressedSParseTab(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = create_parser(False)
+        cls.compressed_parser = create_parser(True)
+
+    def test_size(self):
+        sparse_tab = self.parser._SParser__sparse_tab
+        compressed_tab = self.compressed_parser._SParser__sparse_tab
+        self.assertIsInstance(compressed_tab, CompressedSParseTab)
+        self.assertLess(table_size(compressed_tab) * 10, table_size(sparse_tab))
+
+    def test_parse(self):
+        self.assertEqual(parse_events(self.compressed_parser, FileStrReader(CODE_FILENAME, encoding='utf-8-sig')),
+                         parse_events(self.parser, FileStrReader(CODE_FILENAME, encoding='utf-8-sig')))
+
+    def test_syntax_errors(self):
+        codes = ("program p; begin a := ; end.",
+                 "program p; begin a := 1 2; end.",
+                 "program p; var a: integer begin end.",
+                 "program p; begin if then a := 1; end.",
+                 "program p; begin a := (1 + 2; end.")
+        for code in codes:
+            # default reductions can be applied before error is found,
+            # but the same tokens are shifted and the same error is raised
+            events = [event for event in parse_events(self.compressed_parser, StrReader(code))
+                      if not isinstance(event, int)]
+            self.assertEqual(events, [event for event in parse_events(self.parser, StrReader(code))
+                                      if not isinstance(event, int)])
+            self.assertIsInstance(events[-1], str)
+
+    def test_file_versions(self):
+        expected = parse_events(self.parser, FileStrReader(CODE_FILENAME, encoding='utf-8-sig'))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for version in range(1, SParser.FILE_FORMAT_VERSION + 1):
+                filename = os.path.join(tmp_dir, f"{version}.prstab")
+                self.compressed_parser.write_stab_to_file(filename, version=version)
+                parser = SParser()
+                parser.read_stab_from_file(filename, mapped=False)
+                self.assertEqual(parser.is_compressed_sparse_tab(), version >= 4)
+                self.assertEqual(parse_events(parser, FileStrReader(CODE_FILENAME, encoding='utf-8-sig')),
+                                 expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
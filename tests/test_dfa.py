@@ -0,0 +1,102 @@
+import re
+import unittest
+from lexer.dfa import DFA, NFA, RegexParser, normalize_ranges, invert_ranges, MAX_CHAR
+
+
+PATTERNS = (
+    r'abc', r'a|bc|b', r'[a-c]+', r'[^a-c]', r'[^a-c\n]*', r'[\d_]+', r'[-a]+', r'[a-]+', r'[]a]+',
+    r'[\]]', r'\d+', r'\D+', r'\s+', r'\S+', r'\w+', r'\W', r'.+', r'\x41Ж', r'\n', r'\.\*',
+    r'\{', r'a{', r'a{2}', r'a{2,}', r'a{1,3}', r'a?b', r'(?:ab)+', r'(a|b)*abb', r'a*', r'(a*b*)*c?',
+    r'\d+(\.\d+)?((e|E)(\+|-)?\d+)?', r'[_A-Za-zА-Яа-я][_A-Za-zА-Яа-я\d]*',
+)
+
+STRINGS = ("abc", "aaab", "abababb", "bcb", "a-]a", "]]x", "__12.5e-3", " \t\nx", "x.*{", "a{a",
+           "AЖ", "ЖЖ_ж1", "\n\n", "1.5E+10", "")
+
+
+def longest_match(regex, string: str, pos: int, endpos: int):
+    """
+    Get end of longest lexeme matched by regex of re
+    """
+    for end in range(endpos, pos - 1, -1):
+        if regex.fullmatch(string, pos, end) is not None:
+            return end
+    return None
+
+
+class TestRegexParser(unittest.TestCase):
+    def test_unsupported(self):
+        for pattern in (r'^a', r'a$', r'(?=a)', r'(?P<x>a)', r'a*?', r'a++', r'a??', r'*a', r'+',
+                        r'\b', r'\1', r'[a', r'(a', r'a)', r'a{3,1}', r'a{2000}', r'[z-a]',
+                        r'[a-\d]', r'\x4', r'\u04G0', '\\'):
+            with self.subTest(pattern=pattern):
+                with self.assertRaises(ValueError):
+                    RegexParser(pattern).parse()
+                with self.assertRaises(ValueError):
+                    DFA([('A', 'x'), ('B', pattern)])
+
+    def test_tree(self):
+        self.assertEqual(RegexParser(r'a|[b-c]d*').parse(),
+                         ('alt', (('set', ((0x61, 0x61),)),
+                                  ('cat', (('set', ((0x62, 0x63),)),
+                                           ('rep', ('set', ((0x64, 0x64),)), 0, None))))))
+        self.assertEqual(RegexParser(r'(?:a){2,}').parse(), ('rep', ('set', ((0x61, 0x61),)), 2, None))
+
+    def test_ranges(self):
+        self.assertEqual(normalize_ranges([(5, 7), (0, 2), (3, 3), (6, 9)]), ((0, 3), (5, 9)))
+        self.assertEqual(invert_ranges([(1, 2), (0, 0)]), ((3, MAX_CHAR),))
+        self.assertEqual(invert_ranges([(10, MAX_CHAR)]), ((0, 9),))
+
+
+class TestDFA(unittest.TestCase):
+    def test_patterns(self):
+        for pattern in PATTERNS:
+            dfa = DFA([('A', pattern)])
+            regex = re.compile(pattern, re.ASCII)
+            for string in STRINGS:
+                for pos in range(len(string) + 1):
+                    with self.subTest(pattern=pattern, string=string, pos=pos):
+                        end = longest_match(regex, string, pos, len(string))
+                        mtch = dfa.match(string, pos)
+                        self.assertEqual(None if mtch is None else mtch.end(), end)
+
+    def test_longest_then_first_rule(self):
+        dfa = DFA([('KW', r'if'), ('ID', r'[a-z]+'), ('NUM', r'\d+'), ('REAL', r'\d+\.\d+')])
+        for string, expected in (("if", ('KW', 'if')), ("ifx", ('ID', 'ifx')), ("i", ('ID', 'i')),
+                                 ("12", ('NUM', '12')), ("1.5", ('REAL', '1.5')), ("1.", ('NUM', '1'))):
+            with self.subTest(string=string):
+                mtch = dfa.match(string)
+                self.assertEqual((mtch.lastgroup, mtch.group()), expected)
+        self.assertEqual(DFA([('ID', r'[a-z]+'), ('KW', r'if')]).match("if").lastgroup, 'ID')
+
+    def test_match_bounds(self):
+        dfa = DFA([('A', r'a+'), ('B', r'b')])
+        mtch = dfa.match("baaab", 1, 3)
+        self.assertEqual((mtch.span(), mtch.group(), mtch.lastgroup), ((1, 3), 'aa', 'A'))
+        self.assertEqual(dfa.match("baaab", 1, 100).span(), (1, 4))
+        self.assertEqual(dfa.match("baaab", 4).span(), (4, 5))
+        self.assertIsNone(dfa.match("baaab", 1, 1))
+        self.assertIsNone(dfa.match("baaab", 5))
+        self.assertIsNone(dfa.match("xa"))
+        self.assertEqual(DFA([('A', r'a*')]).match("bab", 1, 1).span(), (1, 1))
+
+    def test_minimization(self):
+        for pattern, count_states in ((r'(a|b)*abb', 4), (r'ab|cb', 3), (r'(a|b)*', 1),
+                                      (r'a*(b|a)*', 1), (r'(a|b)c|d(a|b)', 4)):
+            with self.subTest(pattern=pattern):
+                dfa = DFA([('A', pattern)])
+                nfa = NFA((pattern,))
+                transitions, accepts = DFA._DFA__build(nfa, DFA._DFA__char_bounds(nfa))
+                self.assertLess(dfa.count_states, len(accepts))
+                self.assertEqual(dfa.count_states, count_states)
+                self.assertEqual(len(dfa.transitions), dfa.count_states * dfa.count_classes)
+                self.assertEqual(len(dfa.accepts), dfa.count_states)
+
+    def test_char_classes(self):
+        dfa = DFA([('ID', r'[_A-Za-z]\w*'), ('NUM', r'\d+'), ('SPACE', r'\s+')])
+        self.assertEqual(dfa.names, ('ID', 'NUM', 'SPACE'))
+        self.assertEqual(dfa.count_classes, 4)                  # letters and '_', digits, spaces, other
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from sparser.sparser import SParser, Rule
+
+
+# grammar of expressions without left recursion
+RULES = [Rule('E', 'T', "E'"),
+         Rule("E'", "'+'", 'T', "E'"),
+         Rule("E'"),
+         Rule('T', 'F', "T'"),
+         Rule("T'", "'*'", 'F', "T'"),
+         Rule("T'"),
+         Rule('F', "'('", 'E', "')'"),
+         Rule('F', 'ID')]
+
+
+def create_parser(rules = RULES)-> SParser:
+    return SParser(tokens=('ID',), goal_nterm='E', end_term='⊥', rules=rules)
+
+
+class TestGrammarSets(unittest.TestCase):
+    def test_first_sets(self):
+        parser = create_parser()
+        for symbols, first in ((('E', 'T', 'F'), {"'('", 'ID'}),
+                               (("E'",), {"'+'"}),
+                               (("T'",), {"'*'"}),
+                               (("'+'",), {"'+'"}),
+                               (('ID',), {'ID'})):
+            for symbol in symbols:
+                self.assertEqual(parser.first_set(symbol), first, symbol)
+
+    def test_nullable(self):
+        parser = create_parser()
+        self.assertEqual({symbol for symbol in ('E', "E'", 'T', "T'", 'F', 'ID')
+                          if parser.is_nullable(symbol)}, {"E'", "T'"})
+
+    def test_follow_sets(self):
+        parser = create_parser()
+        for symbols, follow in ((('E', "E'"), {"')'", '⊥'}),
+                                (('T', "T'"), {"'+'", "')'", '⊥'}),
+                                (('F',), {"'+'", "'*'", "')'", '⊥'})):
+            for symbol in symbols:
+                self.assertEqual(parser.follow_set(symbol), follow, symbol)
+
+    def test_nullable_chain(self):
+        # FIRST(...) passes through nullable nterminals
+        parser = create_parser([Rule('S', 'A', 'B', "'c'"),
+                                Rule('A', "'a'"),
+                                Rule('A'),
+                                Rule('B', "'b'"),
+                                Rule('B')])
+        self.assertEqual(parser.first_set('S'), {"'a'", "'b'", "'c'"})
+        self.assertFalse(parser.is_nullable('S'))
+        self.assertEqual(parser.follow_set('A'), {"'b'", "'c'"})
+
+    def test_change_rules(self):
+        parser = create_parser()
+        self.assertTrue(parser.is_nullable("E'"))
+        parser.rules = RULES[:2] + RULES[3:]             # without rule [E' -> ]
+        self.assertFalse(parser.is_nullable("E'"))
+
+
+if __name__ == "__main__":
+    unittest.main()
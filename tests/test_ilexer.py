@@ -0,0 +1,108 @@
+import unittest
+from lexer.ilexer import ILexer, Token
+from lexer.lexer import Lexer
+from str_reader.str_reader import StrReader
+
+
+class WordsLexer(ILexer):
+    """
+    Lexer of words that implements only abstract members of ILexer
+    that must be implemented by every lexer
+    """
+    def __init__(self, data: str):
+        self.__kind_ids = {}
+        self.__kinds = []
+        self.__lexemes = []
+        self.__data = data
+        self.__num_line = 1
+        self.__num_column = 1
+
+    @property
+    def kind_ids(self)-> dict:
+        return self.__kind_ids
+
+    @property
+    def kinds(self)-> list:
+        return self.__kinds
+
+    @property
+    def lexemes(self)-> list:
+        return self.__lexemes
+
+    def _tokens(self):
+        offset = 0
+        for word in self.__data.split(' '):
+            self.__num_column = offset + 1
+            yield Token('NUM' if word.isdigit() else 'WORD', word)
+            offset += len(word) + 1
+
+    @property
+    def num_line(self):
+        return self.__num_line
+
+    @property
+    def num_column(self):
+        return self.__num_column
+
+    @property
+    def data_reader(self):
+        return None
+
+    @data_reader.setter
+    def data_reader(self, value)-> None:
+        pass
+
+
+def id_tokens(lexer: ILexer)-> list:
+    return [(token.kind, token.value) for token in lexer.tokens()]
+
+
+class TestLexemeIds(unittest.TestCase):
+    def test_default_table(self):
+        lexer = WordsLexer("a b 1 a 2 b 1")
+        self.assertEqual(id_tokens(lexer), [(0, 0), (0, 1), (1, 0), (0, 0), (1, 1), (0, 1), (1, 0)])
+        self.assertEqual(lexer.lexemes, [['a', 'b'], ['1', '2']])
+        self.assertEqual(lexer.lexeme_ids, [{'a': 0, 'b': 1}, {'1': 0, '2': 1}])
+        self.assertEqual(id_tokens(lexer), [(0, 0), (0, 1), (1, 0), (0, 0), (1, 1), (0, 1), (1, 0)])
+
+    def test_table_follows_lexemes(self):
+        lexer = WordsLexer("a b")
+        id_tokens(lexer)
+        lexer.lexemes[0].append('c')                        # table of lexemes is changed by lexer
+        lexer.lexemes.append(['x'])
+        self.assertEqual(lexer.lexeme_ids, [{'a': 0, 'b': 1, 'c': 2}, {'x': 0}])
+        lexer.lexemes.clear()
+        self.assertEqual(lexer.lexeme_ids, [])
+
+    def test_lexer(self):
+        lexer = Lexer(data_reader=StrReader("a b a c b"),
+                      specification=[('SPACE', r'\s+'), ('WORD', r'\w+')])
+        tokens = [(token.kind, token.value) for token in lexer.tokens()
+                  if lexer.kinds[token.kind] == 'WORD']
+        self.assertEqual([value for kind, value in tokens], [0, 1, 0, 2, 1])
+        kind = tokens[0][0]
+        self.assertEqual(lexer.lexemes[kind], ['a', 'b', 'c'])
+        self.assertEqual(lexer.lexeme_ids[kind], {'a': 0, 'b': 1, 'c': 2})
+
+
+class TestPosition(unittest.TestCase):
+    def test_default_position(self):
+        lexer = WordsLexer("a bb 1")
+        positions = [lexer.position(token.start) for token in lexer.tokens()]
+        self.assertEqual(positions, [(1, 1), (1, 3), (1, 6)])
+
+    def test_spans(self):
+        code = "ab 12\n  c\n\nd"
+        lexer = Lexer(data_reader=StrReader(code),
+                      specification=[('SPACE', r'\s+'), ('WORD', r'\w+')])
+        tokens = [token for token in lexer.tokens() if lexer.kinds[token.kind] == 'WORD']
+        self.assertEqual([code[token.start: token.end] for token in tokens], ['ab', '12', 'c', 'd'])
+        self.assertEqual([lexer.position(token.start) for token in tokens],
+                         [(1, 1), (1, 4), (2, 3), (4, 1)])
+        self.assertEqual([lexer.position(token.end) for token in tokens],
+                         [(1, 3), (1, 6), (2, 4), (4, 2)])
+        self.assertEqual((lexer.num_line, lexer.num_column), (4, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+from sparser.sparser import SParser, Rule
+import example_pascalabc_parser as pas_parser
+
+
+GRAMMARS = {
+    "expressions": dict(tokens=('ID',), goal_nterm='E', end_term='⊥',
+                        parsing_of_rules="""
+                                         E -> E '+' T |
+                                              T;
+                                         T -> T '*' F |
+                                              F;
+                                         F -> '(' E ')' |
+                                              ID
+                                         """),
+    # shift/reduce conflict of dangling else
+    "dangling else": dict(tokens=('ID',), goal_nterm='S', end_term='⊥',
+                          parsing_of_rules="""
+                                           S -> if ID then S |
+                                                if ID then S else S |
+                                                ID
+                                           """),
+    # LR(1) grammar with reduce/reduce conflict in LALR(1) states
+    "reduce conflict": dict(tokens=(), goal_nterm='S', end_term='⊥',
+                            parsing_of_rules="""
+                                             S -> a E c |
+                                                  a F d |
+                                                  b F c |
+                                                  b E d;
+                                             E -> e;
+                                             F -> e
+                                             """),
+    "empty rules": dict(tokens=('ID',), goal_nterm='S', end_term='⊥',
+                        rules=[Rule('S', 'A', 'B', "';'"),
+                               Rule('A', 'A', 'ID'),
+                               Rule('A'),
+                               Rule('B', "'('", 'A', "')'", 'B'),
+                               Rule('B')]),
+    "PascalABC": dict(tokens=pas_parser.TOKENS, goal_nterm=pas_parser.GOAL_NTERM,
+                      end_term=pas_parser.END_TERM, empty_term=pas_parser.EMPTY_TERM,
+                      parsing_of_rules=pas_parser.RULES),
+}
+
+
+class TestLALR1Modes(unittest.TestCase):
+    """
+    Direct building of LALR(1) states gives the same
+    parsing table as merging of LR(1) states
+    """
+    def stab_file_data(self, grammar: dict, mode: str)-> bytes:
+        parser = SParser(**grammar)
+        parser.create_sparse_tab(mode)
+        with tempfile.TemporaryDirectory() as tempdir:
+            filename = os.path.join(tempdir, "tab.prstab")
+            parser.write_stab_to_file(filename)
+            with open(filename, 'rb') as file:
+                return file.read()
+
+    def test_modes(self):
+        for name, grammar in GRAMMARS.items():
+            with self.subTest(grammar=name):
+                self.assertEqual(self.stab_file_data(grammar, SParser.MODE_LALR1),
+                                 self.stab_file_data(grammar, SParser.MODE_LR1_TO_LALR1))
+
+    def test_unknown_mode(self):
+        parser = SParser(**GRAMMARS["expressions"])
+        with self.assertRaises(ValueError):
+            parser.create_sparse_tab("LR0")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import os
+import unittest
+from str_reader.str_reader import StrReader
+from lexer.lexer import Lexer
+from lexer.prog_lang_lexer import ProgLangLexer
+import example_pascalabc_lexer as pas_lexer
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CODE_FILENAME = os.path.join(ROOT_DIR, "example_pascalabc_code.pas")
+
+
+def lex(code: str, size_read_data: int, engine: str)-> list:
+    """
+    Get kinds, lexemes, spans and positions of tokens of code
+    """
+    lexer = ProgLangLexer(data_reader=StrReader(code),
+                          size_read_data=size_read_data,
+                          engine=engine,
+                          specification=pas_lexer.SPECIFICATION,
+                          skip_kind=pas_lexer.SKIP_KIND,
+                          keyword_kind=pas_lexer.KEYWORD_KIND,
+                          id_kind=pas_lexer.ID_KIND,
+                          keywords=pas_lexer.KEYWORDS,
+                          multitokens=pas_lexer.MULTITOKENS,
+                          case_sensitive=pas_lexer.CASE_SENSITIVE)
+    return [(lexer.kinds[token.kind], lexer.lexemes[token.kind][token.value],
+             token.start, token.end, lexer.position(token.start))
+            for token in lexer.tokens()]
+
+
+class TestStraddle(unittest.TestCase):
+    """
+    Lexemes straddling boundaries of portions of read data
+    are the same as lexemes of whole data
+    """
+    CODES = ("x := 1.5e3;",
+             "{$dir} x",
+             "a // comment\nb",
+             "{ a\n b } 1.5e-3\n(* x\n*) {$d}\ny := 'str';")
+
+    def check(self, code: str, sizes):
+        for engine in Lexer.ENGINES:
+            expected = lex(code, len(code), engine)
+            for size in sizes:
+                with self.subTest(code=code[:20], engine=engine, size=size):
+                    self.assertEqual(lex(code, size, engine), expected)
+
+    def test_lexemes(self):
+        for code in self.CODES:
+            self.check(code, range(1, len(code) + 1))
+
+    def test_code_file(self):
+        with open(CODE_FILENAME, encoding='utf-8-sig') as file:
+            code = file.read()
+        self.check(code, (1, 2, 3, 5, 7, 16, 100, 256))
+
+
+SIMPLE_SPECIFICATION = [('SPACE', r'\s+'), ('NUM', r'\d+'), ('ID', r'[A-Za-z]\w*'), ('OP', r'[-+*/]')]
+
+
+def id_tokens(lexer: Lexer, code: str)-> list:
+    lexer.data_reader = StrReader(code)
+    return [(token.kind, token.value) for token in lexer.tokens()]
+
+
+class TestKeepLexemes(unittest.TestCase):
+    def test_default_clears_tables(self):
+        lexer = Lexer(specification=SIMPLE_SPECIFICATION)
+        self.assertFalse(lexer.keep_lexemes)
+        id_tokens(lexer, "b + a")
+        self.assertEqual(id_tokens(lexer, "a"), [(0, 0)])          # ids start again
+        self.assertEqual(lexer.kinds, ['ID'])
+        self.assertEqual(lexer.lexemes, [['a']])
+
+    def test_keep_lexemes(self):
+        lexer = Lexer(specification=SIMPLE_SPECIFICATION, keep_lexemes=True)
+        first = id_tokens(lexer, "b + a")
+        self.assertEqual(id_tokens(lexer, "b + a"), first)
+        self.assertEqual(first, [(0, 0), (1, 0), (2, 0), (1, 0), (0, 1)])
+        self.assertEqual(id_tokens(lexer, "a - 1"), [(0, 1), (1, 0), (2, 1), (1, 0), (3, 0)])
+        self.assertEqual(id_tokens(lexer, "b + a"), first)
+        self.assertEqual(lexer.kinds, ['ID', 'SPACE', 'OP', 'NUM'])
+        self.assertEqual(lexer.lexemes, [['b', 'a'], [' '], ['+', '-'], ['1']])
+        lexer.clear_lexemes()
+        self.assertEqual(id_tokens(lexer, "1"), [(0, 0)])
+
+    def test_seed_lexemes(self):
+        lexer = Lexer(specification=SIMPLE_SPECIFICATION, keep_lexemes=True, seed_lexemes=True)
+        self.assertEqual(lexer.kinds, ['SPACE', 'NUM', 'ID', 'OP'])
+        self.assertEqual(id_tokens(lexer, "x + 1"), [(2, 0), (0, 0), (3, 0), (0, 0), (1, 0)])
+        self.assertEqual(id_tokens(lexer, "2"), [(1, 1)])
+
+    def test_seed_keywords(self):
+        lexer = ProgLangLexer(specification=SIMPLE_SPECIFICATION, skip_kind='SPACE',
+                              id_kind='ID', keyword_kind='KEYWORD', keywords=('begin', 'end'),
+                              case_sensitive=False, keep_lexemes=True, seed_lexemes=True)
+        keyword_kind = lexer.kind_ids['KEYWORD']
+        self.assertEqual(lexer.lexemes[keyword_kind], ['begin', 'end'])
+        self.assertEqual(id_tokens(lexer, "END x BEGIN"),
+                         [(keyword_kind, 1), (lexer.kind_ids['ID'], 0), (keyword_kind, 0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import unittest
+from sparser.sparser import (Rule, IndRule, LRItems, index_rules, first_sets, closure_LR1,
+                             create_LR1States, states_LR1_to_LALR1, make_LRStates,
+                             create_packed_LR1States, merge_packed_LR1States)
+
+
+def ind_rules(*rules)-> list:
+    ans = []
+    for index, rule in enumerate(rules):
+        ind_rule = IndRule(rule.key, *rule.value)
+        ind_rule.index = index
+        ans.append(ind_rule)
+    return ans
+
+
+def is_terminal(symbol)-> bool:
+    return not symbol[0].isupper()
+
+
+# grammar of expressions with goal rule [S -> E]
+RULES = ind_rules(Rule('S', 'E'),
+                  Rule('E', 'E', '+', 'T'),
+                  Rule('E', 'T'),
+                  Rule('T', 'T', '*', 'F'),
+                  Rule('T', 'F'),
+                  Rule('F', '(', 'E', ')'),
+                  Rule('F', 'id'))
+
+
+def create_items(rules = RULES)-> LRItems:
+    firsts, nullables = first_sets(rules, is_terminal)
+    return LRItems(index_rules(rules), firsts, nullables)
+
+
+class TestRuleIndex(unittest.TestCase):
+    def test_index_rules(self):
+        nterm_rules = index_rules(RULES)
+        self.assertEqual(list(nterm_rules), ['S', 'E', 'T', 'F'])
+        self.assertEqual([rule.index for rule in nterm_rules['E']], [1, 2])
+        self.assertEqual([rule.index for rule in nterm_rules['F']], [5, 6])
+
+    def test_closure(self):
+        items = create_items()
+        start_item = items.item(RULES[0], 0)
+        closure = closure_LR1(items, {start_item: frozenset('$')})
+        lrpoints = {(items.rule(item).index, items.iptrs[item]): set(closure[item])
+                    for item in closure}
+        self.assertEqual(lrpoints, {(0, 0): {'$'},
+                                    (1, 0): {'$', '+'},
+                                    (2, 0): {'$', '+'},
+                                    (3, 0): {'$', '+', '*'},
+                                    (4, 0): {'$', '+', '*'},
+                                    (5, 0): {'$', '+', '*'},
+                                    (6, 0): {'$', '+', '*'}})
+
+    def test_closure_without_nterminal(self):
+        items = create_items()
+        item = items.item(RULES[5], 0)                      # [F -> ●( E )]
+        self.assertEqual(closure_LR1(items, {item: frozenset('$')}), {item: frozenset('$')})
+
+
+# grammar with LR(1) states that have common cores
+CC_RULES = ind_rules(Rule('Z', 'S'),
+                     Rule('S', 'C', 'C'),
+                     Rule('C', 'c', 'C'),
+                     Rule('C', 'd'))
+
+
+def lrstate_content(lrstate)-> tuple:
+    return ({(lrp.rule.index, lrp.iptr): frozenset(lrp.lookahead) for lrp in lrstate.lrpoints},
+            {key: goto_lrst.index for key, goto_lrst in lrstate.goto.items()})
+
+
+class TestMergeLR1States(unittest.TestCase):
+    def test_merge(self):
+        items = create_items(CC_RULES)
+        lrstates = create_LR1States(items, items.item(CC_RULES[0], 0), {'$'})
+        self.assertEqual(len(lrstates), 10)
+        lalr_states = states_LR1_to_LALR1(lrstates)
+        self.assertEqual([lrstate.index for lrstate in lalr_states], list(range(7)))
+        self.assertEqual([lrstate_content(lrstate) for lrstate in lalr_states], [
+            ({(0, 0): {'$'}, (1, 0): {'$'}, (2, 0): {'c', 'd'}, (3, 0): {'c', 'd'}},
+             {'S': 1, 'C': 2, 'c': 3, 'd': 4}),
+            ({(0, 1): {'$'}}, {}),
+            ({(1, 1): {'$'}, (2, 0): {'$'}, (3, 0): {'$'}}, {'C': 5, 'c': 3, 'd': 4}),
+            ({(2, 1): {'$', 'c', 'd'}, (2, 0): {'$', 'c', 'd'}, (3, 0): {'$', 'c', 'd'}},
+             {'C': 6, 'c': 3, 'd': 4}),
+            ({(3, 1): {'$', 'c', 'd'}}, {}),
+            ({(1, 2): {'$'}}, {}),
+            ({(2, 2): {'$', 'c', 'd'}}, {})])
+
+    def test_reverse_transitions(self):
+        items = create_items(CC_RULES)
+        lalr_states = states_LR1_to_LALR1(create_LR1States(items, items.item(CC_RULES[0], 0), {'$'}))
+        for lrstate in lalr_states:                         # every transition is reversed once
+            for key, goto_lrst in lrstate.goto.items():
+                self.assertEqual([rgoto_lrst.index for rgoto_lrst in goto_lrst.rgoto[key]
+                                  if rgoto_lrst is lrstate], [lrstate.index])
+
+
+class TestPackedLRStates(unittest.TestCase):
+    def test_items(self):
+        items = create_items()
+        self.assertEqual(len(items), sum(len(rule.value) + 1 for rule in RULES))
+        item = items.item(RULES[1], 0)                      # [E -> ●E + T]
+        self.assertEqual([items.nexts[item + iptr] for iptr in range(4)], ['E', '+', 'T', None])
+        self.assertEqual([items.iptrs[item + iptr] for iptr in range(4)], [0, 1, 2, 3])
+        self.assertIs(items.rule(item + 3), RULES[1])
+        self.assertEqual(items.firstb(item), (frozenset('+'), False))
+        self.assertIsNone(items.firstb(item + 3))
+
+    def test_interned_lookaheads(self):
+        items = create_items()
+        lookahead = items.lookahead(frozenset('$+'))
+        self.assertIs(items.lookahead(frozenset('+$')), lookahead)
+
+    def test_merge(self):
+        items = create_items(CC_RULES)
+        start_item = items.item(CC_RULES[0], 0)
+        closures, gotos = create_packed_LR1States(items, start_item, {'$'})
+        self.assertEqual(len(closures), 10)
+        self.assertTrue(all(isinstance(item, int) for closure in closures for item in closure))
+        lalr_states = make_LRStates(items, *merge_packed_LR1States(closures, gotos))
+        expected = states_LR1_to_LALR1(create_LR1States(items, start_item, {'$'}))
+        self.assertEqual([lrstate_content(lrstate) for lrstate in lalr_states],
+                         [lrstate_content(lrstate) for lrstate in expected])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+from str_reader.str_reader import StrReader
+from lexer.lexer import Lexer
+from lexer.prog_lang_lexer import ProgLangLexer, MultiTokenBounds, MultiTokenBound
+
+
+SPECIFICATION = [('SKIP', r'\s+'), ('ID', r'[A-Za-z]\w*'), ('NUM', r'\d+'), ('DELIM', r'[;.]')]
+KEYWORDS = ('begin', 'end', 'Var')
+
+
+def lexemes(lexer: ProgLangLexer, code: str)-> list:
+    lexer.data_reader = StrReader(code)
+    return [(lexer.kinds[token.kind], lexer.lexemes[token.kind][token.value])
+            for token in lexer.tokens()]
+
+
+class TestKeywords(unittest.TestCase):
+    def create_lexer(self, **kwargs)-> ProgLangLexer:
+        return ProgLangLexer(specification=SPECIFICATION, skip_kind='SKIP', id_kind='ID',
+                             keyword_kind='KEYWORD', keywords=KEYWORDS, **kwargs)
+
+    def test_case_sensitive(self):
+        lexer = self.create_lexer()
+        self.assertEqual(lexemes(lexer, "begin Begin var Var end;"),
+                         [('KEYWORD', 'begin'), ('ID', 'Begin'), ('ID', 'var'),
+                          ('KEYWORD', 'Var'), ('KEYWORD', 'end'), ('DELIM', ';')])
+
+    def test_case_insensitive(self):
+        lexer = self.create_lexer(case_sensitive=False)
+        self.assertEqual(lexemes(lexer, "BEGIN X begin x VAR eNd."),
+                         [('KEYWORD', 'begin'), ('ID', 'x'), ('KEYWORD', 'begin'), ('ID', 'x'),
+                          ('KEYWORD', 'var'), ('KEYWORD', 'end'), ('DELIM', '.')])
+        self.assertEqual(lexer.lexemes[lexer.kind_ids['KEYWORD']], ['begin', 'var', 'end'])
+
+    def test_keyword_prefix(self):
+        lexer = self.create_lexer(case_sensitive=False)
+        self.assertEqual(lexemes(lexer, "beginning endx"), [('ID', 'beginning'), ('ID', 'endx')])
+
+    def test_cached_folding(self):
+        lexer = self.create_lexer(case_sensitive=False, keep_lexemes=True)
+        self.assertEqual(lexer._fold_identifier("BeGin"), ('begin', True))
+        self.assertIs(lexer._fold_identifier("BeGin"), lexer._fold_identifier("BeGin"))
+        self.assertEqual(lexer._fold_identifier("Xy"), ('xy', False))
+
+    def test_change_keywords(self):
+        lexer = self.create_lexer(case_sensitive=False, keep_lexemes=True)
+        self.assertEqual(lexemes(lexer, "X begin"), [('ID', 'x'), ('KEYWORD', 'begin')])
+        lexer.keywords = ('x',)                             # cache of identifiers is cleared
+        self.assertEqual(lexemes(lexer, "X begin"), [('KEYWORD', 'x'), ('ID', 'begin')])
+        lexer.case_sensitive = True
+        self.assertEqual(lexemes(lexer, "X x"), [('ID', 'X'), ('KEYWORD', 'x')])
+
+    def test_cleared_lexemes(self):
+        lexer = self.create_lexer(case_sensitive=False)
+        for code in ("Begin y", "y BEGIN", "begin"):
+            with self.subTest(code=code):
+                expected = [('KEYWORD', 'begin') if value.lower() == 'begin' else ('ID', value.lower())
+                            for value in code.split()]
+                self.assertEqual(lexemes(lexer, code), expected)
+
+
+MULTITOKENS = {
+    'SKIP_COMMENT1': MultiTokenBounds(MultiTokenBound('{', r'{'), MultiTokenBound('}', r'}')),
+    'SKIP_COMMENT2': MultiTokenBounds(MultiTokenBound('(*', r'\(\*'), MultiTokenBound('*)', r'\*\)')),
+    'BLOCK': MultiTokenBounds(MultiTokenBound('<<', r'<<'), MultiTokenBound('>>', r'>>')),
+}
+
+MULTITOKEN_SPECIFICATION = SPECIFICATION + [('SKIP_COMMENT1', r'{'), ('SKIP_COMMENT2', r'\(\*'),
+                                            ('BLOCK', r'<<'), ('PAREN', r'[()]')]
+
+
+def multitokens(code: str, size_read_data: int, engine: str)-> list:
+    """
+    Get kinds, lexemes, spans and positions of tokens of code with multitokens
+    """
+    lexer = ProgLangLexer(data_reader=StrReader(code), size_read_data=size_read_data, engine=engine,
+                          specification=MULTITOKEN_SPECIFICATION, skip_kind='SKIP', id_kind='ID',
+                          multitokens=MULTITOKENS)
+    return [(lexer.kinds[token.kind], lexer.lexemes[token.kind][token.value],
+             token.start, token.end, lexer.position(token.start))
+            for token in lexer.tokens()]
+
+
+class TestMultitokens(unittest.TestCase):
+    def check(self, code: str, expected: list):
+        for engine in Lexer.ENGINES:
+            for size in range(1, len(code) + 1):           # end lexemes straddle portions of data
+                with self.subTest(code=code, engine=engine, size=size):
+                    self.assertEqual(multitokens(code, size, engine), expected)
+
+    def test_skipped_comments(self):
+        self.check("a { b\n c } d (* e\n) *\n*) f",
+                   [('ID', 'a', 0, 1, (1, 1)), ('ID', 'd', 11, 12, (2, 6)),
+                    ('ID', 'f', 25, 26, (4, 4))])
+
+    def test_multitoken(self):
+        self.check("x << y >\n> z >>;\n(y)",
+                   [('ID', 'x', 0, 1, (1, 1)), ('BLOCK', '<< y >\n> z >>', 2, 15, (1, 3)),
+                    ('DELIM', ';', 15, 16, (2, 7)), ('PAREN', '(', 17, 18, (3, 1)),
+                    ('ID', 'y', 18, 19, (3, 2)), ('PAREN', ')', 19, 20, (3, 3))])
+
+    def test_nested_start_lexeme(self):
+        self.check("(* { *) a { (* } b", [('ID', 'a', 8, 9, (1, 9)), ('ID', 'b', 17, 18, (1, 18))])
+
+    def test_unterminated(self):
+        self.check("a (* b\n", [('ID', 'a', 0, 1, (1, 1))])
+        self.check("a << b\nc", [('ID', 'a', 0, 1, (1, 1)), ('BLOCK', '<< b\nc', 2, 8, (1, 3))])
+
+    def test_lines_after_multitoken(self):
+        code = "{\n\n}a\n{}\nb"
+        lexer = ProgLangLexer(data_reader=StrReader(code), specification=MULTITOKEN_SPECIFICATION,
+                              skip_kind='SKIP', id_kind='ID', multitokens=MULTITOKENS)
+        positions = []
+        for token in lexer.tokens():
+            positions.append((lexer.num_line, lexer.num_column))
+        self.assertEqual(positions, [(3, 2), (5, 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from array import array
+from sparser.sparser import SParseTab, CellSParseTab
+
+
+class TestCellSParseTab(unittest.TestCase):
+    def test_codes(self):
+        for action in (CellSParseTab.EMP, CellSParseTab.ACC, CellSParseTab.RUL,
+                       CellSParseTab.SHF, CellSParseTab.GOTO):
+            for value in (0, 1, 1000, 2 ** 20):
+                code = CellSParseTab.encode(action, value)
+                self.assertEqual(CellSParseTab.decode(code), (action, value))
+
+    def test_own_code(self):
+        cell = CellSParseTab(action=CellSParseTab.SHF, value=7)
+        self.assertEqual((cell.action, cell.value), (CellSParseTab.SHF, 7))
+        cell.value = 9
+        cell.action = CellSParseTab.GOTO
+        self.assertEqual((cell.action, cell.value), (CellSParseTab.GOTO, 9))
+        self.assertEqual(str(cell), "9")
+
+
+class TestSParseTab(unittest.TestCase):
+    def create_tab(self)-> SParseTab:
+        return SParseTab(headers=('a', 'b', 'E'), rows=2)
+
+    def test_create(self):
+        tab = self.create_tab()
+        self.assertEqual((tab.rows, tab.columns), (2, 3))
+        self.assertEqual(list(tab.content), [0] * 6)
+        self.assertEqual(tab.headers, ('a', 'b', 'E'))
+        self.assertEqual(tab.columns_tab(), {'a': 0, 'b': 1, 'E': 2})
+        self.assertEqual(SParseTab(headers=('a',)).columns, 0)
+
+    def test_cells_are_views(self):
+        tab = self.create_tab()
+        cell = tab.cell_hdr(1, 'b')
+        cell.action = cell.RUL
+        cell.value = 3
+        self.assertEqual(tab.code(1, 1), CellSParseTab.encode(CellSParseTab.RUL, 3))
+        self.assertEqual(tab.content[1 * 3 + 1], tab.code(1, 1))
+        self.assertEqual(list(tab.row(1)), [0, tab.code(1, 1), 0])
+        self.assertEqual(str(tab.cell_ind(1, tab.column('b'))), "r3")
+
+    def test_out_of_range(self):
+        tab = self.create_tab()
+        with self.assertRaises(IndexError):
+            tab.cell_ind(2, 0)
+        with self.assertRaises(IndexError):
+            tab.cell_ind(0, 3)
+        with self.assertRaises(KeyError):
+            tab.cell_hdr(0, 'c')
+
+    def test_content(self):
+        tab = self.create_tab()
+        codes = [CellSParseTab.encode(CellSParseTab.SHF, i) for i in range(6)]
+        tab = SParseTab(headers=tab.headers, rows=2, content=array('i', codes))
+        self.assertEqual(tab.cell_ind(1, 2).value, 5)
+        tab.clear()
+        self.assertEqual((tab.rows, len(tab.content)), (0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
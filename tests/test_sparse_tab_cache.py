@@ -0,0 +1,43 @@
+import os
+import stat
+import sys
+import tempfile
+import unittest
+from sparser.sparser import SParser
+
+
+RULES = """
+         E -> E '+' T |
+              T;
+         T -> T '*' F |
+              F;
+         F -> '(' E ')' |
+              ID
+        """
+
+
+def create_parser()-> SParser:
+    return SParser(tokens=('ID',), goal_nterm="E", end_term='⊥', parsing_of_rules=RULES)
+
+
+class TestSParseTabCache(unittest.TestCase):
+    def test_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.assertFalse(create_parser().create_sparse_tab_cached(cache_dir))
+            self.assertTrue(create_parser().create_sparse_tab_cached(cache_dir))
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+    @unittest.skipIf(sys.platform == "win32", "permissions of files are POSIX")
+    def test_permissions(self):
+        umask = os.umask(0o022)
+        try:
+            with tempfile.TemporaryDirectory() as cache_dir:
+                create_parser().create_sparse_tab_cached(cache_dir)
+                filename = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+                self.assertEqual(stat.S_IMODE(os.stat(filename).st_mode), 0o644)
+        finally:
+            os.umask(umask)
+
+
+if __name__ == "__main__":
+    unittest.main()
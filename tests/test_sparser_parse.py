@@ -0,0 +1,276 @@
+import unittest
+from str_reader.str_reader import StrReader
+from lexer.prog_lang_lexer import ProgLangLexer
+from sparser.isparser import Node
+from sparser.sparser import (SParser, Rule, ColumnarTree, CellSParseTab,
+                             ParseSyntaxError, UncorrectSParseTabErr)
+
+
+SPECIFICATION = [
+    ('SKIP', r'[\s\t]+'),
+    ('ID', r'[_A-Za-z][_A-Za-z\d]*'),
+    ('NUM', r'\d+'),
+    ('OP', r'[-\+\*/]'),
+    ('DELIM', r'[;()]'),
+]
+
+RULES = """
+         E -> E '+' T |
+              E '-' T |
+              T;
+         T -> T '*' F |
+              F;
+         F -> '(' E ')' |
+              ID |
+              NUM
+        """
+
+
+def create_lexer(code: str, **kwargs)-> ProgLangLexer:
+    return ProgLangLexer(data_reader=StrReader(code), specification=SPECIFICATION,
+                         skip_kind='SKIP', id_kind='ID', **kwargs)
+
+
+def create_parser(rules: str, **kwargs)-> SParser:
+    parser = SParser(tokens=('ID', 'NUM'), goal_nterm=kwargs.pop("goal_nterm", "E"),
+                     end_term='⊥', parsing_of_rules=rules, **kwargs)
+    parser.create_sparse_tab()
+    return parser
+
+
+def reductions(parser: SParser)-> list:
+    """
+    Parse tokens and get texts of reduced rules
+    """
+    rules = parser.rules
+    events = []
+    parser.parse_events(on_reduce=lambda irule: events.append(str(rules[irule])))
+    return events
+
+
+class TestParseTabs(unittest.TestCase):
+    def test_keep_lexemes(self):
+        lexer = create_lexer("", keep_lexemes=True)
+        parser = create_parser(RULES, lexer=lexer)
+        for code in ("a + 1", "(b * a) - 2", "a + b * c", "1 * (2 + c)"):
+            lexer.data_reader = StrReader(code)
+            expected = create_parser(RULES, lexer=create_lexer(code))
+            self.assertEqual(reductions(parser), reductions(expected))
+
+    def test_cleared_lexemes(self):
+        lexer = create_lexer("a + b", keep_lexemes=True)
+        parser = create_parser(RULES, lexer=lexer)
+        self.assertIn("E -> E '+' T", reductions(parser))
+        lexer.clear_lexemes()
+        lexer.data_reader = StrReader("a - b")
+        list(lexer.tokens())                        # the same counts of lexemes, but other lexemes
+        self.assertEqual(reductions(parser), reductions(create_parser(RULES, lexer=create_lexer("a - b"))))
+
+    def test_lexemes_generation(self):
+        lexer = create_lexer("a + b", keep_lexemes=True)
+        generation = lexer.lexemes_generation
+        list(lexer.tokens())
+        self.assertEqual(lexer.lexemes_generation, generation)
+        lexer.clear_lexemes()
+        self.assertNotEqual(lexer.lexemes_generation, generation)
+        generation = lexer.lexemes_generation
+        lexer.keep_lexemes = False
+        list(lexer.tokens())                        # tables are cleared by every analysis
+        self.assertNotEqual(lexer.lexemes_generation, generation)
+
+    def test_change_lexer(self):
+        parser = create_parser(RULES, lexer=create_lexer("a + 1"))
+        first = reductions(parser)
+        parser.lexer = create_lexer("(1) * a")        # other ids of kinds and lexemes
+        self.assertEqual(reductions(parser),
+                         reductions(create_parser(RULES, lexer=create_lexer("(1) * a"))))
+        parser.lexer = create_lexer("a + 1")
+        self.assertEqual(reductions(parser), first)
+
+    def test_change_rules(self):
+        parser = create_parser(RULES, lexer=create_lexer("a - 1"))
+        reductions(parser)
+        parser.parse_rules("""
+                           E -> E '-' F |
+                                F;
+                           F -> ID |
+                                NUM
+                           """)
+        parser.tokens = ('ID', 'NUM')
+        parser.goal_nterm = "E"
+        parser.create_sparse_tab()
+        self.assertEqual(reductions(parser), ["F -> ID", "E -> F", "F -> NUM", "E -> E '-' F"])
+        parser.lexer = create_lexer("a * 1")
+        with self.assertRaises(ParseSyntaxError):
+            parser.parse()
+
+    def test_uncorrect_goto(self):
+        parser = create_parser(RULES, lexer=create_lexer("a"))
+        parser._SParser__sparse_tab.cell_hdr(0, parser.sid('T')).action = CellSParseTab.EMP
+        with self.assertRaises(UncorrectSParseTabErr) as context:
+            parser.parse()
+        self.assertIn("[0]['T'] must be GOTO", str(context.exception))
+
+
+class TestParseTree(unittest.TestCase):
+    CODE = "a + 12 * b"
+
+    def test_node(self):
+        childs = [Node('T'), Node('F')]
+        node = Node('E', None, childs)
+        self.assertIs(node.childs, childs)                      # list isn't copied
+        leaf = Node('F')
+        self.assertIsNone(leaf._Node__childs)                   # leaf hasn't list until access
+        self.assertEqual(leaf.childs, [])
+        with self.assertRaises(AttributeError):
+            leaf.text = "a"                                     # node has slots
+
+    def test_parent_links(self):
+        for parent_links in (False, True):
+            parser = create_parser(RULES, lexer=create_lexer(self.CODE), parent_links=parent_links)
+            root = parser.parse()
+            self.assertIsNone(root.parent)
+            stack = list(root.childs)
+            while len(stack) > 0:
+                node = stack.pop()
+                stack.extend(node.childs)
+                if parent_links:
+                    self.assertIn(node, node.parent.childs)
+                else:
+                    self.assertIsNone(node.parent)
+
+    def test_span(self):
+        root = create_parser(RULES, lexer=create_lexer(self.CODE)).parse()
+        self.assertEqual(root.span, (0, len(self.CODE)))
+        self.assertEqual([child.span for child in root.childs], [(0, 1), (2, 3), (4, 10)])
+
+
+class TestColumnarTree(unittest.TestCase):
+    CODE = "a + 12 *\n  (b - 3)"
+
+    def test_spans(self):
+        lexer = create_lexer(self.CODE)
+        parser = create_parser(RULES, lexer=lexer)
+        tree = parser.parse_columnar()
+        self.assertEqual((tree.starts[tree.root], tree.ends[tree.root]), (0, len(self.CODE)))
+        leaves = [inode for inode in range(len(tree))
+                  if tree.is_leaf(inode) and tree.starts[inode] != -1]
+        self.assertEqual([self.CODE[tree.starts[inode]: tree.ends[inode]] for inode in leaves],
+                         ['a', '+', '12', '*', '(', 'b', '-', '3', ')'])
+        self.assertEqual([tree.position(inode, lexer) for inode in leaves[3:6]],
+                         [(1, 8), (2, 3), (2, 4)])
+        self.assertEqual(tree.position(tree.root, lexer), (1, 1))
+
+    def test_bytes(self):
+        tree = create_parser(RULES, lexer=create_lexer(self.CODE)).parse_columnar()
+        restored = ColumnarTree.from_bytes(tree.to_bytes())
+        self.assertEqual(restored.root, tree.root)
+        for field in ('kinds', 'token_kinds', 'token_values', 'firsts',
+                      'counts', 'childs', 'starts', 'ends'):
+            self.assertEqual(getattr(restored, field), getattr(tree, field))
+
+
+class TestParseEvents(unittest.TestCase):
+    CODE = "(a + 1) * b"
+
+    def test_events(self):
+        parser = create_parser(RULES, lexer=create_lexer(self.CODE))
+        lexemes = parser.lexer.lexemes
+        events = []
+        result = parser.parse_events(lambda token: events.append(lexemes[token.kind][token.value]),
+                                     lambda irule: events.append(irule))
+        self.assertIsNone(result)
+        expected = []                               # the same order of shifts and reductions
+        parser.parse_actions({irule: (lambda irule: lambda values: expected.append(irule))(irule)
+                              for irule in range(len(parser.rules))},
+                             lambda token: expected.append(lexemes[token.kind][token.value]))
+        self.assertEqual(events, expected)
+        self.assertEqual([event for event in events if isinstance(event, str)],
+                         ['(', 'a', '+', '1', ')', '*', 'b'])
+
+    def test_without_functions(self):
+        parser = create_parser(RULES, lexer=create_lexer(self.CODE))
+        self.assertIsNone(parser.parse_events())
+        parser.lexer = create_lexer("a + * b")
+        with self.assertRaises(ParseSyntaxError):
+            parser.parse_events()
+
+
+class TestParseActions(unittest.TestCase):
+    ACTIONS = {"E -> E '+' T": lambda values: values[0] + values[2],
+               "E -> E '-' T": lambda values: values[0] - values[2],
+               "T -> T '*' F": lambda values: values[0] * values[2],
+               "F -> '(' E ')'": lambda values: values[1]}
+
+    def calculate(self, code: str, actions = None):
+        parser = create_parser(RULES, lexer=create_lexer(code))
+        lexemes = parser.lexer.lexemes
+
+        def token_value(token):
+            lexeme = lexemes[token.kind][token.value]
+            return int(lexeme) if lexeme.isdigit() else lexeme
+
+        return parser.parse_actions(self.ACTIONS if actions is None else actions, token_value)
+
+    def test_calculate(self):
+        for code, value in (("2", 2), ("1 + 2 * 3", 7), ("(1 + 2) * 3", 9),
+                            ("10 - 2 - 3", 5), ("2 * (3 - 1) * 4", 16)):
+            self.assertEqual(self.calculate(code), value, code)
+
+    def test_actions_by_indices(self):
+        parser = create_parser(RULES, lexer=create_lexer("1 + 2"))
+        actions = {parser.rule_index(rule): action for rule, action in self.ACTIONS.items()}
+        self.assertEqual(self.calculate("1 + 2 * 3", actions), 7)
+
+    def test_token_values(self):
+        parser = create_parser(RULES, lexer=create_lexer("a"))
+        token = parser.parse_actions({})            # values of rules without actions
+        self.assertEqual(parser.lexer.lexemes[token.kind][token.value], 'a')
+
+    def test_unknown_rules(self):
+        parser = create_parser(RULES, lexer=create_lexer("1"))
+        for actions in ({"E -> E '*' T": None}, {"E E '+' T": None},
+                        {len(parser.rules): None}, {-1: None}, {1.0: None}):
+            with self.subTest(actions=actions):
+                with self.assertRaises(ValueError):
+                    parser.parse_actions(actions)
+
+
+class TestEmptyRules(unittest.TestCase):
+    RULES = [Rule('E', "'('", 'A', "')'"),
+             Rule('A', 'A', 'ID'),
+             Rule('A')]
+
+    def create_parser(self, code: str)-> SParser:
+        parser = SParser(tokens=('ID', 'NUM'), goal_nterm='E', end_term='⊥',
+                         rules=self.RULES, lexer=create_lexer(code))
+        parser.create_sparse_tab()
+        return parser
+
+    def test_parse_events(self):
+        self.assertEqual(reductions(self.create_parser("()")), ["A -> ", "E -> '(' A ')'"])
+        self.assertEqual(reductions(self.create_parser("(a b)")),
+                         ["A -> ", "A -> A ID", "A -> A ID", "E -> '(' A ')'"])
+
+    def test_parse(self):
+        for code in ("()", "(a)", "(a b)"):
+            parser = self.create_parser(code)
+            node = parser.parse()
+            self.assertEqual(parser.symbol(node.kind), 'E')
+            tree = parser.parse_columnar()
+            self.assertEqual(parser.symbol(tree.kinds[tree.root]), 'E')
+
+    def test_parse_actions(self):
+        actions = {"A -> ": lambda values: [],
+                   "A -> A ID": lambda values: values[0] + [values[1]],
+                   "E -> '(' A ')'": lambda values: values[1]}
+        parser = self.create_parser("(a b a)")
+        lexemes = parser.lexer.lexemes
+        value = parser.parse_actions(actions, lambda token: lexemes[token.kind][token.value])
+        self.assertEqual(value, ['a', 'b', 'a'])
+        parser = self.create_parser("()")                      # empty rule without action
+        self.assertIsNone(parser.parse_actions({"E -> '(' A ')'": lambda values: values[1]}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import os
+import tempfile
+import unittest
+from sparser.sparser import SParser, ReadingSTabFileErr
+from tests.test_sparser_parse import RULES, create_lexer, create_parser, reductions
+
+
+CODE = "a + 1 * (b - c)"
+
+
+class TestStabFile(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.parser = create_parser(RULES, lexer=create_lexer(CODE))
+        self.expected = reductions(self.parser)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def filename(self, name: str)-> str:
+        return os.path.join(self.tempdir.name, name)
+
+    def read_parser(self, filename: str, **kwargs)-> SParser:
+        parser = SParser(lexer=create_lexer(CODE))
+        parser.read_stab_from_file(filename, **kwargs)
+        return parser
+
+
+class TestMappedFile(TestStabFile):
+    def test_mapped(self):
+        filename = self.filename("tab.prstab")
+        self.parser.write_stab_to_file(filename)
+        parser = self.read_parser(filename)
+        content = parser._SParser__sparse_tab.content
+        self.assertIsInstance(content, memoryview)           # codes are used in place
+        self.assertTrue(content.readonly)
+        self.assertEqual(list(content), list(self.parser._SParser__sparse_tab.content))
+        self.assertEqual(reductions(parser), self.expected)
+
+    def test_copied(self):
+        filename = self.filename("tab.prstab")
+        self.parser.write_stab_to_file(filename)
+        parser = self.read_parser(filename, mapped=False)
+        self.assertEqual(parser._SParser__sparse_tab.content, self.parser._SParser__sparse_tab.content)
+        self.assertEqual(reductions(parser), self.expected)
+
+    def test_versions(self):
+        for version in range(2, SParser.FILE_FORMAT_VERSION + 1):
+            filename = self.filename(f"{version}.prstab")
+            self.parser.write_stab_to_file(filename, version=version)
+            for mapped in (True, False):
+                with self.subTest(version=version, mapped=mapped):
+                    self.assertEqual(reductions(self.read_parser(filename, mapped=mapped)),
+                                     self.expected)
+
+    def test_uncorrect_files(self):
+        filename = self.filename("tab.prstab")
+        self.parser.write_stab_to_file(filename)
+        with open(filename, 'rb') as file:
+            data = file.read()
+        keyword_size = len(data) - len(data.lstrip(b'PRSTAB').lstrip(b'\0'))
+        for name, content in (("truncated", data[: len(data) // 2]),
+                              ("version", data[:keyword_size] + b'\xff' * 4 + data[keyword_size + 4:])):
+            with self.subTest(name=name):
+                with open(self.filename(name), 'wb') as file:
+                    file.write(content)
+                with self.assertRaises(ReadingSTabFileErr):
+                    self.read_parser(self.filename(name))
+
+
+class TestPackedFile(TestStabFile):
+    """
+    File of version 1, i.e. cells packed one by one
+    """
+    def test_round_trip(self):
+        filename = self.filename("1.prstab")
+        self.parser.write_stab_to_file(filename, version=1)
+        with open(filename, 'rb') as file:
+            data = file.read()
+        self.assertTrue(data.startswith(SParser.FILE_KEYWORD_IN_START.encode()))
+        parser = self.read_parser(filename)
+        self.assertEqual(parser._SParser__sparse_tab.content, self.parser._SParser__sparse_tab.content)
+        self.assertEqual(reductions(parser), self.expected)
+        parser.write_stab_to_file(self.filename("2.prstab"), version=1)
+        with open(self.filename("2.prstab"), 'rb') as file:
+            self.assertEqual(file.read(), data)
+
+    def test_compressed(self):
+        filename = self.filename("1.prstab")
+        self.parser.write_stab_to_file(filename, compressed=True, version=1)
+        self.assertEqual(reductions(self.read_parser(filename)), self.expected)
+
+    def test_buffering(self):
+        filename = self.filename("1.prstab")
+        self.parser.write_stab_to_file(filename, buffering=0, version=1)
+        self.assertEqual(reductions(self.read_parser(filename, buffering=0)), self.expected)
+
+    def test_truncated(self):
+        filename = self.filename("1.prstab")
+        self.parser.write_stab_to_file(filename, version=1)
+        with open(filename, 'rb') as file:
+            data = file.read()
+        for size in (len(data) // 3, len(data) - 1):
+            with self.subTest(size=size):
+                with open(filename, 'wb') as file:
+                    file.write(data[:size])
+                with self.assertRaises(ReadingSTabFileErr):
+                    self.read_parser(filename)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from sparser.sparser import SParser
+from tests.test_sparser_parse import RULES
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# builds parsing tables and writes them to files in directory of argv[1]
+SCRIPT = """
+import os, sys
+from sparser.sparser import SParser
+import example_pascalabc_parser as pas_parser
+from tests.test_sparser_parse import RULES
+parser = SParser(tokens=('ID', 'NUM'), goal_nterm='E', end_term='⊥', parsing_of_rules=RULES)
+parser.create_sparse_tab()
+parser.write_stab_to_file(os.path.join(sys.argv[1], 'expr.prstab'))
+parser = SParser(tokens=pas_parser.TOKENS, goal_nterm=pas_parser.GOAL_NTERM,
+                 end_term=pas_parser.END_TERM, empty_term=pas_parser.EMPTY_TERM,
+                 parsing_of_rules=pas_parser.RULES)
+parser.create_sparse_tab(SParser.MODE_LALR1, compressed=True)
+parser.write_stab_to_file(os.path.join(sys.argv[1], 'pas.prstab'))
+print(parser.grammar_hash())
+"""
+
+
+class TestSymbolIds(unittest.TestCase):
+    def run_script(self, hash_seed: str, out_dir: str)-> str:
+        env = dict(os.environ, PYTHONHASHSEED=hash_seed)
+        result = subprocess.run([sys.executable, "-c", SCRIPT, out_dir], cwd=ROOT_DIR, env=env,
+                                stdout=subprocess.PIPE, check=True, universal_newlines=True)
+        return result.stdout
+
+    def test_hash_seeds(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            outputs = {}
+            for hash_seed in ("1", "2", "12345"):
+                out_dir = os.path.join(tempdir, hash_seed)
+                os.mkdir(out_dir)
+                outputs[hash_seed] = self.run_script(hash_seed, out_dir)
+            self.assertEqual(len(set(outputs.values())), 1)              # equal hashes of grammar
+            for name in ("expr.prstab", "pas.prstab"):
+                contents = set()
+                for hash_seed in outputs:
+                    with open(os.path.join(tempdir, hash_seed, name), 'rb') as file:
+                        contents.add(file.read())
+                self.assertEqual(len(contents), 1, name)
+
+    def test_dense_ids(self):
+        parser = SParser(tokens=('ID', 'NUM'), goal_nterm='E', end_term='⊥', parsing_of_rules=RULES)
+        parser.create_sparse_tab()
+        sids = sorted(parser.sid2symbol_tab())
+        self.assertEqual(sids, list(range(len(sids))))
+        terminals = [parser.sid(symbol) for symbol in ('ID', 'NUM', '⊥', "'+'", "'('")]
+        nterminals = [parser.sid(symbol) for symbol in ('E', 'T', 'F')]
+        self.assertLess(max(terminals), min(nterminals))          # terminals get first ids
+
+
+if __name__ == "__main__":
+    unittest.main()